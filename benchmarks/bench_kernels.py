@@ -0,0 +1,70 @@
+"""Benchmark vectorized compute kernels against row-wise ``DataFrame.apply``.
+
+Run with::
+
+    poetry run python -m benchmarks.bench_kernels
+"""
+
+import timeit
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from liquidity.compute import kernels
+
+YEARS = 20
+REPEAT = 5
+
+
+def make_history(years: int = YEARS) -> pd.DataFrame:
+    """Return synthetic daily history with prices, yields and TTM dividends."""
+    index = pd.date_range("2000-01-01", periods=365 * years, freq="D", name="Date")
+    rng = np.random.default_rng(seed=1)
+    return pd.DataFrame(
+        {
+            "CloseA": 100 + rng.random(len(index)).cumsum(),
+            "CloseB": 50 + rng.random(len(index)).cumsum(),
+            "YieldA": rng.random(len(index)) * 5,
+            "YieldB": rng.random(len(index)) * 3,
+            "TTM_Dividend": rng.random(len(index)) * 4,
+        },
+        index=index,
+    )
+
+
+def row_wise(df: pd.DataFrame) -> Dict[str, Callable[[], object]]:
+    return {
+        "ratio": lambda: df.apply(lambda row: row["CloseA"] / row["CloseB"], axis=1),
+        "spread": lambda: df.apply(lambda row: row["YieldA"] - row["YieldB"], axis=1),
+        "ttm_yield": lambda: df.apply(
+            lambda row: ((row["TTM_Dividend"] or 0.0) / row["CloseA"]) * 100.0, axis=1
+        ),
+    }
+
+
+def vectorized(df: pd.DataFrame) -> Dict[str, Callable[[], object]]:
+    return {
+        "ratio": lambda: kernels.ratio(df["CloseA"], df["CloseB"]),
+        "spread": lambda: kernels.spread(df["YieldA"], df["YieldB"]),
+        "ttm_yield": lambda: kernels.ttm_yield(df["TTM_Dividend"], df["CloseA"]),
+    }
+
+
+def best_of(fn: Callable[[], object], repeat: int = REPEAT) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main() -> None:
+    df = make_history()
+    print(f"{len(df)} rows ({YEARS} years of daily data), best of {REPEAT} runs")
+    print(f"{'kernel':<12}{'apply [ms]':>14}{'numpy [ms]':>14}{'speedup':>12}")
+
+    baseline, candidate = row_wise(df), vectorized(df)
+    for name in baseline:
+        slow, fast = best_of(baseline[name]), best_of(candidate[name])
+        print(f"{name:<12}{slow * 1e3:>14.2f}{fast * 1e3:>14.3f}{slow / fast:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark compact binary figure serialization against Plotly's default JSON.
+
+Run with::
+
+    poetry run python -m benchmarks.bench_serialize
+"""
+
+import timeit
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go  # type: ignore
+
+from liquidity.visuals import Chart
+from liquidity.visuals.serialize import JSON_ENGINE, figure_json
+
+YEARS = (1, 5, 20)
+REPEAT = 5
+
+
+def make_chart(years: int) -> Chart:
+    """Return chart of a synthetic daily ratio with two secondary series, at full resolution."""
+    index = pd.date_range("2000-01-01", periods=365 * years, freq="D", name="Date")
+    rng = np.random.default_rng(seed=1)
+    data = pd.DataFrame(
+        {
+            "Ratio": 1 + rng.random(len(index)).cumsum() / 100,
+            "CloseA": 100 + rng.random(len(index)).cumsum(),
+            "CloseB": 50 + rng.random(len(index)).cumsum(),
+        },
+        index=index,
+    )
+    return Chart(data, "Ratio", "Ratio", ["CloseA", "CloseB"], max_points=None)
+
+
+def encoders(fig: go.Figure) -> Dict[str, Callable[[], str]]:
+    return {
+        "default": lambda: fig.to_json(),
+        "compact": lambda: figure_json(fig),
+    }
+
+
+def best_of(fn: Callable[[], object], repeat: int = REPEAT) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main() -> None:
+    print(f"Chart with 3 daily series, best of {REPEAT} runs, compact encoder: {JSON_ENGINE}")
+    print(
+        f"{'years':<8}{'points':>8}{'default [ms]':>15}{'compact [ms]':>15}"
+        f"{'default [KB]':>15}{'compact [KB]':>15}{'size':>8}"
+    )
+
+    for years in YEARS:
+        fig = make_chart(years).generate_figure()
+        default, compact = encoders(fig).values()
+        slow, fast = best_of(default), best_of(compact)
+        size, compact_size = len(default()), len(compact())
+        print(
+            f"{years:<8}{365 * years * 3:>8}{slow * 1e3:>15.2f}{fast * 1e3:>15.2f}"
+            f"{size / 1024:>15.1f}{compact_size / 1024:>15.1f}{compact_size / size:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
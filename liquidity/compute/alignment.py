@@ -0,0 +1,125 @@
+from enum import Enum
+from functools import reduce
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from liquidity.compute.kernels import as_float_array
+from liquidity.compute.storage import DateLike
+
+
+class Calendar(str, Enum):
+    """Target calendars for aligning time series of different frequencies.
+
+    The first group of calendars is derived from the dates of the aligned
+    series, the second one is a fixed frequency calendar.
+    """
+
+    Union = "union"  # every date on which any of the series was observed
+    Intersection = "intersection"  # only dates on which all the series were observed
+    First = "first"  # dates of the first (primary) series
+    TradingDays = "B"  # Monday to Friday
+    CalendarDays = "D"  # every day, e.g. for crypto
+    Weekly = "W-FRI"  # weekly, on Fridays
+
+
+def target_index(
+    indexes: Sequence[pd.DatetimeIndex],
+    calendar: Calendar = Calendar.Union,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+) -> pd.DatetimeIndex:
+    """Return the sorted dates of the target calendar, within [start, end] range.
+
+    For the fixed frequency calendars the range defaults to the dates spanned
+    by the input series.
+    """
+    if calendar == Calendar.Union:
+        dates = pd.DatetimeIndex(np.unique(np.concatenate([i.to_numpy() for i in indexes])))
+    elif calendar == Calendar.Intersection:
+        dates = reduce(lambda left, right: left.intersection(right), indexes).unique()
+    elif calendar == Calendar.First:
+        dates = indexes[0].unique()
+    else:
+        first = min(i.min() for i in indexes if len(i))
+        last = max(i.max() for i in indexes if len(i))
+        dates = pd.date_range(start or first, end or last, freq=calendar.value)
+
+    dates = dates.sort_values()
+    if start is not None:
+        dates = dates[dates >= pd.Timestamp(start)]
+    if end is not None:
+        dates = dates[dates <= pd.Timestamp(end)]
+
+    dates.name = indexes[0].name if indexes else None
+    return dates
+
+
+def asof_positions(
+    source: pd.DatetimeIndex,
+    target: pd.DatetimeIndex,
+    max_staleness: Optional[pd.Timedelta] = None,
+) -> npt.NDArray[np.intp]:
+    """Return for each target date the position of the latest source date at or before it.
+
+    Both indexes have to be sorted. Dates without a preceding observation, or
+    with an observation older than `max_staleness`, get position -1.
+    """
+    source_dates = source.to_numpy()
+    target_dates = target.to_numpy()
+
+    positions = np.searchsorted(source_dates, target_dates, side="right") - 1
+    if max_staleness is not None:
+        age = target_dates - source_dates[np.maximum(positions, 0)]
+        positions[age > max_staleness.to_timedelta64()] = -1
+    return positions
+
+
+def align(
+    frames: Sequence[pd.DataFrame],
+    calendar: Calendar = Calendar.Union,
+    max_staleness: Optional[pd.Timedelta] = None,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+) -> pd.DataFrame:
+    """Align frames on a shared target calendar using backward as-of lookups.
+
+    Each value in the result is the latest observation of the series at or
+    before the target date (i.e. the `merge_asof` "backward" direction), which
+    is equivalent to forward-filling the series onto the target calendar. All
+    the frames are aligned in a single pass, without intermediate joins.
+
+    Args:
+        frames (Sequence[pd.DataFrame]): Frames with a DatetimeIndex, the column
+            names have to be unique across the frames. Rows with missing values
+            should be dropped beforehand, they are treated as observations.
+        calendar (Calendar): The target calendar, union of the frames dates by default.
+        max_staleness (pd.Timedelta, optional): Maximum age of the observation
+            carried forward. Older values are reported as missing (NaN).
+        start (datetime, optional): First date of the target calendar.
+        end (datetime, optional): Last date of the target calendar.
+
+    Returns:
+        pd.DataFrame: Frame indexed by the target calendar with columns of
+        all the input frames.
+
+    """
+    # Sorting is skipped for the (common) case of already sorted indexes
+    frames = [df if df.index.is_monotonic_increasing else df.sort_index() for df in frames]
+    index = target_index([pd.DatetimeIndex(df.index) for df in frames], calendar, start, end)
+
+    columns: Dict[str, Any] = {}
+    for df in frames:
+        positions = asof_positions(pd.DatetimeIndex(df.index), index, max_staleness)
+        missing = positions < 0
+        for column in df.columns:
+            if df.empty:
+                columns[column] = np.full(len(index), np.nan)
+                continue
+            values = as_float_array(df[column])[positions]
+            values[missing] = np.nan
+            columns[column] = values
+
+    return pd.DataFrame(columns, index=index)
@@ -1,21 +1,41 @@
 import functools
 import hashlib
 import os
-from datetime import datetime
+import shutil
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, Mapping, Sequence, Union
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Sequence, Set, Union
 
 import pandas as pd
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
-from liquidity.data.metadata.fields import Fields
+from liquidity.compute.fingerprint import combine_fingerprints
+from liquidity.compute.frames import (
+    META_FILE,
+    DateLike,
+    append_frame,
+    freeze,
+    read_frame,
+    select_columns,
+    select_dates,
+    write_frame,
+)
+from liquidity.compute.locks import KeyedLocks
+
+# Version of the computations of derived results, bump it when they change
+# so the results persisted by the previous versions are not used anymore.
+RESULTS_VERSION = "1"
+
+# Results not used for this long are removed from the result cache
+RESULTS_MAX_AGE = timedelta(days=30)
 
 
 class CacheConfig(BaseSettings):
     """Configuration settings for Alpha Vantage API."""
 
     enabled: bool = Field(default=True, alias="CACHE_ENABLED")
+    lean: bool = Field(default=False, alias="CACHE_LEAN")
     data_dir: Path = Field(
         default=Path.home() / ".liquidity" / "data",
         alias="CACHE_DATA_DIR",
@@ -30,37 +50,43 @@ class CacheConfig(BaseSettings):
 
 
 def generate_cache_key(
-    func: Callable[..., Any], args: Sequence[str], kwargs: Mapping[str, str]
+    func: Callable[..., Any], args: Sequence[object], kwargs: Mapping[str, object]
 ) -> str:
     """Generate a unique cache key based on function name and arguments."""
-    key = "-".join([func.__name__, *args, *kwargs])
+    arguments = [str(arg) for arg in args if arg is not None]
+    arguments += [f"{name}={value}" for name, value in kwargs.items() if value is not None]
+    key = "-".join([func.__name__, *arguments])
     return hashlib.blake2b(key.encode()).hexdigest()
 
 
 def cache_with_persistence(func: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
-    """Decorator that caches DataFrame results in‑memory and persists to CSV on disk."""
+    """Decorator that caches DataFrame results in‑memory and persists them on disk.
+
+    Results are stored in the columnar format of `write_frame`. The cached
+    frames are shared by the callers, they are frozen (see `freeze`).
+    """
     cache: Dict[str, pd.DataFrame] = {}
     cache_dir: Path = CacheConfig.cache_dir()
+    locks = KeyedLocks()
 
     @functools.wraps(func)
-    def wrapper(*args: str, **kwargs: str) -> pd.DataFrame:
+    def wrapper(*args: object, **kwargs: object) -> pd.DataFrame:
         key = generate_cache_key(func, args[1:], kwargs)
 
-        if key in cache:
-            return cache[key]
+        # Concurrent calls with the same arguments wait for a single call
+        with locks(key):
+            if key in cache:
+                return cache[key]
 
-        file_path = cache_dir / f"{key}.csv"
-        if file_path.exists():
-            df = pd.read_csv(
-                file_path, index_col=Fields.Date.value, parse_dates=[Fields.Date.value]
-            )
-            cache[key] = df
-            return cache[key]
+            path = cache_dir / key
+            if (path / META_FILE).exists():
+                cache[key] = freeze(read_frame(path))
+                return cache[key]
 
-        result = func(*args, **kwargs)
-        cache[key] = result
-        result.to_csv(file_path)
-        return result
+            result = freeze(func(*args, **kwargs))
+            cache[key] = result
+            write_frame(path, result)
+            return result
 
     return wrapper
 
@@ -85,22 +111,134 @@ class InMemoryCacheWithPersistence(Dict[str, pd.DataFrame]):
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
 
+    def _path(self, key: str) -> Path:
+        return Path(self.cache_dir) / key
+
     def __setitem__(self, key: str, value: pd.DataFrame) -> None:
         super().__setitem__(key, value)
-        value.to_csv(os.path.join(self.cache_dir, f"{key}.csv"))
+        write_frame(self._path(key), value)
+
+    def append(self, key: str, df: pd.DataFrame, rows: pd.DataFrame) -> None:
+        """Store `df`, the cached frame followed by the `rows`, writing only the rows to disk."""
+        super().__setitem__(key, df)
+        append_frame(self._path(key), rows)
 
     def __missing__(self, key: str) -> pd.DataFrame:
         """Load data from disk if not in memory yet."""
-        file_path = os.path.join(self.cache_dir, f"{key}.csv")
-        if not os.path.exists(file_path):
+        if not (self._path(key) / META_FILE).exists():
             raise KeyError(key)
 
-        idx_name = Fields.Date.value
-        df = pd.read_csv(file_path, index_col=idx_name, parse_dates=[idx_name])
+        df = freeze(read_frame(self._path(key)))
         super().__setitem__(key, df)
 
         return df
 
+    def stored_keys(self) -> Set[str]:
+        """Return keys of the data held in memory or on disk."""
+        on_disk = {meta.parent.name for meta in Path(self.cache_dir).glob(f"*/{META_FILE}")}
+        return on_disk | set(self.keys())
+
+    def discard(self, key: str) -> None:
+        """Remove the data from memory and from disk, if cached."""
+        self.pop(key, None)
+        shutil.rmtree(self._path(key), ignore_errors=True)
+
+    def read(
+        self,
+        key: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Return rows of the cached frame within [start, end] date range.
+
+        Frames not loaded in memory yet are read from disk partially: only the
+        requested rows and columns are read, and the frame is not kept in memory.
+
+        Raises:
+            KeyError: If there is no data cached under the key.
+
+        """
+        if super().__contains__(key):
+            return select_columns(select_dates(self[key], start, end), columns)
+
+        if not (self._path(key) / META_FILE).exists():
+            raise KeyError(key)
+        return read_frame(self._path(key), columns=columns, start=start, end=end)
+
+
+class ResultCache:
+    """Persistent cache of derived results, e.g. yields, spreads or the liquidity index.
+
+    Results are stored under a fingerprint of the computation (its graph node
+    key), of its inputs data and of the `version` of the computations, so a
+    result is reused (also by later processes) only as long as all of them
+    are unchanged. Unlike the raw data cache, results are not partitioned by
+    the date of the download. Only the latest result of each computation is
+    kept, and the results not used for `max_age` are removed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        version: str = RESULTS_VERSION,
+        max_age: timedelta = RESULTS_MAX_AGE,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.version = version
+        self.max_age = max_age
+        self._pruned = False
+
+    def key(self, name: Hashable, inputs: str) -> str:
+        """Return key of the result of computation `name` with inputs fingerprinted as `inputs`.
+
+        The results of a computation share a directory, so that storing one
+        replaces the others.
+        """
+        return f"{combine_fingerprints(repr(name))}/{combine_fingerprints(self.version, inputs)}"
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Return the stored result, None if there is none."""
+        path = self.cache_dir / key
+        try:
+            df = read_frame(path)
+        except FileNotFoundError:  # not stored, or replaced by another process
+            return None
+        (path / META_FILE).touch()  # used, kept for another `max_age`
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        """Store the result under the key, replacing the earlier results of the computation."""
+        path = self.cache_dir / key
+        write_frame(path, df)
+        for stale in path.parent.iterdir():
+            if stale != path:
+                shutil.rmtree(stale, ignore_errors=True)
+
+        if not self._pruned:
+            self._pruned = True
+            self.prune()
+
+    def prune(self) -> None:
+        """Remove the results not used for `max_age`, and those of the earlier layouts."""
+        expired = datetime.now().timestamp() - self.max_age.total_seconds()
+        for computation in self.cache_dir.iterdir():
+            if (
+                computation / META_FILE
+            ).exists():  # stored by key, before the per computation directories
+                shutil.rmtree(computation, ignore_errors=True)
+                continue
+            for meta in computation.glob(f"*/{META_FILE}"):
+                try:
+                    if meta.stat().st_mtime < expired:
+                        shutil.rmtree(meta.parent, ignore_errors=True)
+                except FileNotFoundError:  # replaced by another process
+                    continue
+            try:
+                computation.rmdir()  # only when no results are left
+            except OSError:
+                pass
+
 
 def get_cache() -> Union[InMemoryCacheWithPersistence, Dict[str, pd.DataFrame]]:
     """Return cache instance"""
@@ -108,3 +246,11 @@ def get_cache() -> Union[InMemoryCacheWithPersistence, Dict[str, pd.DataFrame]]:
     if cache_config.enabled:
         return InMemoryCacheWithPersistence(cache_config.data_dir)
     return {}
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """Return persistent cache of the derived results, None if caching is disabled."""
+    cache_config = CacheConfig()
+    if cache_config.enabled:
+        return ResultCache(cache_config.data_dir / "results")
+    return None
@@ -0,0 +1,24 @@
+import hashlib
+
+import pandas as pd
+
+
+def combine_fingerprints(*parts: str) -> str:
+    """Return fingerprint of the sequence of strings (e.g. other fingerprints)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def fingerprint(df: pd.DataFrame) -> str:
+    """Return fast content fingerprint of the dataframe.
+
+    The fingerprint covers the index, column names and values, so equal
+    fingerprints mean (with overwhelming probability) equal frames.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([str(c) for c in df.columns]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
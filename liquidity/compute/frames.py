@@ -0,0 +1,351 @@
+import json
+import os
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from liquidity.data.metadata.fields import OHLCV
+
+META_FILE = "_meta.json"
+INDEX_FILE = "_index.npy"
+
+# Prefix of the directories holding the arrays of each write of a frame
+DATA_DIR_PREFIX = "data-"
+
+# Attempts to read a frame replaced by another process while being read
+READ_ATTEMPTS = 3
+
+# Appends stored in separate data directories before the frame is rewritten as one
+MAX_APPENDED = 32
+
+DateLike = Union[str, datetime, pd.Timestamp]
+
+
+def _label(value: object) -> str:
+    """Return plain string label, unwrapping enum members (e.g. ``Fields.Date``)."""
+    return str(getattr(value, "value", value))
+
+
+def write_frame(path: Path, df: pd.DataFrame) -> None:
+    """Persist dataframe as a directory holding one ``.npy`` file per column.
+
+    The columnar layout allows readers to load only the columns they need,
+    and to memory-map the arrays so that a date range is read without
+    loading the whole history.
+
+    Every write stores the arrays in a new data directory next to the
+    metadata, which is then atomically replaced (``os.replace``) to point to
+    it, so readers in other processes see either the previous or the new
+    frame, never the columns of one with the index of the other.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    try:
+        previous = _data_dirs(path, _read_meta(path))
+    except FileNotFoundError:
+        previous = []
+
+    data_dir, files = _write_arrays(path, df)
+    _replace_meta(
+        path,
+        {
+            "index": _label(df.index.name) if df.index.name is not None else None,
+            "columns": files,
+            "sorted": bool(df.index.is_monotonic_increasing),
+            "data": data_dir,
+        },
+    )
+
+    # Readers that mapped the previous arrays keep reading them, new ones retry
+    for stale in previous:
+        if stale == path:
+            for array in path.glob("*.npy"):  # written in place by the earlier versions
+                array.unlink(missing_ok=True)
+        else:
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def append_frame(path: Path, df: pd.DataFrame) -> None:
+    """Append rows to the dataframe persisted with `write_frame`.
+
+    Only the rows are written, to a new data directory which is atomically
+    added to the metadata, so appending e.g. a day of prices does not rewrite
+    the whole history. After `MAX_APPENDED` appends (or when the columns do
+    not match) the frame is rewritten as one. Frames not stored yet are
+    written in full.
+    """
+    try:
+        meta = _read_meta(path)
+    except FileNotFoundError:
+        write_frame(path, df)
+        return
+
+    appended: List[str] = meta.get("appended", [])
+    labels = [_label(column) for column in df.columns]
+    if "data" not in meta or len(appended) >= MAX_APPENDED or labels != list(meta["columns"]):
+        write_frame(path, pd.concat([read_frame(path), df]))
+        return
+    if df.empty:
+        return
+
+    last_index = np.load(_data_dirs(path, meta)[-1] / INDEX_FILE, mmap_mode="r")
+    is_sorted = (
+        meta["sorted"]
+        and df.index.is_monotonic_increasing
+        and (not len(last_index) or df.index[0] > pd.Timestamp(last_index[-1]))
+    )
+    data_dir, _ = _write_arrays(path, df)
+    _replace_meta(path, {**meta, "sorted": bool(is_sorted), "appended": [*appended, data_dir]})
+
+
+def _write_arrays(path: Path, df: pd.DataFrame) -> Tuple[str, Dict[str, str]]:
+    """Write the index and columns of the frame into a new data directory.
+
+    Returns:
+        tuple: Name of the data directory and the array file of each column.
+
+    """
+    data_dir = f"{DATA_DIR_PREFIX}{uuid.uuid4().hex}"
+    (path / data_dir).mkdir()
+
+    files: Dict[str, str] = {}
+    for position, column in enumerate(df.columns):
+        values = df[column].to_numpy()
+        if values.dtype == object:
+            values = values.astype(np.float64)
+        files[_label(column)] = f"c{position}.npy"
+        np.save(path / data_dir / files[_label(column)], values)
+
+    np.save(path / data_dir / INDEX_FILE, df.index.to_numpy())
+    return data_dir, files
+
+
+def _read_meta(path: Path) -> Dict[str, Any]:
+    meta: Dict[str, Any] = json.loads((path / META_FILE).read_text())
+    return meta
+
+
+def _replace_meta(path: Path, meta: Dict[str, Any]) -> None:
+    """Atomically replace the metadata, a directory without it is an incomplete write."""
+    temporary = path / f".{uuid.uuid4().hex}.json"
+    temporary.write_text(json.dumps(meta))
+    os.replace(temporary, path / META_FILE)
+
+
+def _data_dirs(path: Path, meta: Dict[str, Any]) -> List[Path]:
+    """Return directories with the arrays of the frame, in the order of the rows.
+
+    Frames written by the earlier versions hold the arrays in the frame directory.
+    """
+    if "data" not in meta:
+        return [path]
+    return [path / meta["data"], *(path / data_dir for data_dir in meta.get("appended", []))]
+
+
+def read_frame(
+    path: Path,
+    columns: Optional[Sequence[str]] = None,
+    start: Optional[DateLike] = None,
+    end: Optional[DateLike] = None,
+) -> pd.DataFrame:
+    """Load dataframe persisted with `write_frame`.
+
+    Args:
+        path (Path): Directory holding the frame.
+        columns (Sequence[str], optional): Columns to load, all by default.
+        start (datetime, optional): First date to include.
+        end (datetime, optional): Last date to include (inclusive).
+
+    Raises:
+        FileNotFoundError: If there is no (complete) frame stored at the path.
+
+    """
+    attempt = 1
+    while True:
+        try:
+            return _read_frame(path, columns, start, end)
+        except FileNotFoundError:
+            # Replaced (and its arrays removed) between reading the metadata and the arrays
+            if attempt >= READ_ATTEMPTS or not (path / META_FILE).exists():
+                raise
+            attempt += 1
+
+
+def _read_frame(
+    path: Path,
+    columns: Optional[Sequence[str]],
+    start: Optional[DateLike],
+    end: Optional[DateLike],
+) -> pd.DataFrame:
+    meta = _read_meta(path)
+    files: Dict[str, str] = meta["columns"]
+    selected = list(files) if columns is None else [_label(c) for c in columns]
+
+    indexes: List[np.ndarray[Any, Any]] = []
+    data: Dict[str, List[np.ndarray[Any, Any]]] = {column: [] for column in selected}
+    for data_dir in _data_dirs(path, meta):
+        index = np.load(data_dir / INDEX_FILE, mmap_mode="r")
+        rows = _select_rows(index, start, end, is_sorted=meta["sorted"])
+        indexes.append(np.array(index[rows]))
+        for column in selected:
+            data[column].append(np.array(np.load(data_dir / files[column], mmap_mode="r")[rows]))
+
+    return pd.DataFrame(
+        {column: _concatenate(arrays) for column, arrays in data.items()},
+        index=pd.Index(_concatenate(indexes), name=meta["index"]),
+        columns=selected,
+    )
+
+
+def _concatenate(arrays: List[np.ndarray[Any, Any]]) -> np.ndarray[Any, Any]:
+    """Return the arrays of the appended parts joined, the only one without copying it."""
+    return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+
+def _select_rows(
+    index: np.ndarray[Any, Any],
+    start: Optional[DateLike],
+    end: Optional[DateLike],
+    is_sorted: bool,
+) -> Union[slice, np.ndarray[Any, Any]]:
+    """Return positions of the rows within [start, end] date range."""
+    if start is None and end is None:
+        return slice(None)
+
+    lower = np.datetime64(pd.Timestamp(start or pd.Timestamp.min), "ns")
+    upper = np.datetime64(pd.Timestamp(end or pd.Timestamp.max), "ns")
+
+    if is_sorted:
+        # Binary search on the memory-mapped index, only the slice is read.
+        first = int(np.searchsorted(index, lower, side="left"))
+        last = int(np.searchsorted(index, upper, side="right"))
+        return slice(first, last)
+
+    return np.flatnonzero((index >= lower) & (index <= upper))
+
+
+def count_before(index: "pd.Index[Any]", date: DateLike, inclusive: bool = False) -> int:
+    """Return number of dates of the sorted index before the date (or at it, if inclusive).
+
+    Uses binary search, so e.g. new rows appended after a date are located
+    without scanning the whole history.
+    """
+    value = np.datetime64(pd.Timestamp(date), "ns")
+    return int(np.searchsorted(index.to_numpy(), value, side="right" if inclusive else "left"))
+
+
+def from_last_before(df: pd.DataFrame, date: DateLike) -> pd.DataFrame:
+    """Return rows of the sorted frame from the last one before the date onwards.
+
+    The last earlier row is the observation carried forward to the date by
+    as-of alignment, e.g. when only the rows since the date are realigned.
+    """
+    return df.iloc[max(count_before(df.index, date) - 1, 0) :]
+
+
+def select_dates(
+    df: pd.DataFrame, start: Optional[DateLike] = None, end: Optional[DateLike] = None
+) -> pd.DataFrame:
+    """Return rows of the in-memory frame within [start, end] date range."""
+    if start is None and end is None:
+        return df
+    rows = _select_rows(df.index.to_numpy(), start, end, is_sorted=df.index.is_monotonic_increasing)
+    return df.iloc[rows]
+
+
+def select_columns(df: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+    """Return the columns of the in-memory frame, all of them by default."""
+    if columns is None:
+        return df
+    return df[[_label(column) for column in columns]]
+
+
+def freeze(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+    """Return copy of the frame whose values cannot be modified in place.
+
+    Frames shared between threads (e.g. cached ones) are frozen so that no
+    consumer can modify them for the others, in-place writes such as
+    ``df.iloc[0, 0] = 1`` or ``df["Close"] *= 2`` raise ValueError, derived
+    frames (e.g. ``df * 2`` or ``df.copy()``) are writable as usual.
+
+    Frames not referenced elsewhere (e.g. just concatenated) can be frozen
+    without the copy, their own arrays are made read-only.
+    """
+    columns: Dict[int, object] = {}
+    for position in range(len(df.columns)):
+        series = df.iloc[:, position]
+        if not isinstance(series.dtype, np.dtype):
+            columns[position] = series.copy()  # extension arrays, e.g. with timezones
+            continue
+        values = series.to_numpy(copy=copy)
+        values.flags.writeable = False
+        columns[position] = values
+
+    frozen = pd.DataFrame(columns, index=df.index, copy=False)
+    frozen.columns = df.columns
+    return frozen
+
+
+# Significant digits of the values (e.g. quoted prices) preserved by the float32
+# columns of compact frames, e.g. 123.45, 12345.67 or 0.001234
+FLOAT32_DIGITS = 7
+
+# Columns holding integral values, compacted to the smallest integer type
+INTEGER_COLUMNS = frozenset({OHLCV.Volume.value})
+
+
+def compact(df: pd.DataFrame, digits: int = FLOAT32_DIGITS) -> pd.DataFrame:
+    """Return the frame with its columns stored in the smallest sufficient dtypes.
+
+    Float columns are stored as float32 when all their values have at most
+    `digits` significant digits, which float32 preserves (e.g. quoted prices
+    of any magnitude, unlike computed yields), and integral columns (e.g.
+    volume) without missing values as the smallest integer type. Other
+    columns are kept as is.
+
+    The float32 values are not rounded back when read, computations use the
+    nearest float32 value (e.g. 123.44999695 for 123.45), so lean results
+    differ from the full precision ones by a relative error below 1e-7.
+    """
+    columns: Dict[int, object] = {}
+    for position, column in enumerate(df.columns):
+        series = df.iloc[:, position]
+        columns[position] = series
+        if series.dtype != np.float64:
+            continue
+
+        values = series.to_numpy()
+        if _label(column) in INTEGER_COLUMNS and np.all(np.mod(values, 1) == 0):
+            columns[position] = pd.to_numeric(series, downcast="integer")
+            continue
+
+        lean = values.astype(np.float32)
+        restored = _round_significant(lean.astype(np.float64), digits)
+        if np.array_equal(restored, values, equal_nan=True):
+            columns[position] = pd.Series(lean, index=df.index, copy=False)
+
+    lean_df = pd.DataFrame(columns, index=df.index, copy=False)
+    lean_df.columns = df.columns
+    return lean_df
+
+
+def _round_significant(values: npt.NDArray[np.float64], digits: int) -> npt.NDArray[np.float64]:
+    """Return the values rounded to the number of significant digits."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        magnitude = np.floor(np.log10(np.abs(values)))
+    exponent = digits - 1 - np.where(np.isfinite(magnitude), magnitude, 0)
+
+    # Scaled by exact powers of ten, dividing by 10**-n would not be exact
+    up, down = 10.0 ** np.maximum(exponent, 0), 10.0 ** np.maximum(-exponent, 0)
+    rounded: npt.NDArray[np.float64] = np.round(values * up / down) * down / up
+    return rounded
+
+
+def frame_bytes(df: pd.DataFrame) -> int:
+    """Return number of bytes held by the frame, including its index."""
+    return int(df.memory_usage(index=True, deep=True).sum())
@@ -0,0 +1,161 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from liquidity.compute.alignment import asof_positions
+from liquidity.compute.graph import Graph, default_graph, fred_node
+from liquidity.compute.kernels import FloatArray, as_float_array
+from liquidity.compute.storage import DateLike
+from liquidity.data.providers.fred import FredEconomicDataProvider
+
+# FRED exchange rates against USD: (ticker, whether quoted as USD per unit of the currency)
+USD_EXCHANGE_RATES: Dict[str, Tuple[str, bool]] = {
+    "EUR": ("DEXUSEU", True),  # U.S. Dollars to One Euro
+    "GBP": ("DEXUSUK", True),  # U.S. Dollars to One British Pound
+    "JPY": ("DEXJPUS", False),  # Japanese Yen to One U.S. Dollar
+    "CNY": ("DEXCHUS", False),  # Chinese Yuan Renminbi to One U.S. Dollar
+}
+
+# FX rates are published on business days only, this covers long holiday weekends
+DEFAULT_FX_STALENESS = pd.Timedelta(days=5)
+
+
+class FxService:
+    """Converts values between currencies using daily FRED exchange rates.
+
+    Only the USD exchange rates are fetched, every other pair is triangulated
+    through USD, e.g. EUR/JPY = (USD per EUR) / (USD per JPY). Each FRED
+    series is loaded once per graph and only when a conversion requires it.
+    Rates are carried forward over holidays, for at most `max_staleness`,
+    values without a recent enough rate are converted to NaN. When `start` is
+    given, only the rates since then are fetched.
+
+    Examples
+    --------
+    >>> fx = FxService()
+    >>> fx.convert(balance_sheets, currencies=["EUR", "JPY"], to="USD")
+    >>> fx.cross_rates()  # latest rates between all the supported currencies
+
+    """
+
+    def __init__(
+        self,
+        provider: Optional[FredEconomicDataProvider] = None,
+        graph: Optional[Graph] = None,
+        max_staleness: Optional[pd.Timedelta] = DEFAULT_FX_STALENESS,
+        start: Optional[datetime] = None,
+    ) -> None:
+        self.provider = provider or FredEconomicDataProvider()
+        self.graph = graph or default_graph()
+        self.max_staleness = max_staleness
+        self.start = start
+
+    @staticmethod
+    def currencies() -> List[str]:
+        """Return all the supported currencies."""
+        return ["USD", *USD_EXCHANGE_RATES]
+
+    @staticmethod
+    def tickers(currencies: Iterable[str]) -> List[str]:
+        """Return FRED tickers of the exchange rates required to convert the currencies."""
+        tickers = []
+        for currency in dict.fromkeys(currencies):
+            if currency == "USD":
+                continue
+            if currency not in USD_EXCHANGE_RATES:
+                raise ValueError(f"Currency conversion of {currency} not supported")
+            tickers.append(USD_EXCHANGE_RATES[currency][0])
+        return tickers
+
+    def usd_rates(self, currencies: Iterable[str]) -> Dict[str, "pd.Series[float]"]:
+        """Return observed values of a unit of each currency in USD, by currency.
+
+        The exchange rates series are fetched concurrently, in a single batch.
+        """
+        currencies = [c for c in dict.fromkeys(currencies) if c != "USD"]
+        nodes = [
+            fred_node(self.provider, ticker, self.start) for ticker in self.tickers(currencies)
+        ]
+
+        rates = {}
+        for currency, df in zip(currencies, self.graph.evaluate(*nodes)):
+            quotes = df["Close"].dropna().sort_index()
+            usd_quoted = USD_EXCHANGE_RATES[currency][1]
+            rates[currency] = quotes if usd_quoted else 1 / quotes
+        return rates
+
+    def rates(
+        self, index: pd.DatetimeIndex, currencies: Sequence[str], to: str = "USD"
+    ) -> FloatArray:
+        """Return (dates x currencies) array of the values of a unit of each currency in `to`.
+
+        Each date uses the latest rates at or before it, dates without a
+        recent enough rate get NaN.
+        """
+        usd = self.usd_rates([*currencies, to])
+
+        def usd_values(currency: str) -> FloatArray:
+            if currency == "USD":
+                return np.ones(len(index))
+            series = usd[currency]
+            if series.empty:
+                return np.full(len(index), np.nan)
+            positions = asof_positions(pd.DatetimeIndex(series.index), index, self.max_staleness)
+            values = as_float_array(series)[positions]
+            values[positions < 0] = np.nan
+            return values
+
+        if not currencies:
+            return np.empty((len(index), 0))
+        units = np.column_stack([usd_values(currency) for currency in currencies])
+        return units / usd_values(to)[:, np.newaxis]
+
+    def convert(
+        self,
+        df: pd.DataFrame,
+        currencies: Union[str, Sequence[str]],
+        to: str = "USD",
+    ) -> pd.DataFrame:
+        """Convert all the columns of the dataframe in one step.
+
+        Args:
+            df (pd.DataFrame): Values indexed by date.
+            currencies (str or Sequence[str]): Currency of each column, or a
+                single currency of all of them.
+            to (str): Target currency.
+
+        Returns:
+            pd.DataFrame: Converted values, NaN where no recent rate was available.
+
+        """
+        if isinstance(currencies, str):
+            currencies = [currencies] * len(df.columns)
+        if len(currencies) != len(df.columns):
+            raise ValueError("A currency has to be given for each column")
+
+        index = pd.DatetimeIndex(df.index)
+        values = as_float_array(df.to_numpy()) * self.rates(index, currencies, to)
+        return pd.DataFrame(values, index=df.index, columns=df.columns)
+
+    def cross_rates(
+        self,
+        date: Optional[DateLike] = None,
+        currencies: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Return matrix of exchange rates between the currencies on the date.
+
+        The value in row A and column B is the price of a unit of A in B. By
+        default, the rates are for the latest date on which all the rates are
+        known, for all the supported currencies.
+        """
+        currencies = list(currencies or self.currencies())
+        if date is None:
+            usd = self.usd_rates(currencies)
+            date = min((s.index[-1] for s in usd.values() if len(s)), default=pd.Timestamp.now())
+
+        units = self.rates(pd.DatetimeIndex([date]), currencies)[0]
+        return pd.DataFrame(
+            units[:, np.newaxis] / units[np.newaxis, :], index=currencies, columns=currencies
+        )
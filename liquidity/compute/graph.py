@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import partial
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
+
+import pandas as pd
+
+from liquidity.compute.cache import ResultCache, get_result_cache
+from liquidity.compute.fingerprint import combine_fingerprints, fingerprint
+from liquidity.compute.frames import freeze, select_columns, select_dates
+from liquidity.compute.locks import KeyedLocks, ResourceLimiter
+from liquidity.compute.ticker import DIVIDEND_LOOKBACK, Ticker
+from liquidity.compute.utils.yields import compute_dividend_yield
+from liquidity.data.metadata.fields import OHLCV, Fields
+from liquidity.data.providers.fred import FredEconomicDataProvider
+
+NodeKey = Tuple[Hashable, ...]
+
+# Seconds between the attempts to start nodes waiting for a resource in use
+# by other evaluations (or for its rate limit)
+RESOURCE_POLL_INTERVAL = 0.05
+
+
+@dataclass(frozen=True)
+class Resource:
+    """Shared resource with limited concurrency, e.g. a pool of connections.
+
+    The limits are shared by all the graphs (and threads) of the process,
+    see `resource_limiter`. The APIs of the data providers are limited by
+    the tickers and providers themselves, only when requested (see
+    `provider_limiter`), so data served from the caches is never throttled.
+    """
+
+    name: str
+    max_concurrency: int
+    max_calls_per_minute: Optional[int] = None
+
+
+_LIMITERS: Dict[Resource, ResourceLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def resource_limiter(resource: Resource) -> ResourceLimiter:
+    """Return the limiter of the resource, one per process."""
+    with _LIMITERS_LOCK:
+        if resource not in _LIMITERS:
+            _LIMITERS[resource] = ResourceLimiter(
+                resource.max_concurrency, resource.max_calls_per_minute
+            )
+        return _LIMITERS[resource]
+
+
+@dataclass(frozen=True, eq=False)
+class Node:
+    """A single step of a computation, e.g. fetching prices or computing a spread.
+
+    Nodes are identified by their key: two nodes with equal keys are assumed
+    to compute the same data, so they are evaluated only once per graph.
+
+    Attributes:
+        key (tuple): Unique identifier of the computed data.
+        fn (Callable): Computes the node's data, called with the results of
+            the dependencies as positional arguments.
+        deps (tuple): Nodes whose results are required to compute this one.
+        resource (Resource, optional): Resource used by the computation, at most
+            `resource.max_concurrency` nodes using it are evaluated at once.
+        persist (bool): Whether the result is stored in the graph's persistent
+            result cache. Meant for derived results with a key stable across
+            processes, which are costly to recompute.
+
+    """
+
+    key: NodeKey
+    fn: Callable[..., pd.DataFrame]
+    deps: Tuple[Node, ...] = ()
+    resource: Optional[Resource] = None
+    persist: bool = False
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Node) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+
+@dataclass
+class _Result:
+    inputs: str  # fingerprint of the dependencies results
+    output: str  # fingerprint of the node result
+    data: pd.DataFrame = field(repr=False)
+    updated: bool = False  # stored with `put` instead of computed from the inputs
+
+
+class Graph:
+    """Lazily evaluated, memoized dependency graph of computations.
+
+    Results are memoized per node key together with fingerprints of the node's
+    inputs. A node is recomputed only when the results of its dependencies
+    changed, e.g. after the source data was refreshed with `invalidate`.
+    Nodes without dependencies (data sources) are computed once per graph.
+
+    Results are frozen (see `freeze`), as they are shared by all the models
+    using the graph, which may be evaluated from many threads at once.
+
+    Independent branches of the graph are evaluated in parallel in a bounded
+    thread pool, which mostly helps with the I/O bound data fetches. Nodes
+    using a limited resource are not started while the resource is at its
+    limits, which are shared by all the evaluations in the process, they wait
+    for their turn without occupying the pool workers.
+
+    With a `results` cache, the persistent nodes' results are stored on disk
+    by the fingerprint of their inputs, so the next processes load them
+    instead of recomputing, as long as the inputs are unchanged.
+
+    Examples
+    --------
+    >>> graph = Graph()
+    >>> spreads = [YieldSpread("HYG", "LQD", graph=graph), YieldSpread("LQD", graph=graph)]
+    >>> graph.evaluate(*[spread.node() for spread in spreads])  # LQD yields computed once
+
+    """
+
+    def __init__(self, max_workers: int = 8, results: Optional[ResultCache] = None) -> None:
+        self.max_workers = max_workers
+        self.results = results
+        self._results: Dict[NodeKey, _Result] = {}
+        self._lock = threading.Lock()
+        self._node_locks = KeyedLocks()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._results
+
+    def fingerprint(self, key: NodeKey) -> str:
+        """Return fingerprint of the node's memoized result."""
+        return self._results[key].output
+
+    def invalidate(self, key: NodeKey) -> None:
+        """Drop memoized result of the node, it is recomputed on the next evaluation.
+
+        Dependent nodes are recomputed only if the new result differs.
+        """
+        with self._lock:
+            self._results.pop(key, None)
+
+    def invalidate_all(self, node: Node) -> None:
+        """Drop memoized results of the node and all its dependencies."""
+        for key in self._collect((node,)):
+            self.invalidate(key)
+
+    def put(self, node: Node, data: pd.DataFrame) -> None:
+        """Memoize the data as the node's result for the current results of its dependencies.
+
+        Used to store results updated incrementally, e.g. with appended rows,
+        so they are not recomputed by the next evaluation. Dependencies have
+        to be evaluated (or put) first.
+
+        Persistent nodes are stored for the next processes only when all their
+        dependencies were put as well: otherwise the data (e.g. dividend yields
+        with rows appended from newer prices) is not computed from the inputs
+        it would be stored under.
+        """
+        data = freeze(data)
+        with self._lock:
+            deps = [self._results[dep.key] for dep in node.deps]
+            inputs = combine_fingerprints(*(dep.output for dep in deps))
+            self._results[node.key] = _Result(
+                inputs=inputs, output=fingerprint(data), data=data, updated=True
+            )
+
+        if self.results is not None and node.persist and all(dep.updated for dep in deps):
+            self.results.put(self.results.key(node.key, inputs), data)
+
+    def evaluate(self, *targets: Node) -> List[pd.DataFrame]:
+        """Evaluate the target nodes along with all their dependencies.
+
+        Returns:
+            List[pd.DataFrame]: Results of the targets, in the given order.
+
+        """
+        nodes = self._collect(targets)
+        if self._memoized(nodes):
+            return [self._results[target.key].data for target in targets]
+
+        waiting = {key: {dep.key for dep in node.deps} for key, node in nodes.items()}
+        done: set[NodeKey] = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            running: Dict[Future[None], NodeKey] = {}
+
+            while waiting or running:
+                blocked = False
+                for key in [key for key, deps in waiting.items() if deps <= done]:
+                    resource = nodes[key].resource
+                    limiter = resource_limiter(resource) if resource is not None else None
+                    if limiter is not None and not limiter.acquire(blocking=False):
+                        blocked = True
+                        continue
+
+                    del waiting[key]
+                    future = pool.submit(self._evaluate_node, nodes[key])
+                    if limiter is not None:
+                        # Released even when the evaluation fails, the limiter outlives it
+                        future.add_done_callback(partial(_release, limiter))
+                    running[future] = key
+
+                if not running:
+                    if not blocked:
+                        raise ValueError(f"Dependency cycle between nodes: {list(waiting)}")
+                    time.sleep(RESOURCE_POLL_INTERVAL)
+                    continue
+
+                finished, _ = wait(
+                    running,
+                    timeout=RESOURCE_POLL_INTERVAL if blocked else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in finished:
+                    future.result()  # re-raise errors of the node computation
+                    done.add(running.pop(future))
+
+        return [self._results[target.key].data for target in targets]
+
+    def _memoized(self, nodes: Dict[NodeKey, Node]) -> bool:
+        """Return whether the results of all the nodes are memoized and up to date.
+
+        Lets repeated evaluations (e.g. of `.df`) return without starting a pool.
+        """
+        with self._lock:
+            results = {key: self._results.get(key) for key in nodes}
+        for key, node in nodes.items():
+            result = results[key]
+            if result is None:
+                return False
+            deps = [results[dep.key] for dep in node.deps]
+            if any(dep is None for dep in deps):
+                return False
+            if result.inputs != combine_fingerprints(*(dep.output for dep in deps if dep)):
+                return False
+        return True
+
+    def _collect(self, targets: Tuple[Node, ...]) -> Dict[NodeKey, Node]:
+        """Return all the nodes required to evaluate the targets, by key."""
+        nodes: Dict[NodeKey, Node] = {}
+        stack = list(targets)
+        while stack:
+            node = stack.pop()
+            if node.key not in nodes:
+                nodes[node.key] = node
+                stack.extend(node.deps)
+        return nodes
+
+    def _evaluate_node(self, node: Node) -> None:
+        # Threads evaluating the same node (e.g. concurrent requests) wait for a single computation
+        with self._node_locks(node.key):
+            with self._lock:
+                deps = [self._results[dep.key] for dep in node.deps]
+                memoized = self._results.get(node.key)
+
+            inputs = combine_fingerprints(*(dep.output for dep in deps))
+            if memoized is not None and memoized.inputs == inputs:
+                return
+
+            data = freeze(self._compute(node, inputs, [dep.data for dep in deps]))
+            result = _Result(inputs=inputs, output=fingerprint(data), data=data)
+            with self._lock:
+                self._results[node.key] = result
+
+    def _compute(self, node: Node, inputs: str, deps: List[pd.DataFrame]) -> pd.DataFrame:
+        """Compute the node's data, or load it from the persistent result cache."""
+        if self.results is None or not node.persist:
+            return node.fn(*deps)
+
+        key = self.results.key(node.key, inputs)
+        data = self.results.get(key)
+        if data is None:
+            data = node.fn(*deps)
+            self.results.put(key, data)
+        return data
+
+
+def _release(limiter: ResourceLimiter, future: Future[None]) -> None:
+    limiter.release()
+
+
+def default_graph() -> Graph:
+    """Return new graph persisting the derived results in the configured cache."""
+    return Graph(results=get_result_cache())
+
+
+@runtime_checkable
+class GraphModel(Protocol):
+    """Model evaluated as a node of a (possibly shared) dependency graph."""
+
+    graph: Graph
+    start_date: Optional[datetime]
+    end_date: Optional[datetime]
+
+    def node(self) -> Node:
+        """Return the node computing the model's data."""
+        ...
+
+
+def ticker_node(
+    ticker: Ticker,
+    data_type: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Node:
+    """Return node with the ticker's data, one of "prices", "dividends" or "yields".
+
+    Fetched data is read through the ticker (and its cache), the requests to
+    the provider on cache misses are limited by the ticker. When a date range
+    is given, only the range is requested from the cache and the provider, and only
+    the `columns` (all by default) are read. Dividend yields are computed
+    from the close price and TTM dividend nodes, so the prices are shared
+    with e.g. the price ratios of the same symbol.
+    """
+    key = (ticker.symbol, data_type, start, end, tuple(columns) if columns is not None else None)
+    if data_type == "yields" and not ticker.metadata.is_treasury_yield:
+        # TTM dividends known before the start date are carried forward to it
+        lookback = start - DIVIDEND_LOOKBACK if start is not None else None
+        deps = (
+            ticker_node(ticker, "prices", lookback, end, [OHLCV.Close]),
+            ticker_node(ticker, "dividends", lookback, end, [Fields.TTM_Dividend]),
+        )
+        return Node(
+            key=key,
+            fn=lambda prices, dividends: select_dates(
+                compute_dividend_yield(prices, dividends), start
+            ),
+            deps=deps,
+            persist=True,
+        )
+
+    def fetch() -> pd.DataFrame:
+        if start is None and end is None:
+            df: pd.DataFrame = select_columns(getattr(ticker, data_type), columns)
+        elif columns is None:
+            df = getattr(ticker, f"get_{data_type}")(start, end)
+        else:
+            df = getattr(ticker, f"get_{data_type}")(start, end, columns=columns)
+        return df
+
+    return Node(key=key, fn=fetch)
+
+
+def fred_node(
+    provider: FredEconomicDataProvider, ticker: str, start: Optional[datetime] = None
+) -> Node:
+    """Return node with the FRED series (since `start`), shared by all the models using it."""
+    fetch = (
+        partial(provider.get_data, ticker, start=start)
+        if start
+        else partial(provider.get_data, ticker)
+    )
+    return Node(key=("fred", ticker, start), fn=fetch)
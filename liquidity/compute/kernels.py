@@ -0,0 +1,63 @@
+from typing import Any, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+
+
+def as_float_array(values: npt.ArrayLike, none_as: Optional[float] = None) -> FloatArray:
+    """Return values as a float64 array.
+
+    Args:
+        values (ArrayLike): Input values, e.g. a pandas Series or numpy array.
+        none_as (float, optional): Value substituted for ``None`` entries. When
+            not provided, ``None`` entries raise TypeError, the same way
+            arithmetic on ``None`` does.
+
+    """
+    array: npt.NDArray[Any] = np.asarray(values)
+    if array.dtype == object:
+        # Object arrays are the slow path, numeric inputs skip the check entirely
+        missing = np.array([value is None for value in array.flat], dtype=bool)
+        missing = missing.reshape(array.shape)
+        if missing.any():
+            if none_as is None:
+                raise TypeError("unsupported operand type: NoneType")
+            array = np.where(missing, none_as, array)
+    return array.astype(np.float64, copy=False)
+
+
+def ratio(numerator: npt.ArrayLike, denominator: npt.ArrayLike) -> FloatArray:
+    """Return element-wise ratio of two price series."""
+    return np.divide(as_float_array(numerator), as_float_array(denominator))
+
+
+def spread(values: npt.ArrayLike, benchmark: npt.ArrayLike) -> FloatArray:
+    """Return element-wise difference of two yield series, in percentage points."""
+    return np.subtract(as_float_array(values), as_float_array(benchmark))
+
+
+def ttm_yield(ttm_dividend: npt.ArrayLike, close: npt.ArrayLike) -> FloatArray:
+    """Return trailing twelve months dividend yield in percent.
+
+    Missing dividends (``None``) are treated as no dividend paid, which mirrors
+    ``(dividend or 0.0) / close``; ``NaN`` dividends propagate to the result.
+    """
+    dividend = as_float_array(ttm_dividend, none_as=0.0)
+    return np.multiply(np.divide(dividend, as_float_array(close)), 100.0)
+
+
+def ffill(values: npt.ArrayLike) -> FloatArray:
+    """Return values with NaNs replaced by the last valid value along the first axis.
+
+    Works for 1-D series and for 2-D (dates x symbols) arrays, where each
+    column is filled independently. Leading NaNs are left as they are.
+    """
+    array = as_float_array(values)
+    rows = np.arange(len(array)).reshape((-1,) + (1,) * (array.ndim - 1))
+    positions = np.where(np.isnan(array), 0, rows)
+    np.maximum.accumulate(positions, axis=0, out=positions)
+    if array.ndim == 1:
+        return array[positions]
+    return np.take_along_axis(array, positions, axis=0)
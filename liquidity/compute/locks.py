@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import deque
+from types import TracebackType
+from typing import Deque, Dict, Hashable, Optional, Tuple, Type
+
+# Concurrent requests allowed for providers not declaring their own limit
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class KeyedLocks:
+    """Locks created on demand, one per key (e.g. a cache key).
+
+    Allows computing different keys concurrently, while the computations of
+    the same key are serialized, e.g. so that the data is fetched only once
+    when many threads request it at the same time. The locks are reentrant.
+
+    Examples
+    --------
+    >>> locks = KeyedLocks()
+    >>> with locks("SPY-prices"):
+    ...     ...
+
+    """
+
+    def __init__(self) -> None:
+        self._locks: Dict[Hashable, threading.RLock] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, key: Hashable) -> threading.RLock:
+        with self._lock:
+            if key not in self._locks:
+                self._locks[key] = threading.RLock()
+            return self._locks[key]
+
+
+class ResourceLimiter:
+    """Limits the concurrent (and optionally the per period) use of a shared resource.
+
+    Meant for the APIs of the data providers: a single limiter per provider
+    is shared by all the threads of the process, so the limits hold across
+    concurrent evaluations, not only within one of them.
+
+    Examples
+    --------
+    >>> limiter = ResourceLimiter(max_concurrency=1, max_calls=5, period=60.0)
+    >>> with limiter:  # waits for a slot
+    ...     ...  # call the API
+
+    """
+
+    def __init__(
+        self, max_concurrency: int, max_calls: Optional[int] = None, period: float = 60.0
+    ) -> None:
+        self.max_calls = max_calls
+        self.period = period
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._calls: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """Take a slot, waiting for it (and for the rate limit) unless not `blocking`.
+
+        Returns:
+            bool: Whether the slot was taken, it has to be released then.
+
+        """
+        if not self._slots.acquire(blocking):
+            return False
+        while True:
+            delay = self._reserve_call()
+            if delay <= 0:
+                return True
+            if not blocking:
+                self._slots.release()
+                return False
+            time.sleep(delay)
+
+    def release(self) -> None:
+        self._slots.release()
+
+    def __enter__(self) -> "ResourceLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.release()
+
+    def _reserve_call(self) -> float:
+        """Record a call if the rate limit allows it, otherwise return the time until it does."""
+        if self.max_calls is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            while self._calls and self._calls[0] <= now - self.period:
+                self._calls.popleft()
+            if len(self._calls) < self.max_calls:
+                self._calls.append(now)
+                return 0.0
+            return self._calls[0] + self.period - now
+
+
+_PROVIDER_LIMITERS: Dict[Tuple[str, int, Optional[int]], ResourceLimiter] = {}
+_PROVIDER_LIMITERS_LOCK = threading.Lock()
+
+
+def provider_limiter(provider: object) -> ResourceLimiter:
+    """Return the limiter of the provider's API requests, one per provider class and process.
+
+    The limits are the `max_concurrency` and `max_calls_per_minute` class
+    attributes of the provider. Only the actual requests are to be limited,
+    data served from the caches is not.
+    """
+    provider_type = type(provider)
+    key = (
+        provider_type.__name__,
+        getattr(provider_type, "max_concurrency", DEFAULT_MAX_CONCURRENCY),
+        getattr(provider_type, "max_calls_per_minute", None),
+    )
+    with _PROVIDER_LIMITERS_LOCK:
+        if key not in _PROVIDER_LIMITERS:
+            _PROVIDER_LIMITERS[key] = ResourceLimiter(key[1], key[2])
+        return _PROVIDER_LIMITERS[key]
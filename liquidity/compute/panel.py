@@ -0,0 +1,120 @@
+import uuid
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from liquidity.compute.kernels import FloatArray, as_float_array
+from liquidity.compute.ticker import Ticker
+from liquidity.data.metadata.fields import OHLCV, Fields
+
+# Ticker property holding each of the supported fields
+FIELD_SOURCES: Dict[str, str] = {
+    **{field: "prices" for field in OHLCV.all_values()},
+    Fields.TTM_Dividend.value: "dividends",
+    Fields.Yield.value: "yields",
+}
+
+
+class Panel:
+    """Multi-symbol time series aligned on a shared date index (dates x symbols x field).
+
+    The data of every field is held in a single 2-D array of shape
+    (dates, symbols). Arrays are stored in column-major order, so the series
+    of each symbol is contiguous in memory and `Panel.values` returns it
+    without copying. Dates on which a symbol has no observation hold NaN.
+
+    Aligning many symbols once, instead of joining every pair of frames
+    separately, is useful when many models share the same inputs, e.g. a
+    dashboard with dozens of ratios or spreads.
+
+    Examples
+    --------
+    >>> panel = Panel.from_symbols(["HYG", "LQD", "UST-10Y"], fields=["Yield"])
+    >>> panel.series("Yield", "HYG")
+    >>> YieldSpread("HYG", "LQD", panel=panel).df
+
+    """
+
+    def __init__(
+        self,
+        index: pd.DatetimeIndex,
+        symbols: Sequence[str],
+        data: Mapping[str, FloatArray],
+    ) -> None:
+        self.index = index
+        self.symbols = list(symbols)
+        self.data = {field: np.asfortranarray(values) for field, values in data.items()}
+        self._positions = {symbol: pos for pos, symbol in enumerate(self.symbols)}
+        # Identifies the panel in the graph node keys, unlike `id()` it is never reused
+        self.token = uuid.uuid4().hex
+
+        for field, values in self.data.items():
+            if values.shape != (len(index), len(self.symbols)):
+                raise ValueError(f"Invalid shape of the {field} array: {values.shape}")
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self.data)
+
+    @classmethod
+    def from_series(cls, series: Mapping[str, Mapping[str, "pd.Series[float]"]]) -> "Panel":
+        """Build panel from series given as ``{field: {symbol: series}}``.
+
+        The shared index is the sorted union of all the series dates.
+        """
+        symbols = list(dict.fromkeys(s for by_symbol in series.values() for s in by_symbol))
+        dates = [s.index.to_numpy() for by_symbol in series.values() for s in by_symbol.values()]
+        index = pd.DatetimeIndex(np.unique(np.concatenate(dates)) if dates else [], name="Date")
+
+        data: Dict[str, FloatArray] = {}
+        for field, by_symbol in series.items():
+            values = np.full((len(index), len(symbols)), np.nan, order="F")
+            for symbol, s in by_symbol.items():
+                s = s[~s.index.duplicated(keep="last")]
+                rows = index.searchsorted(s.index)
+                values[rows, symbols.index(symbol)] = as_float_array(s)
+            data[field] = values
+
+        return cls(index, symbols, data)
+
+    @classmethod
+    def from_tickers(cls, tickers: Iterable[Ticker], fields: Sequence[str]) -> "Panel":
+        """Build panel from the tickers data.
+
+        Args:
+            tickers (Iterable[Ticker]): Tickers to include in the panel.
+            fields (Sequence[str]): Fields to load, e.g. "Close" or "Yield". All
+                the tickers have to provide every requested field.
+
+        """
+        tickers = list(tickers)
+        series: Dict[str, Dict[str, "pd.Series[float]"]] = {}
+        for field in fields:
+            if field not in FIELD_SOURCES:
+                raise ValueError(f"Unsupported panel field: {field}")
+            source = FIELD_SOURCES[field]
+            series[field] = {t.symbol: getattr(t, source)[field].dropna() for t in tickers}
+        return cls.from_series(series)
+
+    @classmethod
+    def from_symbols(cls, symbols: Iterable[str], fields: Sequence[str]) -> "Panel":
+        """Build panel for the symbols, see `Panel.from_tickers`."""
+        return cls.from_tickers([Ticker.for_symbol(s) for s in symbols], fields)
+
+    def values(self, field: str, symbol: str) -> FloatArray:
+        """Return the symbol's values of the field, a view into the panel array."""
+        return self.data[field][:, self._positions[symbol]]
+
+    def series(self, field: str, symbol: str) -> "pd.Series[float]":
+        """Return the symbol's values of the field as series, without copying data."""
+        return pd.Series(self.values(field, symbol), index=self.index, name=symbol, copy=False)
+
+    def frame(self, field: str, symbols: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Return dataframe with the field values of the symbols (all by default)."""
+        symbols = self.symbols if symbols is None else symbols
+        columns = [self._positions[symbol] for symbol in symbols]
+        return pd.DataFrame(self.data[field][:, columns], index=self.index, columns=list(symbols))
+
+    def __contains__(self, symbol: object) -> bool:
+        return symbol in self._positions
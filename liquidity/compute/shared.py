@@ -0,0 +1,362 @@
+import contextlib
+import json
+import struct
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from liquidity.compute.kernels import as_float_array
+from liquidity.compute.panel import Panel
+
+# Size of a single value, both the dates (datetime64[ns]) and the values (float64)
+ITEM_SIZE = 8
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """Picklable handle of a date indexed frame of floats held in shared memory.
+
+    Only the handle (the name of the shared memory block and the layout of
+    the frame) is sent to other processes, they attach to the block and read
+    the frame without copying or unpickling it. The block holds the dates
+    followed by the values, column by column, so each series is contiguous.
+
+    Examples
+    --------
+    >>> handle, shm = SharedFrame.create(prices)  # in the parent process
+    >>> df, block = handle.attach()  # in a worker, read-only view of the data
+    >>> block.close()
+    >>> shm.close(); shm.unlink()  # in the parent, once the workers are done
+
+    """
+
+    name: str
+    rows: int
+    columns: Tuple[str, ...]
+    index_name: Optional[str] = None
+
+    @classmethod
+    def create(cls, df: pd.DataFrame) -> Tuple["SharedFrame", SharedMemory]:
+        """Copy the frame to a new shared memory block.
+
+        Returns:
+            Tuple[SharedFrame, SharedMemory]: Handle of the frame and the block,
+            the caller is responsible for closing and unlinking the block.
+
+        """
+        rows, columns = len(df), len(df.columns)
+        shm = SharedMemory(create=True, size=max(rows * (columns + 1) * ITEM_SIZE, 1))
+
+        index = np.ndarray((rows,), dtype="datetime64[ns]", buffer=shm.buf)
+        index[:] = pd.DatetimeIndex(df.index).as_unit("ns").to_numpy()
+        values = np.ndarray(
+            (columns, rows), dtype=np.float64, buffer=shm.buf, offset=rows * ITEM_SIZE
+        )
+        values[:] = as_float_array(df.to_numpy()).T
+
+        handle = cls(
+            name=shm.name,
+            rows=rows,
+            columns=tuple(str(getattr(c, "value", c)) for c in df.columns),
+            index_name=df.index.name,
+        )
+        return handle, shm
+
+    def attach(self) -> Tuple[pd.DataFrame, SharedMemory]:
+        """Return read-only frame backed by the shared memory block, and the block.
+
+        The block has to be closed once the frame (and any view of it) is no
+        longer used.
+        """
+        shm = SharedMemory(name=self.name)
+        index = np.ndarray((self.rows,), dtype="datetime64[ns]", buffer=shm.buf)
+        values = np.ndarray(
+            (len(self.columns), self.rows),
+            dtype=np.float64,
+            buffer=shm.buf,
+            offset=self.rows * ITEM_SIZE,
+        )
+        values.flags.writeable = False
+
+        df = pd.DataFrame(
+            values.T,
+            index=pd.DatetimeIndex(index, name=self.index_name, copy=False),
+            columns=list(self.columns),
+            copy=False,
+        )
+        return df, shm
+
+
+def detach(df: pd.DataFrame) -> pd.DataFrame:
+    """Return copy of the frame that does not reference any shared memory block.
+
+    Unlike ``df.copy()``, the index is copied too, frames derived from the
+    attached ones (e.g. aligned on their dates) may share its index.
+    """
+    copy = df.copy()
+    copy.index = df.index.copy(deep=True)
+    return copy
+
+
+# Layout of the header block of a shared panel: magic bytes and version of the
+# published data, followed by two slots with the layouts of the data blocks.
+# Each slot holds the version, length and CRC-32 of its JSON layout, then the
+# layout. Version v is written to the slot v % 2 before the version is bumped,
+# so the layout of the published version is never overwritten: a publisher
+# dying mid-publish leaves the previous version readable.
+HEADER_MAGIC = b"LIQPANEL"
+HEADER_SIZE = 64 * 1024
+_HEADER = struct.Struct("<8sQ")
+_SLOT = struct.Struct("<QQI")
+SLOT_SIZE = (HEADER_SIZE - _HEADER.size) // 2
+
+# Time consumers wait for a consistent header (a slot may be overwritten while
+# being read, by two consecutive publishes) and the pause between attempts
+ATTACH_TIMEOUT = 5.0
+RETRY_INTERVAL = 0.001
+
+
+def _open(name: str) -> SharedMemory:
+    """Attach to an existing block without handing its cleanup to this process.
+
+    Before Python 3.13, attached blocks are registered with the resource
+    tracker, which unlinks them when the (consumer) process exits.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)  # type: ignore[call-arg,unused-ignore]
+    shm = SharedMemory(name=name)
+    resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+class SharedPanel:
+    """Panel published in shared memory, for several processes on the same host.
+
+    One process (e.g. a loader or a dashboard) publishes the aligned data,
+    the others (e.g. notebook kernels) attach to it by name and read the
+    arrays without loading or copying them. The name identifies a header
+    block holding the version of the data and the layout of the current
+    data block, republishing the panel writes a new data block and bumps the
+    version, so the consumers notice the refresh with `is_stale`.
+
+    Examples
+    --------
+    >>> panel = Panel.from_symbols(["HYG", "LQD", "UST-10Y"], fields=["Yield"])
+    >>> shared = SharedPanel.publish("yields", panel)  # in the loader process
+    >>> shared.publish_update(refreshed)  # version 2, consumers see is_stale
+
+    >>> shared = SharedPanel.attach("yields")  # in a notebook kernel
+    >>> YieldSpread("HYG", "LQD", panel=shared.panel).df
+    >>> shared = shared.refresh() if shared.is_stale else shared
+
+    """
+
+    def __init__(
+        self, name: str, header: SharedMemory, data: SharedMemory, version: int, panel: Panel
+    ) -> None:
+        self.name = name
+        self.version = version
+        self.panel = panel
+        self._header = header
+        self._data = data
+
+    @classmethod
+    def publish(cls, name: str, panel: Panel) -> "SharedPanel":
+        """Publish the panel under the name, creating the header block.
+
+        The publishing process owns the blocks and has to `unlink` them once
+        the data is no longer shared.
+
+        Raises:
+            FileExistsError: If a panel of that name is already published.
+
+        """
+        header = SharedMemory(name=name, create=True, size=HEADER_SIZE)
+        _HEADER.pack_into(header.buf, 0, HEADER_MAGIC, 0)
+        try:
+            shared = cls(name, header, *_write_panel(name, panel, version=1))
+        except BaseException:
+            header.close()
+            header.unlink()
+            raise
+        shared._write_header()
+        return shared
+
+    def publish_update(self, panel: Panel) -> None:
+        """Publish new data under the same name, as the next version.
+
+        Consumers attached to the previous version keep reading it until
+        they refresh, its block is unlinked but remains mapped until then.
+        """
+        previous = self._data
+        self._data, self.version, self.panel = _write_panel(self.name, panel, self.version + 1)
+        self._write_header()
+        previous.close()
+        previous.unlink()
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedPanel":
+        """Attach read-only to the current version of the panel published under the name.
+
+        Raises:
+            FileNotFoundError: If no panel of that name is published.
+            ValueError: If the block of that name does not hold a panel.
+            TimeoutError: If no consistent layout was read within `ATTACH_TIMEOUT`,
+                i.e. the header is corrupted.
+
+        """
+        header = _open(name)
+        try:
+            deadline = time.monotonic() + ATTACH_TIMEOUT
+            layout = _read_layout(header, deadline)
+            while True:
+                try:
+                    data = _open(layout["block"])
+                    break
+                except FileNotFoundError:
+                    # Replaced by a new version between reading the layout and attaching
+                    if time.monotonic() > deadline:
+                        raise
+                    time.sleep(RETRY_INTERVAL)
+                    layout = _read_layout(header, deadline)
+        except BaseException:
+            header.close()
+            raise
+
+        return cls(name, header, data, layout["version"], _read_panel(data, layout))
+
+    @property
+    def published_version(self) -> int:
+        """Version of the data currently published under the name."""
+        _, version = _HEADER.unpack_from(self._header.buf, 0)
+        return int(version)
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether a newer version of the data was published since attaching."""
+        return self.published_version != self.version
+
+    def refresh(self) -> "SharedPanel":
+        """Return the panel attached to the current version, closing this one.
+
+        Arrays of the previous `panel` cannot be used once it is closed.
+        """
+        refreshed = SharedPanel.attach(self.name)
+        self.close()
+        return refreshed
+
+    def close(self) -> None:
+        """Detach from the blocks, the panel arrays cannot be used afterwards."""
+        self.panel = None  # type: ignore[assignment]
+        for shm in (self._data, self._header):
+            # Views of the arrays may still be referenced, the block is closed on exit then
+            with contextlib.suppress(BufferError):
+                shm.close()
+
+    def unlink(self) -> None:
+        """Stop sharing the panel, to be called by the publishing process."""
+        self._data.unlink()
+        self._header.unlink()
+
+    def _write_header(self) -> None:
+        layout = json.dumps(
+            {
+                "version": self.version,
+                "block": self._data.name,
+                "rows": len(self.panel.index),
+                "symbols": self.panel.symbols,
+                "fields": self.panel.fields,
+            }
+        ).encode()
+        if _SLOT.size + len(layout) > SLOT_SIZE:
+            raise ValueError("Panel layout does not fit into the header block")
+
+        # The layout is written before the version, so a consumer seeing the
+        # new version reads the new layout.
+        offset = _slot_offset(self.version)
+        _SLOT.pack_into(self._header.buf, offset, self.version, len(layout), zlib.crc32(layout))
+        start = offset + _SLOT.size
+        self._header.buf[start : start + len(layout)] = layout
+        _HEADER.pack_into(self._header.buf, 0, HEADER_MAGIC, self.version)
+
+
+def _write_panel(name: str, panel: Panel, version: int) -> Tuple[SharedMemory, int, Panel]:
+    """Copy the panel to a new data block, return the block and a panel backed by it."""
+    rows, symbols = len(panel.index), len(panel.symbols)
+    size = rows * (1 + symbols * len(panel.fields)) * ITEM_SIZE
+    data = SharedMemory(name=f"{name}-v{version}", create=True, size=max(size, 1))
+
+    layout = {"rows": rows, "symbols": panel.symbols, "fields": panel.fields}
+    index, arrays = _arrays(data, layout)
+    index[:] = pd.DatetimeIndex(panel.index).as_unit("ns").to_numpy()
+    for field, values in arrays.items():
+        values[:] = panel.data[field]
+
+    return data, version, _read_panel(data, layout)
+
+
+def _slot_offset(version: int) -> int:
+    return _HEADER.size + (version % 2) * SLOT_SIZE
+
+
+def _read_layout(header: SharedMemory, deadline: float) -> Dict[str, Any]:
+    """Return layout of the current version, retrying reads interleaved with publishes."""
+    while True:
+        magic, version = _HEADER.unpack_from(header.buf, 0)
+        if magic != HEADER_MAGIC:
+            raise ValueError(f"Shared memory block {header.name} does not hold a panel")
+        if version == 0:
+            raise FileNotFoundError(f"Panel {header.name} is not published yet")
+
+        layout = _read_slot(header, version)
+        if layout is not None:
+            return layout
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Layout of panel {header.name} version {version} is corrupted")
+        time.sleep(RETRY_INTERVAL)
+
+
+def _read_slot(header: SharedMemory, version: int) -> Optional[Dict[str, Any]]:
+    """Return layout of the version, None if its slot does not hold it (intact)."""
+    offset = _slot_offset(version)
+    slot_version, length, checksum = _SLOT.unpack_from(header.buf, offset)
+    if slot_version != version or length > SLOT_SIZE - _SLOT.size:
+        return None
+
+    start = offset + _SLOT.size
+    layout = bytes(header.buf[start : start + length])
+    if zlib.crc32(layout) != checksum:
+        return None
+    result: Dict[str, Any] = json.loads(layout)
+    return result
+
+
+def _arrays(data: SharedMemory, layout: Dict[str, Any]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    rows, symbols = layout["rows"], len(layout["symbols"])
+    index = np.ndarray((rows,), dtype="datetime64[ns]", buffer=data.buf)
+    arrays = {
+        field: np.ndarray(
+            (rows, symbols),
+            dtype=np.float64,
+            buffer=data.buf,
+            offset=(1 + position * symbols) * rows * ITEM_SIZE,
+            order="F",
+        )
+        for position, field in enumerate(layout["fields"])
+    }
+    return index, arrays
+
+
+def _read_panel(data: SharedMemory, layout: Dict[str, Any]) -> Panel:
+    """Return read-only panel backed by the data block."""
+    index, arrays = _arrays(data, layout)
+    for values in (index, *arrays.values()):
+        values.flags.writeable = False
+    return Panel(pd.DatetimeIndex(index, name="Date", copy=False), layout["symbols"], arrays)
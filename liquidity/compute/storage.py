@@ -0,0 +1,117 @@
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from liquidity.compute.cache import CacheConfig
+from liquidity.compute.frames import (
+    META_FILE,
+    DateLike,
+    _label,
+    read_frame,
+    write_frame,
+)
+
+__all__ = ["DateLike", "PartitionedStore", "get_partitioned_store", "read_frame", "write_frame"]
+
+
+class PartitionedStore:
+    """Columnar storage for long (intraday) histories.
+
+    Frames are partitioned on disk by symbol, interval, year and month::
+
+        <root>/<symbol>/<interval>/year=2024/month=01/
+
+    Each partition is written with `write_frame`, so reading a date range
+    only touches the partitions (and columns) that overlap it.
+
+    Examples
+    --------
+    >>> store = PartitionedStore("/tmp/bars")
+    >>> store.write("BTC", "1min", bars)
+    >>> store.read("BTC", "1min", start="2024-01-01", end="2024-01-31")
+
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+
+    def _path(self, symbol: str, interval: str, month: pd.Period) -> Path:
+        return (
+            self.root
+            / symbol
+            / _label(interval)
+            / f"year={month.year:04d}"
+            / f"month={month.month:02d}"
+        )
+
+    def partitions(self, symbol: str, interval: str) -> List[pd.Period]:
+        """Return sorted list of the months stored for the symbol."""
+        base = self.root / symbol / _label(interval)
+        months = []
+        for meta in base.glob(f"year=*/month=*/{META_FILE}"):
+            year = int(meta.parent.parent.name.removeprefix("year="))
+            month = int(meta.parent.name.removeprefix("month="))
+            months.append(pd.Period(year=year, month=month, freq="M"))
+        return sorted(months)
+
+    def updated_at(self, symbol: str, interval: str, month: pd.Period) -> Optional[datetime]:
+        """Return the time (in UTC) the partition was last written, None if missing."""
+        meta = self._path(symbol, interval, month) / META_FILE
+        if not meta.exists():
+            return None
+        return datetime.fromtimestamp(meta.stat().st_mtime, tz=timezone.utc)
+
+    def write(self, symbol: str, interval: str, df: pd.DataFrame) -> None:
+        """Write frame into monthly partitions.
+
+        Rows are merged with the data already stored in the partition; for
+        duplicated timestamps the newly written rows take precedence.
+        """
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("DataFrame index must be a DatetimeIndex")
+
+        for month, chunk in df.groupby(df.index.to_period("M"), sort=True):
+            path = self._path(symbol, interval, month)
+            if (path / META_FILE).exists():
+                stored = read_frame(path)
+                chunk = pd.concat([stored, chunk])
+                chunk = chunk[~chunk.index.duplicated(keep="last")]
+            write_frame(path, chunk.sort_index())
+
+    def iter_partitions(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield stored partitions overlapping the date range, in date order."""
+        first = pd.Period(start, freq="M") if start is not None else None
+        last = pd.Period(end, freq="M") if end is not None else None
+
+        for month in self.partitions(symbol, interval):
+            if (first and month < first) or (last and month > last):
+                continue
+            yield read_frame(self._path(symbol, interval, month), columns, start, end)
+
+    def read(
+        self,
+        symbol: str,
+        interval: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Return the stored frame for the date range, concatenated from partitions."""
+        chunks = list(self.iter_partitions(symbol, interval, start, end, columns))
+        if not chunks:
+            raise KeyError(f"{symbol}-{_label(interval)}")
+        return pd.concat(chunks)
+
+
+def get_partitioned_store() -> PartitionedStore:
+    """Return store for the intraday bars, located in the data directory."""
+    return PartitionedStore(CacheConfig().data_dir / "partitions")
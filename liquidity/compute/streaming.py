@@ -0,0 +1,114 @@
+from typing import Dict, Iterable, Iterator, Literal, Optional
+
+import pandas as pd
+
+from liquidity.compute.alignment import Calendar
+from liquidity.compute.storage import PartitionedStore
+
+JoinMethod = Literal["inner", "asof"]
+
+# Joins of the chunks equivalent to aligning the whole series on the calendar
+# (see `align`), the other calendars require the dates of both series at once.
+CALENDAR_JOINS: Dict[Calendar, JoinMethod] = {
+    Calendar.Intersection: "inner",
+    Calendar.First: "asof",
+}
+
+
+def calendar_join(calendar: Calendar) -> JoinMethod:
+    """Return the join method streaming the alignment of two series on the calendar.
+
+    Raises:
+        ValueError: If the calendar cannot be streamed.
+
+    """
+    try:
+        return CALENDAR_JOINS[calendar]
+    except KeyError:
+        supported = ", ".join(c.name for c in CALENDAR_JOINS)
+        raise ValueError(
+            f"Calendar {calendar.name} cannot be streamed, use one of: {supported}"
+        ) from None
+
+
+def stream_join(
+    left: Iterable[pd.DataFrame],
+    right: Iterable[pd.DataFrame],
+    how: JoinMethod = "inner",
+    tolerance: Optional[pd.Timedelta] = None,
+) -> Iterator[pd.DataFrame]:
+    """Join two chunked time series without loading either of them in full.
+
+    Both inputs are iterables of dataframes sorted by date, where every chunk
+    starts after the previous one ends (e.g. monthly partitions). The right
+    side is consumed only as far as needed to cover the current left chunk,
+    so at most a few chunks are held in memory at any time.
+
+    Args:
+        left (Iterable[pd.DataFrame]): Chunks of the primary series.
+        right (Iterable[pd.DataFrame]): Chunks of the secondary series, the
+            column names must not overlap with the left side.
+        how (str): Join method:
+            - "inner": keep only timestamps present on both sides,
+            - "asof": join every left row with the latest right row at or
+              before it. The last right row is carried over chunk boundaries,
+              which is the streaming equivalent of a forward-fill.
+        tolerance (pd.Timedelta, optional): Maximum age of the right row joined
+            as-of, older rows are not joined (e.g. the `max_staleness` of a model).
+
+    Yields:
+        pd.DataFrame: Joined chunks, rows with missing values are dropped.
+
+    """
+    right_chunks = iter(right)
+    buffer: Optional[pd.DataFrame] = None
+    carry: Optional[pd.DataFrame] = None
+    exhausted = False
+
+    for chunk in left:
+        if chunk.empty:
+            continue
+
+        # Read right chunks until they cover the end of the current left chunk
+        upper = chunk.index[-1]
+        while not exhausted and (buffer is None or buffer.empty or buffer.index[-1] < upper):
+            try:
+                incoming = next(right_chunks)
+            except StopIteration:
+                exhausted = True
+            else:
+                buffer = incoming if buffer is None else pd.concat([buffer, incoming])
+
+        if buffer is None:
+            return  # the right side is empty, nothing to join with
+
+        cut = int((buffer.index <= upper).sum())
+        matched, buffer = buffer.iloc[:cut], buffer.iloc[cut:]
+
+        if how == "asof":
+            if carry is not None:
+                matched = pd.concat([carry, matched])
+            joined = pd.merge_asof(
+                chunk,
+                matched,
+                left_index=True,
+                right_index=True,
+                direction="backward",
+                tolerance=tolerance,
+            )
+            if not matched.empty:
+                carry = matched.iloc[-1:]
+        else:
+            joined = chunk.join(matched, how="inner")
+
+        yield joined.dropna()
+
+
+def write_chunks(
+    store: PartitionedStore, name: str, interval: str, chunks: Iterable[pd.DataFrame]
+) -> str:
+    """Write computed chunks into the partitioned store, returns name of the stored series."""
+    for chunk in chunks:
+        if not chunk.empty:
+            store.write(name, interval, chunk)
+    return name
@@ -1,15 +1,43 @@
-from typing import Callable, Dict
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence
 
 import pandas as pd
 
-from liquidity.compute.cache import get_cache
-from liquidity.compute.utils.dividends import compute_ttm_dividend
-from liquidity.compute.utils.yields import compute_dividend_yield
+from liquidity.compute.cache import CacheConfig, InMemoryCacheWithPersistence, get_cache
+from liquidity.compute.frames import (
+    compact,
+    count_before,
+    frame_bytes,
+    freeze,
+    select_columns,
+    select_dates,
+)
+from liquidity.compute.locks import KeyedLocks, provider_limiter
+from liquidity.compute.storage import PartitionedStore, get_partitioned_store
+from liquidity.compute.utils.dividends import compute_ttm_dividend, update_ttm_dividend
+from liquidity.compute.utils.resample import resample_ohlcv
+from liquidity.compute.utils.yields import compute_dividend_yield, update_dividend_yield
 from liquidity.data.config import get_data_provider
 from liquidity.data.metadata.assets import get_symbol_metadata
 from liquidity.data.metadata.entities import AssetMetadata
+from liquidity.data.metadata.fields import OHLCV, Fields, Interval
 from liquidity.data.providers.base import DataProviderBase
 
+# Look-back of the trailing twelve months dividend, required to compute yields for a date range
+DIVIDEND_LOOKBACK = pd.Timedelta(days=365)
+
+# Time after the end of a month during which its intraday bars may still be
+# published or corrected (e.g. after-hours bars), partitions written before
+# are downloaded again.
+INTRADAY_GRACE_PERIOD = pd.Timedelta(days=1)
+
+# Columns of the `memory_report`
+REPORT_COLUMNS = {"Rows": "int64", "Bytes": "int64", "Lean Bytes": "int64", "Saving": "float64"}
+
+# Locks of the cache keys, shared by all the tickers using the same cache
+_CACHE_LOCKS = KeyedLocks()
+
 
 class EconomicData:
     pass
@@ -22,6 +50,8 @@ class Ticker:
         metadata: AssetMetadata,
         provider: DataProviderBase,
         cache: Dict[str, pd.DataFrame],
+        store: Optional[PartitionedStore] = None,
+        lean: bool = False,
     ) -> None:
         """Initialize a Ticker object.
 
@@ -30,6 +60,9 @@ class Ticker:
             metadata (AssetMetadata): Metadata about the time series.
             provider (DataProviderBase): Data provider for retrieving asset data.
             cache (dict): Cache for storing and retrieving data.
+            store (PartitionedStore, optional): On-disk storage for intraday bars.
+            lean (bool): Store the data in compact dtypes (see `compact`), e.g.
+                float32 prices and integer volume, to hold more history in memory.
 
         Simpler Initialization:
             Use the `Ticker.for_symbol(symbol: str)` class method for easier
@@ -43,31 +76,334 @@ class Ticker:
         self.metadata = metadata
         self.provider = provider
         self.cache = cache
+        self.store = store or get_partitioned_store()
+        self.lean = lean
 
     def _get_key(self, data_type: str) -> str:
         """Returns key for the cache storage and retrieval."""
         return f"{self.symbol}-{data_type}"
 
+    def _lock(self, cache_key: str) -> threading.RLock:
+        """Return lock serializing fetches and updates of the cache key.
+
+        Persistent caches are identified by their directory, so the tickers
+        created separately (e.g. by `for_symbol`) share the locks and the
+        data fetched by one of them is read from the disk by the others.
+        """
+        return _CACHE_LOCKS((getattr(self.cache, "cache_dir", id(self.cache)), cache_key))
+
     def _get(self, cache_key: str, fetch_fn: Callable[[], pd.DataFrame]) -> pd.DataFrame:
-        """Retrieve data from cache or fetch using the provided function."""
+        """Retrieve data from cache or fetch using the provided function.
+
+        Concurrent requests of the same data wait for a single fetch. Cached
+        frames are shared, they are frozen so that they cannot be modified.
+        """
         try:
             return self.cache[cache_key]
         except KeyError:
-            self.cache[cache_key] = fetch_fn()
-            return self.cache[cache_key]
+            pass
+
+        with self._lock(cache_key):
+            try:
+                return self.cache[cache_key]  # fetched while waiting for the lock
+            except KeyError:
+                return self._store(cache_key, fetch_fn())
+
+    def _store(self, cache_key: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Store the data in the cache, frozen (and compacted in lean mode)."""
+        df = freeze(compact(df) if self.lean else df)
+        self.cache[cache_key] = df
+        return df
+
+    def _read(
+        self,
+        cache_key: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Return date range and columns of the cached data, reading only those from disk."""
+        if isinstance(self.cache, InMemoryCacheWithPersistence):
+            return self.cache.read(cache_key, start, end, columns)
+        return select_columns(select_dates(self.cache[cache_key], start, end), columns)
+
+    def _get_range(
+        self,
+        data_type: str,
+        fetch_fn: Callable[[Optional[datetime]], pd.DataFrame],
+        start: Optional[datetime],
+        end: Optional[datetime],
+        columns: Optional[Sequence[str]] = None,
+        ranged: bool = True,
+    ) -> pd.DataFrame:
+        """Retrieve date range of the data from cache, or fetch only the data since `start`.
+
+        The full history is used whenever it is cached already, otherwise the
+        data fetched since `start` is cached separately, under a key with
+        the start date. Later start dates are served from it, and the data
+        cached since later dates is dropped once an earlier start is fetched,
+        so a single entry is kept per data type. Data the provider cannot
+        fetch for a range (`ranged` False) is cached in full. Only the
+        `columns` (all by default) are returned.
+        """
+        cache_key = self._get_key(data_type)
+        if start is None or not ranged:
+            df = self._get(cache_key, lambda: fetch_fn(None))
+            return select_columns(select_dates(df, start, end), columns)
+
+        try:
+            return self._read(cache_key, start, end, columns)
+        except KeyError:
+            pass
+
+        with self._lock(self._get_key(f"{data_type}-since")):
+            cached = self._since_keys(data_type)
+            covering = [since for since in cached if since <= start]
+            if covering:
+                return self._read(cached[max(covering)], start, end, columns)
+
+            since = pd.Timestamp(start).normalize()
+            since_key = self._get_key(f"{data_type}-since-{since:%Y%m%d}")
+            self._store(since_key, select_dates(fetch_fn(since), since))
+            for key in cached.values():
+                self._discard(key)  # all of them since later dates, covered by the new one
 
-    def _fetch_prices(self) -> pd.DataFrame:
-        return self.provider.get_prices(self.symbol)
+        return self._read(since_key, start, end, columns)
 
-    def _fetch_yields(self) -> pd.DataFrame:
+    def _since_keys(self, data_type: str) -> Dict[pd.Timestamp, str]:
+        """Return keys of the data type cached since a start date, by the start date."""
+        prefix = self._get_key(f"{data_type}-since-")
+        if isinstance(self.cache, InMemoryCacheWithPersistence):
+            keys = self.cache.stored_keys()
+        else:
+            keys = set(self.cache)
+        return {
+            pd.Timestamp(datetime.strptime(key.removeprefix(prefix), "%Y%m%d")): key
+            for key in keys
+            if key.startswith(prefix)
+        }
+
+    def _discard(self, cache_key: str) -> None:
+        if isinstance(self.cache, InMemoryCacheWithPersistence):
+            self.cache.discard(cache_key)
+        else:
+            self.cache.pop(cache_key, None)
+
+    def _fetch_prices(self, start: Optional[datetime] = None) -> pd.DataFrame:
+        with provider_limiter(self.provider):
+            if start is None:
+                return self.provider.get_prices(self.symbol)
+            return self.provider.get_prices(self.symbol, start=start)
+
+    def _fetch_yields(self, start: Optional[datetime] = None) -> pd.DataFrame:
         if self.metadata.is_treasury_yield:
-            return self.provider.get_treasury_yield(self.metadata.maturity)
-        return compute_dividend_yield(self.prices, self.dividends)
+            with provider_limiter(self.provider):
+                return self.provider.get_treasury_yield(self.metadata.maturity)
+        if start is None:
+            return compute_dividend_yield(self.prices, self.dividends)
+
+        # The latest TTM dividend before the start date is carried forward to it
+        lookback = start - DIVIDEND_LOOKBACK
+        yields = compute_dividend_yield(
+            self.get_prices(lookback, columns=[OHLCV.Close]),
+            self.get_dividends(lookback, columns=[Fields.TTM_Dividend]),
+        )
+        return select_dates(yields, start)
 
     def _fetch_dividends(self) -> pd.DataFrame:
-        df = self.provider.get_dividends(self.symbol)
+        with provider_limiter(self.provider):
+            df = self.provider.get_dividends(self.symbol)
         return compute_ttm_dividend(df, self.metadata.distribution_frequency)
 
+    def _cached(self, data_type: str) -> Optional[pd.DataFrame]:
+        """Return the cached full history of the data type, None if not cached."""
+        try:
+            return self.cache[self._get_key(data_type)]
+        except KeyError:
+            return None
+
+    def update(
+        self,
+        prices: Optional[pd.DataFrame] = None,
+        dividends: Optional[pd.DataFrame] = None,
+    ) -> None:
+        """Append newly published prices and dividends to the cached data.
+
+        Only the new rows are computed: TTM dividends continue the rolling
+        window of the cached ones, and yields are computed for the new prices
+        (and for the dates from the first new dividend on, which it changes).
+        Prices cached since a start date (see `get_prices`) are appended to
+        as well, while such dividend yields are dropped and recomputed. Data
+        not cached yet is computed in full when first requested.
+
+        Args:
+            prices (pd.DataFrame, optional): Prices after the last cached date.
+            dividends (pd.DataFrame, optional): Dividends paid after the last
+                cached one, in the provider's format.
+
+        """
+        with self._lock(self._get_key("prices")):
+            cached_prices = self._cached("prices")
+            if prices is not None and cached_prices is not None:
+                cached_prices = self._append(self._get_key("prices"), cached_prices, prices)
+
+        if prices is not None:
+            with self._lock(self._get_key("prices-since")):
+                for since_key in self._since_keys("prices").values():
+                    self._append(since_key, self.cache[since_key], prices)
+
+        if prices is not None or dividends is not None:
+            with self._lock(self._get_key("yields-since")):
+                # Recomputed from the updated prices and dividends when requested
+                for since_key in self._since_keys("yields").values():
+                    self._discard(since_key)
+
+        with self._lock(self._get_key("dividends")):
+            cached_dividends = self._cached("dividends")
+            if dividends is not None and cached_dividends is not None:
+                try:
+                    updated = update_ttm_dividend(
+                        cached_dividends, dividends, self.metadata.distribution_frequency
+                    )
+                except ValueError:
+                    # Less than a year of TTM dividends is cached, the rolling window is incomplete
+                    cached_dividends = self._store(
+                        self._get_key("dividends"), self._fetch_dividends()
+                    )
+                else:
+                    cached_dividends = self._append(
+                        self._get_key("dividends"),
+                        cached_dividends,
+                        updated.iloc[len(cached_dividends) :],
+                    )
+
+        with self._lock(self._get_key("yields")):
+            yields = self._cached("yields")
+            if (
+                self.metadata.is_treasury_yield
+                or yields is None
+                or cached_prices is None
+                or cached_dividends is None
+            ):
+                return
+
+            unchanged = len(yields)
+            if dividends is not None and not dividends.empty:
+                unchanged = count_before(yields.index, dividends.index[0])
+            updated = update_dividend_yield(
+                yields.iloc[:unchanged], cached_prices, cached_dividends
+            )
+            if unchanged < len(yields):
+                # Yields since the first new dividend changed, the stored ones are replaced
+                self._store(self._get_key("yields"), updated)
+            else:
+                self._append(self._get_key("yields"), yields, updated.iloc[unchanged:])
+
+    def _append(self, cache_key: str, cached: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+        """Store the cached data followed by the rows after its last date.
+
+        Only the new rows are compacted (in lean mode) and persisted, the
+        joined frame is frozen without another copy of the history.
+        """
+        if len(cached):
+            rows = rows.iloc[count_before(rows.index, cached.index[-1], inclusive=True) :]
+        if rows.empty:
+            return cached
+
+        rows = compact(rows) if self.lean else rows
+        df = freeze(pd.concat([cached, rows]), copy=False)
+        if isinstance(self.cache, InMemoryCacheWithPersistence):
+            self.cache.append(cache_key, df, rows)
+        else:
+            self.cache[cache_key] = df
+        return df
+
+    def download_intraday(
+        self,
+        interval: Interval,
+        start: datetime,
+        end: Optional[datetime] = None,
+    ) -> None:
+        """Download intraday bars into the partitioned store, month by month.
+
+        Months which were fully downloaded already (i.e. written a grace period
+        after the month ended, in the time zone of the bars) are skipped, only
+        missing or incomplete months are requested.
+        """
+        now = datetime.now()
+        for month in pd.period_range(start, end or now, freq="M"):
+            if self._is_complete(interval, month):
+                continue
+
+            with provider_limiter(self.provider):
+                df = self.provider.get_intraday_prices(self.symbol, interval, month)
+            if not df.empty:
+                self.store.write(self.symbol, interval, df)
+
+    def _is_complete(self, interval: Interval, month: pd.Period) -> bool:
+        """Return whether the stored month was written after all its bars were published."""
+        updated_at = self.store.updated_at(self.symbol, interval, month)
+        if updated_at is None:
+            return False
+        end = (month + 1).start_time.tz_localize(self.provider.intraday_timezone)
+        return updated_at >= end + INTRADAY_GRACE_PERIOD
+
+    def intraday_prices(
+        self,
+        interval: Interval,
+        start: datetime,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Return intraday bars for the date range, downloading missing months first."""
+        self.download_intraday(interval, start, end)
+        return self.store.read(self.symbol, interval, start, end)
+
+    def iter_intraday_prices(
+        self,
+        interval: Interval,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield stored intraday bars month by month, in date order."""
+        return self.store.iter_partitions(self.symbol, interval, start, end, columns)
+
+    def iter_intraday_yields(
+        self,
+        interval: Interval,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield dividend yields computed for the stored intraday bars, month by month.
+
+        Each bar uses the latest TTM dividend known at its timestamp. Treasury
+        yields are not available intraday, the series is small enough to be
+        yielded in one chunk.
+        """
+        if self.metadata.is_treasury_yield:
+            yield self.yields.truncate(after=end)
+            return
+
+        dividends = self.dividends[[Fields.TTM_Dividend]]
+        for chunk in self.iter_intraday_prices(interval, start, end, [OHLCV.Close]):
+            ttm = pd.merge_asof(
+                chunk, dividends, left_index=True, right_index=True, direction="backward"
+            )
+            yield compute_dividend_yield(chunk, ttm[[Fields.TTM_Dividend]])
+
+    def daily_prices(
+        self,
+        interval: Interval,
+        start: datetime,
+        end: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Return daily prices resampled on the fly from the intraday bars.
+
+        The result has the same format as `Ticker.prices`, so it can be used as
+        an input to the models expecting daily data.
+        """
+        return resample_ohlcv(self.intraday_prices(interval, start, end))
+
     @property
     def prices(self) -> pd.DataFrame:
         return self._get(self._get_key("prices"), self._fetch_prices)
@@ -80,6 +416,48 @@ class Ticker:
     def yields(self) -> pd.DataFrame:
         return self._get(self._get_key("yields"), self._fetch_yields)
 
+    def get_prices(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Return prices within the date range, requesting only the range from the provider.
+
+        Only the `columns` (e.g. ``[OHLCV.Close]``) are read from the cache,
+        all of them by default.
+        """
+        return self._get_range("prices", self._fetch_prices, start, end, columns)
+
+    def get_dividends(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Return dividends within the date range.
+
+        The providers return the whole dividends history, which is required
+        for the TTM dividends anyway, only the cache read is limited to the
+        range and the `columns`.
+        """
+        try:
+            return self._read(self._get_key("dividends"), start, end, columns)
+        except KeyError:
+            return select_columns(select_dates(self.dividends, start, end), columns)
+
+    def get_yields(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Return yields within the date range, computed from the prices since `start`.
+
+        Dividend yields use TTM dividends since a year before `start`, so the
+        yield on the first date is the same as when computed for the full history.
+        """
+        # Treasury yields are fetched in full, providers do not serve their ranges
+        ranged = not self.metadata.is_treasury_yield
+        return self._get_range("yields", self._fetch_yields, start, end, ranged=ranged)
+
     @classmethod
     def for_symbol(cls, symbol: str) -> "Ticker":
         metadata = get_symbol_metadata(symbol)
@@ -97,4 +475,37 @@ class Ticker:
             metadata=metadata,
             provider=get_data_provider(metadata),
             cache=get_cache(),
+            lean=CacheConfig().lean,
         )
+
+
+def memory_report(tickers: Iterable[Ticker]) -> pd.DataFrame:
+    """Return memory held by the data of each ticker loaded in memory, as is and compacted.
+
+    Only the full histories already held by the ticker caches are included,
+    nothing is loaded or fetched.
+
+    Returns:
+        pd.DataFrame: Number of rows, bytes held ("Bytes"), bytes held in
+        lean mode ("Lean Bytes", see `compact`) and the saving as a fraction
+        of the bytes, indexed by symbol.
+
+    """
+    report: Dict[str, Dict[str, float]] = {}
+    for ticker in tickers:
+        frames = [
+            ticker.cache[key]
+            for key in (ticker._get_key(t) for t in ("prices", "dividends", "yields"))
+            if key in ticker.cache
+        ]
+        size = sum(frame_bytes(df) for df in frames)
+        lean = sum(frame_bytes(compact(df)) for df in frames)
+        report[ticker.symbol] = {
+            "Rows": sum(len(df) for df in frames),
+            "Bytes": size,
+            "Lean Bytes": lean,
+            "Saving": 1 - lean / size if size else 0.0,
+        }
+
+    df = pd.DataFrame.from_dict(report, orient="index", columns=list(REPORT_COLUMNS))
+    return df.astype(REPORT_COLUMNS)
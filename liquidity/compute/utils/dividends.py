@@ -3,6 +3,7 @@ from typing import Optional
 
 import pandas as pd
 
+from liquidity.compute.frames import count_before
 from liquidity.data.metadata.fields import Fields
 
 
@@ -30,6 +31,8 @@ def compute_ttm_dividend(
     if not df.index.is_monotonic_increasing:
         raise ValueError("Dates should be sorted in ascending order")
 
+    # The input frame is not modified, it can be shared e.g. with a cache
+    df = df.copy()
     df[Fields.TTM_Dividend] = (
         df[Fields.Dividends]
         .rolling("365D", min_periods=None if partial_window else dividend_frequency)
@@ -41,3 +44,55 @@ def compute_ttm_dividend(
         return df.loc[offset:]
 
     return df
+
+
+def update_ttm_dividend(
+    previous: pd.DataFrame,
+    new: pd.DataFrame,
+    dividend_frequency: Optional[int] = None,
+    partial_window: bool = False,
+) -> pd.DataFrame:
+    """Return `previous` TTM dividends extended with the newly paid dividends.
+
+    Only the new rows are computed, the rolling window is restored from the
+    dividends paid in the year before the first new one, so the result is the
+    same as from `compute_ttm_dividend` on the whole history. Without partial
+    windows the first year of dividends is not kept in `previous`, so it can
+    be updated only with dividends paid at least a year after its first one.
+
+    Parameters
+    ----------
+    previous: DataFrame
+        result of `compute_ttm_dividend` (with the Dividends column).
+    new: DataFrame
+        dividends paid after the last date of `previous`.
+    dividend_frequency: int
+        How often the dividend is paid
+    partial_window: bool
+        Should sums for partially filled time window be returned, as in
+        `compute_ttm_dividend`.
+
+    """
+    if new.empty:
+        return previous
+    if previous.empty:
+        return compute_ttm_dividend(new, dividend_frequency, partial_window)
+    if not new.index.is_monotonic_increasing:
+        raise ValueError("Dates should be sorted in ascending order")
+    if new.index[0] <= previous.index[-1]:
+        raise ValueError("New dividends should be paid after the previous ones")
+
+    if not partial_window and new.index[0] - timedelta(days=365) < previous.index[0]:
+        # The first year of dividends is not in the result, the rolling window is incomplete
+        raise ValueError("A year of previous dividends is required to update the TTM dividend")
+
+    window_start = count_before(previous.index, new.index[0] - timedelta(days=365), inclusive=True)
+    window = pd.concat([previous[[Fields.Dividends]].iloc[window_start:], new[[Fields.Dividends]]])
+    ttm = (
+        window[Fields.Dividends]
+        .rolling("365D", min_periods=None if partial_window else dividend_frequency)
+        .sum()
+    )
+    new = new.copy()
+    new[Fields.TTM_Dividend] = ttm.iloc[-len(new) :].to_numpy()
+    return pd.concat([previous, new])
@@ -0,0 +1,36 @@
+import pandas as pd
+
+from liquidity.data.metadata.fields import OHLCV, Fields
+
+OHLCV_AGGREGATIONS = {
+    OHLCV.Open.value: "first",
+    OHLCV.High.value: "max",
+    OHLCV.Low.value: "min",
+    OHLCV.Close.value: "last",
+    OHLCV.Volume.value: "sum",
+}
+
+
+def resample_ohlcv(df: pd.DataFrame, rule: str = "1D") -> pd.DataFrame:
+    """Return OHLCV bars aggregated to a coarser frequency.
+
+    Parameters
+    ----------
+    df: DataFrame
+        intraday bars with OHLCV columns and a DatetimeIndex.
+    rule: str
+        target frequency, daily bars by default. The daily bars are labeled
+        with the date (midnight), matching the daily prices format used by
+        the models.
+
+    """
+    if not isinstance(df.index, pd.DatetimeIndex):
+        raise ValueError("DataFrame index must be a DatetimeIndex")
+
+    aggregations = {col: agg for col, agg in OHLCV_AGGREGATIONS.items() if col in df.columns}
+    resampled = df.resample(rule).agg(aggregations)  # type: ignore[arg-type]
+
+    # Drop empty buckets e.g. weekends and holidays for stocks
+    resampled = resampled.dropna(subset=[OHLCV.Close.value])
+    resampled.index.name = Fields.Date.value
+    return resampled
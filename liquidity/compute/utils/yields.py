@@ -1,21 +1,74 @@
 from __future__ import annotations
 
-import numpy as np
+from typing import Any, Optional
+
 import pandas as pd
 
+from liquidity.compute import kernels
+from liquidity.compute.frames import count_before
 from liquidity.data.metadata.fields import OHLCV, Fields
 
 
 def compute_dividend_yield(prices: pd.DataFrame, dividends: pd.DataFrame) -> pd.DataFrame:
-    """Return yield dataframe calculated based on prices and dividends data."""
-    df = prices.merge(dividends, how="left", left_index=True, right_index=True)
+    """Return yield dataframe calculated based on prices and dividends data.
+
+    Only the close prices and TTM dividends are joined, the other columns
+    of the inputs are not copied.
+    """
+    df = prices[[OHLCV.Close]].join(dividends[[Fields.TTM_Dividend]], how="left")
 
     # Forward fill values as the value of the calculated TTM_Dividend
     # is valid for all the dates until the next distribution takes place
     df[Fields.TTM_Dividend] = df[Fields.TTM_Dividend].ffill()
 
-    def yield_formula(row: pd.Series[np.float64]) -> np.float64:
-        return ((row[Fields.TTM_Dividend] or 0.0) / row[OHLCV.Close]) * 100.0
+    # Plain string label, enum members are suffixed as e.g. "Fields.YieldHYG"
+    df[Fields.Yield.value] = kernels.ttm_yield(df[Fields.TTM_Dividend], df[OHLCV.Close])
+    return df[[Fields.Yield.value]]
+
+
+def update_dividend_yield(
+    yields: pd.DataFrame, prices: pd.DataFrame, dividends: pd.DataFrame
+) -> pd.DataFrame:
+    """Return `yields` extended with the yields for the prices after its last date.
+
+    Only the new prices are joined with the TTM dividends, the dividend in
+    effect on the first new date is the latest one paid on a previous trading
+    day, the same as in `compute_dividend_yield` on the whole history.
+    """
+    if yields.empty:
+        return compute_dividend_yield(prices, dividends)
+
+    last = yields.index[-1]
+    new_prices = prices.iloc[count_before(prices.index, last, inclusive=True) :]
+    if new_prices.empty:
+        return yields
+
+    ttm = dividends[Fields.TTM_Dividend]
+    df = new_prices[[OHLCV.Close]].join(ttm, how="left")
+    df[Fields.TTM_Dividend] = df[Fields.TTM_Dividend].ffill()
+    carried = _carried_ttm(ttm, prices.index, last)
+    if carried is not None:
+        df[Fields.TTM_Dividend] = df[Fields.TTM_Dividend].fillna(carried)
+
+    df[Fields.Yield.value] = kernels.ttm_yield(df[Fields.TTM_Dividend], df[OHLCV.Close])
+    return pd.concat([yields, df[[Fields.Yield.value]]])
+
+
+def _carried_ttm(
+    ttm: "pd.Series[float]", dates: "pd.Index[Any]", last: pd.Timestamp
+) -> Optional[float]:
+    """Return the latest TTM dividend paid on one of the trading `dates`, up to `last`.
 
-    df[Fields.Yield] = df.apply(yield_formula, axis=1)
-    return df[[Fields.Yield]]
+    The dividends are searched backwards from `last` with binary searches in
+    the sorted dates, usually only the latest one is looked up, not the
+    whole history.
+    """
+    for position in range(count_before(ttm.index, last, inclusive=True) - 1, -1, -1):
+        value = ttm.iloc[position]
+        if pd.isna(value):
+            continue
+        paid_on = ttm.index[position]
+        found = count_before(dates, paid_on)
+        if found < len(dates) and dates[found] == paid_on:
+            return float(value)
+    return None
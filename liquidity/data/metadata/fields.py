@@ -27,3 +27,17 @@ class OHLCV(StrEnum):
     @classmethod
     def all_values(cls) -> List[str]:
         return [x.value for x in list(cls)]
+
+
+class Interval(StrEnum):
+    """Intraday bar intervals supported by the data providers."""
+
+    Minute = "1min"
+    FiveMinutes = "5min"
+    FifteenMinutes = "15min"
+    ThirtyMinutes = "30min"
+    Hour = "60min"
+
+    @property
+    def minutes(self) -> int:
+        return int(self.value.removesuffix("min"))
@@ -2,11 +2,17 @@ from datetime import datetime
 from typing import Optional, cast
 
 import pandas as pd
-from alpaca.data import BarSet, CryptoBarsRequest, CryptoHistoricalDataClient, TimeFrame
+from alpaca.data import (
+    BarSet,
+    CryptoBarsRequest,
+    CryptoHistoricalDataClient,
+    TimeFrame,
+    TimeFrameUnit,
+)
 from dateutil.relativedelta import relativedelta
 
 from liquidity.data.format import formatter_factory
-from liquidity.data.metadata.fields import OHLCV, Fields
+from liquidity.data.metadata.fields import OHLCV, Fields, Interval
 from liquidity.data.providers.base import DataProviderBase
 
 
@@ -45,16 +51,53 @@ class AlpacaCryptoDataProvider(DataProviderBase):
         )
         return self._format_dataframe(df)
 
+    def get_intraday_prices(
+        self, ticker: str, interval: Interval, month: pd.Period
+    ) -> pd.DataFrame:
+        """Fetch and format intraday bars for a single calendar month.
+
+        Args:
+            ticker (str): The cryptocurrency ticker (e.g., "BTC").
+            interval (Interval): The bar interval (e.g. one minute, one hour).
+            month (pd.Period): The calendar month to download.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the formatted OHLCV bars, indexed
+            by the (UTC) bar timestamps.
+
+        """
+        df = self._get_raw_data(
+            ticker=f"{ticker}/USD",
+            start=month.start_time.to_pydatetime(),
+            end=month.end_time.floor("s").to_pydatetime(),
+            timeframe=self._get_timeframe(interval),
+        )
+        if df.empty:
+            return pd.DataFrame(columns=OHLCV.all_values(), index=pd.DatetimeIndex([], name="Date"))
+        return self._format_dataframe(df, normalize=False)
+
+    @staticmethod
+    def _get_timeframe(interval: Interval) -> TimeFrame:
+        """Map the project interval onto Alpaca's time frame."""
+        if interval.minutes % 60 == 0:
+            return TimeFrame(interval.minutes // 60, TimeFrameUnit.Hour)
+        return TimeFrame(interval.minutes, TimeFrameUnit.Minute)
+
     def _get_raw_data(
         self,
         ticker: str,
         start: Optional[datetime] = None,
         end: Optional[datetime] = None,
+        timeframe: TimeFrame = TimeFrame.Day,
     ) -> pd.DataFrame:
         """Fetch raw historical price data for a cryptocurrency ticker.
 
+        The Alpaca client follows the response pagination (``next_page_token``)
+        internally, so a single call returns all the bars in the requested window.
+
         Args:
             ticker (str): The cryptocurrency ticker (e.g., "BTC/USD").
+            timeframe (TimeFrame): The bar size, daily by default.
 
 
         Returns:
@@ -63,14 +106,14 @@ class AlpacaCryptoDataProvider(DataProviderBase):
         """
         request_params = CryptoBarsRequest(
             symbol_or_symbols=ticker,
-            timeframe=TimeFrame.Day,
+            timeframe=timeframe,
             start=start,
             end=end,
         )
         result = cast(BarSet, self.client.get_crypto_bars(request_params))
         return result.df
 
-    def _format_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _format_dataframe(self, df: pd.DataFrame, normalize: bool = True) -> pd.DataFrame:
         """Format the raw dataframe fetched from the Alpaca API to the project's
         common format.
 
@@ -84,6 +127,8 @@ class AlpacaCryptoDataProvider(DataProviderBase):
         Args:
             df (pd.DataFrame): The raw DataFrame fetched from the Alpaca API,
                                 containing asset price data (OHLCV format).
+            normalize (bool): Whether to truncate timestamps to midnight, which is
+                              the case for daily bars. Intraday bars keep their time.
 
         Returns:
             pd.DataFrame: The formatted DataFrame, adjusted to meet the project format.
@@ -96,7 +141,8 @@ class AlpacaCryptoDataProvider(DataProviderBase):
         # Normalize the datetime index to remove any time zone information, ensuring
         # consistency across different data providers (e.g., stocks vs crypto) for
         # easier cross-asset class comparisons and joins.
-        df.index = timestamp_index.tz_localize(None).normalize()
+        timestamp_index = timestamp_index.tz_localize(None)
+        df.index = timestamp_index.normalize() if normalize else timestamp_index
 
         alpaca_formatter = formatter_factory(
             index_name=Fields.Date.value,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional
 
 import pandas as pd
@@ -10,9 +11,12 @@ from pydantic import Field
 from pydantic_settings import BaseSettings
 
 from liquidity.data.format import formatter_factory
-from liquidity.data.metadata.fields import OHLCV, Fields
+from liquidity.data.metadata.fields import OHLCV, Fields, Interval
 from liquidity.data.providers.base import DataProviderBase
 
+# Number of the latest data points returned with the "compact" output size
+COMPACT_OUTPUT_SIZE = 100
+
 
 class AlphaVantageConfig(BaseSettings):
     """Configuration settings for Alpha Vantage API."""
@@ -23,26 +27,84 @@ class AlphaVantageConfig(BaseSettings):
 class AlphaVantageDataProvider(DataProviderBase):
     """Data provider class to fetch financial data from Alpha Vantage API."""
 
+    # The free tier allows only a few requests per minute
+    max_concurrency = 1
+    max_calls_per_minute = 5
+
+    # Intraday bars are timestamped in the exchange time
+    intraday_timezone = "US/Eastern"
+
     def __init__(self, api_key: Optional[str] = None) -> None:
         self.api_key = api_key or AlphaVantageConfig().api_key
         self.output_format = "pandas"
 
-    def get_prices(self, ticker: str, output_size: str = "full") -> pd.DataFrame:
+    def get_prices(
+        self,
+        ticker: str,
+        start: Optional[datetime] = None,
+        output_size: Optional[str] = None,
+    ) -> pd.DataFrame:
         """Fetches daily price data for a given ticker symbol.
 
         Args:
             ticker (str): The stock symbol (ticker) for which to retrieve price data.
+            start (datetime, optional): The first date of interest. When it is
+                recent enough, only the last 100 data points are requested.
             output_size (str, optional): The size of the call, supported values are
                 'compact' and 'full; the first returns the last 100 points in the
                 data series, and 'full' returns the full-length daily times
-                series, commonly above 1MB. Default is "full".
+                series, commonly above 1MB. Default is "full", unless the
+                `start` date is covered by the compact output.
 
         Returns:
             pd.DataFrame: A DataFrame containing the formatted OHLCV price data.
 
         """
+        if output_size is None:
+            output_size = "compact" if self._is_compact(start) else "full"
+
         client = TimeSeries(key=self.api_key, output_format="pandas")
         df, _ = client.get_daily(ticker, outputsize=output_size)
+        return self._format_prices(df)
+
+    @staticmethod
+    def _is_compact(start: Optional[datetime]) -> bool:
+        """Return if the compact output (last 100 trading days) covers the start date."""
+        if start is None:
+            return False
+        # Margin for the market holidays, which are not excluded by the business days
+        trading_days = len(pd.bdate_range(start, datetime.now())) + 10
+        return trading_days <= COMPACT_OUTPUT_SIZE
+
+    def get_intraday_prices(
+        self, ticker: str, interval: Interval, month: pd.Period
+    ) -> pd.DataFrame:
+        """Fetches intraday price bars for a given ticker symbol and month.
+
+        Alpha Vantage serves the intraday history one month per request, which
+        is used as the pagination unit for downloading long histories.
+
+        Args:
+            ticker (str): The stock symbol (ticker) for which to retrieve price data.
+            interval (Interval): The bar interval (e.g. one minute, one hour).
+            month (pd.Period): The calendar month to download.
+
+        Returns:
+            pd.DataFrame: A DataFrame containing the formatted OHLCV bars, indexed
+            by the bar timestamps in US/Eastern time.
+
+        """
+        client = TimeSeries(key=self.api_key, output_format="pandas")
+        df, _ = client.get_intraday(
+            ticker,
+            interval=interval.value,
+            outputsize="full",
+            month=month.strftime("%Y-%m"),
+        )
+        return self._format_prices(df)
+
+    @staticmethod
+    def _format_prices(df: pd.DataFrame) -> pd.DataFrame:
         av_prices_formatter = formatter_factory(
             cols_mapper={
                 "1. open": OHLCV.Open.value,
@@ -1,14 +1,42 @@
 import abc
+from datetime import datetime
 from typing import Optional
 
 import pandas as pd
 
+from liquidity.data.metadata.fields import Interval
+
 
 class DataProviderBase(abc.ABC):
+    # Maximum number of requests sent to the provider's API at the same time
+    max_concurrency: int = 4
+
+    # Maximum number of requests sent to the provider's API per minute, None if unlimited
+    max_calls_per_minute: Optional[int] = None
+
+    # Time zone of the (naive) timestamps of the intraday bars
+    intraday_timezone: str = "UTC"
+
     @abc.abstractmethod
-    def get_prices(self, ticker: str) -> pd.DataFrame:
+    def get_prices(self, ticker: str, start: Optional[datetime] = None) -> pd.DataFrame:
+        """Return daily prices, at least since `start` (full history by default).
+
+        Providers may return more data than requested, e.g. when their API
+        does not support the exact date range.
+        """
         raise NotImplementedError
 
+    def get_intraday_prices(
+        self, ticker: str, interval: Interval, month: pd.Period
+    ) -> pd.DataFrame:
+        """Return intraday bars for a single calendar month.
+
+        Intraday histories are downloaded one month (page) at a time, so that
+        callers can persist each page before requesting the next one. Not
+        abstract, providers serving only daily data do not implement it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not provide intraday prices")
+
     @abc.abstractmethod
     def get_dividends(self, ticker: str) -> pd.DataFrame:
         raise NotImplementedError
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import Optional
 
 import pandas as pd
@@ -6,6 +7,7 @@ from pydantic import Field
 from pydantic_settings import BaseSettings
 
 from liquidity.compute.cache import cache_with_persistence
+from liquidity.compute.locks import provider_limiter
 from liquidity.data.metadata.assets import get_symbol_metadata
 from liquidity.data.metadata.entities import FredEconomicData
 
@@ -17,17 +19,21 @@ class FredConfig(BaseSettings):
 
 
 class FredEconomicDataProvider:
+    # Maximum number of requests sent to the FRED API at the same time
+    max_concurrency: int = 4
+
     def __init__(self, api_key: Optional[str] = None) -> None:
         self.client = Fred(api_key=api_key or FredConfig().api_key)
 
     @cache_with_persistence
-    def get_data(self, ticker: str) -> pd.DataFrame:
-        """Return data for the ticker.
+    def get_data(self, ticker: str, start: Optional[datetime] = None) -> pd.DataFrame:
+        """Return data for the ticker, since the `start` date (the full history by default).
 
         Retrieves data from the FRED database and converts it into
         the common format for time-series in the project.
         """
-        data = self.client.get_series(ticker)
+        with provider_limiter(self):
+            data = self.client.get_series(ticker, observation_start=start)
         df = pd.DataFrame(data, columns=["Close"])
         df.index.name = "Date"
         return df
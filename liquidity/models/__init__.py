@@ -1,4 +1,6 @@
+from .parallel import ProcessPoolEvaluator
 from .price_ratio import PriceRatio
+from .screen import PairScreen
 from .yield_spread import YieldSpread
 
-__all__ = ["YieldSpread", "PriceRatio"]
+__all__ = ["YieldSpread", "PriceRatio", "PairScreen", "ProcessPoolEvaluator"]
@@ -1,12 +1,21 @@
 from datetime import datetime
-from functools import cached_property
-from typing import Dict, Optional, Tuple
+from functools import partial
+from typing import Dict, List, Mapping, Optional, Tuple
 
 import pandas as pd
 import plotly.graph_objects as go  # type: ignore
 
+from liquidity.compute.alignment import Calendar, align
+from liquidity.compute.frames import from_last_before
+from liquidity.compute.fx import FxService
+from liquidity.compute.graph import Graph, Node, default_graph, fred_node
 from liquidity.data.metadata.entities import FredEconomicData
 from liquidity.data.providers.fred import FredEconomicDataProvider
+from liquidity.visuals.downsample import DEFAULT_MAX_POINTS, downsample_frame
+from liquidity.visuals.render import scatter_type
+
+# Weekly series are carried forward to the start date from the previous weeks
+COMPONENT_LOOKBACK = pd.Timedelta(days=31)
 
 
 class GlobalLiquidity:
@@ -48,6 +57,10 @@ class GlobalLiquidity:
     with positive impacts added and negative impacts subtracted. All values are standardized
     to billions of USD.
 
+    The components are published with different frequencies (weekly and daily), they
+    are aligned on the union of their dates (by default) with the latest value of each
+    component carried forward, optionally for no longer than `max_staleness`.
+
     Visualization:
     The model displays a stacked area chart showing the individual contributions of each
     series, with the overall liquidity index overlaid in bold for clarity.
@@ -67,13 +80,9 @@ class GlobalLiquidity:
         "Treasury General Account": ("WTREGEN", -1),
     }
 
-    CURRENCY_CONVERSIONS = {
-        ("USD", "EUR"): "DEXUSEU",
-        ("JPY", "USD"): "DEXJPUS",
-    }
-
     UNIT_CONVERSION_FACTORS = {
         "Millions": 1e-3,
+        "100 Million": 0.1,
         "Billions": 1,
         "Trillions": 1e3,
     }
@@ -83,25 +92,156 @@ class GlobalLiquidity:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
         provider: Optional[FredEconomicDataProvider] = None,
+        calendar: Calendar = Calendar.Union,
+        max_staleness: Optional[pd.Timedelta] = None,
+        graph: Optional[Graph] = None,
     ) -> None:
         self.provider = provider or FredEconomicDataProvider()
         self.start_date = pd.Timestamp(start_date) if start_date else None
         self.end_date = pd.Timestamp(end_date) if end_date else None
+        self.calendar = calendar
+        self.max_staleness = max_staleness
+        self.graph = graph or default_graph()
+        self.fx = FxService(self.provider, graph=self.graph, start=self.fetch_start)
+        self._components: Optional[Dict[str, pd.DataFrame]] = None
+
+    @property
+    def fetch_start(self) -> Optional[pd.Timestamp]:
+        """Return date from which the series are fetched.
 
-    @cached_property
+        The observations preceding the start date (up to `max_staleness` or
+        `COMPONENT_LOOKBACK` before it) are fetched too, so the latest values
+        can be carried forward to the first dates of the range.
+        """
+        if self.start_date is None:
+            return None
+        return self.start_date - max(self.max_staleness or COMPONENT_LOOKBACK, COMPONENT_LOOKBACK)
+
+    @property
     def raw_data(self) -> pd.DataFrame:
         """Fetch and process all configured FRED data series."""
-        processed_series = []
+        return self.graph.evaluate(self.node())[0]
 
+    def node(self) -> Node:
+        """Return the graph node computing the aligned components.
+
+        The components and FX rates they are converted with are fetched by
+        separate nodes, concurrently, and standardized independently.
+        """
+        return Node(
+            key=(
+                type(self).__name__,
+                tuple(self.SERIES_MAPPING.items()),
+                self.start_date,
+                self.end_date,
+                self.calendar.value,
+                self.max_staleness,
+            ),
+            fn=self._combine,
+            deps=tuple(self._component_nodes()),
+            persist=True,
+        )
+
+    def _component_nodes(self) -> List[Node]:
+        """Return nodes computing the standardized components, in SERIES_MAPPING order."""
+        nodes = []
         for name, (ticker, sign) in self.SERIES_MAPPING.items():
-            df = self.provider.get_data(ticker).rename(columns={"Close": name})
             metadata = self.provider.get_metadata(ticker)
-            df = self._standardize_series(df, name, metadata)
-            df[name] *= sign
-            processed_series.append(self._filter_date_range(df))
+            # FX rates are dependencies only to be fetched along with the components,
+            # the conversion reads them from the graph through the FX service.
+            tickers = [ticker, *self.fx.tickers([metadata.currency])]
+            deps = [fred_node(self.provider, t, self.fetch_start) for t in tickers]
+
+            nodes.append(
+                Node(
+                    key=(type(self).__name__, "component", name, ticker, sign),
+                    fn=partial(self._standardize_component, name, ticker, sign),
+                    deps=tuple(deps),
+                )
+            )
+        return nodes
+
+    def _standardize_component(
+        self,
+        name: str,
+        ticker: str,
+        sign: int,
+        data: pd.DataFrame,
+        *_: pd.DataFrame,
+    ) -> pd.DataFrame:
+        """Return component in Billions of USD, with the sign of its liquidity impact."""
+        df = data.rename(columns={"Close": name})
+        metadata = self.provider.get_metadata(ticker)
+        df = self._standardize_series(df, name, metadata)
+        df[name] *= sign
+        return df.dropna()
+
+    def _combine(self, *components: pd.DataFrame) -> pd.DataFrame:
+        """Align the standardized components on a shared calendar."""
+        combined = align(components, calendar=self.calendar, max_staleness=self.max_staleness)
+        return self._filter_date_range(combined).dropna()
+
+    @property
+    def components(self) -> Dict[str, pd.DataFrame]:
+        """Return the standardized components, by name."""
+        if self._components is None:
+            results = self.graph.evaluate(*self._component_nodes())
+            self._components = dict(zip(self.SERIES_MAPPING, results))
+        return self._components
+
+    def update(self, observations: Mapping[str, pd.DataFrame]) -> pd.DataFrame:
+        """Add new observations of the components and recompute only the affected tail.
+
+        The aligned value on each date depends only on the observations at or
+        before it, so the combined frame is kept as it is up to the earliest
+        new observation, and only the rows from that date on are realigned,
+        using the last earlier observation of each component as the starting
+        point. Observations for dates already present replace the old values
+        (e.g. revisions).
+
+        Args:
+            observations (Mapping[str, pd.DataFrame]): New data of the
+                components by FRED ticker, in the `FredEconomicDataProvider`
+                format (a "Close" column indexed by date).
+
+        Returns:
+            pd.DataFrame: The updated liquidity data, also available as `df`.
+
+        """
+        names = {ticker: name for name, (ticker, _) in self.SERIES_MAPPING.items()}
+        observations = {ticker: new for ticker, new in observations.items() if not new.empty}
+        if not observations:
+            return self.df
+
+        components = dict(self.components)
+        for ticker, new in observations.items():
+            if ticker not in names:
+                raise KeyError(f"{ticker} is not a component of the model")
+
+            name = names[ticker]
+            sign = self.SERIES_MAPPING[name][1]
+            merged = pd.concat(
+                [components[name], self._standardize_component(name, ticker, sign, new)]
+            )
+            components[name] = merged[~merged.index.duplicated(keep="last")].sort_index()
+
+        start = min(new.index.min() for new in observations.values())
+        tail = align(
+            [from_last_before(df, start) for df in components.values()],
+            calendar=self.calendar,
+            max_staleness=self.max_staleness,
+            start=start,
+        )
+        tail = self._filter_date_range(tail).dropna() if not tail.empty else tail
+        tail["Liquidity Index"] = tail.sum(axis=1)
 
-        combined = pd.concat(processed_series, axis=1).ffill().dropna()
-        return combined
+        df, raw_data = self.df, self.raw_data
+        self._components = components
+        self.graph.put(
+            self.node(), pd.concat([raw_data.loc[raw_data.index < start], tail.iloc[:, :-1]])
+        )
+        self.graph.put(self._index_node(), pd.concat([df.loc[df.index < start], tail]))
+        return self.df
 
     def _standardize_series(
         self, df: pd.DataFrame, column: str, metadata: FredEconomicData
@@ -117,29 +257,15 @@ class GlobalLiquidity:
         if currency_from == currency_to:
             return df
 
-        # Check direct or inverse conversion series
-        pair = (currency_from, currency_to)
-        inverse_pair = (currency_to, currency_from)
-
-        if pair in self.CURRENCY_CONVERSIONS:
-            fx_series = self.provider.get_data(self.CURRENCY_CONVERSIONS[pair])
-            fx_rate = fx_series["Close"]
-        elif inverse_pair in self.CURRENCY_CONVERSIONS:
-            fx_series = self.provider.get_data(self.CURRENCY_CONVERSIONS[inverse_pair])
-            fx_rate = 1 / fx_series["Close"]
-        else:
-            raise ValueError(
-                f"Currency conversion from {currency_from} to {currency_to} not supported"
-            )
-
-        # Align FX rates to the data by exact dates only
-        aligned_fx = fx_rate[df.index.intersection(fx_rate.index)]
-
-        # Reduce data to matching dates only
-        df = df.loc[aligned_fx.index].copy()
-        df[column] = df[column] / aligned_fx
+        df = df.copy()
+        df[column] = self.fx.convert(df[[column]], currency_from, currency_to)[column]
 
-        return df
+        # Drop dates without a recent enough FX rate, the dates are no longer regular then
+        valid = df[column].notna()
+        if valid.all():
+            return df
+        df = df.loc[valid]
+        return df.set_axis(pd.DatetimeIndex(df.index, freq=None), axis=0)
 
     def _filter_date_range(self, df: pd.DataFrame) -> pd.DataFrame:
         if not isinstance(df.index, pd.DatetimeIndex):
@@ -157,39 +283,78 @@ class GlobalLiquidity:
             pd.DataFrame: Original series + computed 'Liquidity Index' column.
 
         """
-        df = self.raw_data.copy()
+        return self._with_index(self.raw_data)
+
+    @staticmethod
+    def _with_index(raw_data: pd.DataFrame) -> pd.DataFrame:
+        df = raw_data.copy()
         df["Liquidity Index"] = df.sum(axis=1)
         return df
 
-    @cached_property
+    def _index_node(self) -> Node:
+        node = self.node()
+        return Node(key=(*node.key, "Liquidity Index"), fn=self._with_index, deps=(node,))
+
+    @property
     def df(self) -> pd.DataFrame:
         """Returns the complete liquidity data with computed index."""
-        return self.liquidity_index
+        return self.graph.evaluate(self._index_node())[0]
 
-    def show(self) -> None:
-        """Plot stacked area chart of liquidity components along with
+    def generate_figure(
+        self, max_points: Optional[int] = DEFAULT_MAX_POINTS, webgl: Optional[bool] = None
+    ) -> go.Figure:
+        """Return stacked area chart of liquidity components along with
         the combined liquidity index.
+
+        Args:
+            max_points (int, optional): Number of dates plotted, selected with
+                LTTB on the index (so the stacked components share the dates)
+                when there are more of them, None to plot all of them.
+            webgl (bool, optional): Whether to render with WebGL, by default
+                only when many points are plotted (see `scatter_type`).
+
         """
+        df = downsample_frame(self.df, "Liquidity Index", max_points)
+        components = list(self.SERIES_MAPPING.keys())
+        scatter = scatter_type(len(df) * (len(components) + 1), webgl)
         fig = go.Figure()
 
         # Stacked area chart for components
-        for column in self.SERIES_MAPPING.keys():
-            fig.add_trace(
-                go.Scatter(
-                    x=self.df.index,
-                    y=self.df[column],
-                    mode="lines",
-                    stackgroup="one",
-                    name=column,
-                    line=dict(width=0.5),
+        if scatter is go.Scatter:
+            for column in components:
+                fig.add_trace(
+                    go.Scatter(
+                        x=df.index,
+                        y=df[column],
+                        mode="lines",
+                        stackgroup="one",
+                        name=column,
+                        line=dict(width=0.5),
+                    )
+                )
+        else:
+            # WebGL traces do not support stack groups, the areas are filled
+            # between the cumulative sums and hover shows the component values
+            stacked = df[components].cumsum(axis=1)
+            for position, column in enumerate(components):
+                fig.add_trace(
+                    go.Scattergl(
+                        x=df.index,
+                        y=stacked[column],
+                        customdata=df[column],
+                        hovertemplate="%{customdata}",
+                        mode="lines",
+                        fill="tonexty" if position else "tozeroy",
+                        name=column,
+                        line=dict(width=0.5),
+                    )
                 )
-            )
 
         # Main liquidity index with red color and thicker line
         fig.add_trace(
-            go.Scatter(
-                x=self.df.index,
-                y=self.df["Liquidity Index"],
+            scatter(
+                x=df.index,
+                y=df["Liquidity Index"],
                 mode="lines",
                 name="Liquidity Index",
                 line=dict(width=3, color="black"),
@@ -205,5 +370,12 @@ class GlobalLiquidity:
             hovermode="x",
             showlegend=True,
         )
+        return fig
 
-        fig.show()
+    def show(
+        self, max_points: Optional[int] = DEFAULT_MAX_POINTS, webgl: Optional[bool] = None
+    ) -> None:
+        """Plot stacked area chart of liquidity components along with
+        the combined liquidity index, see `generate_figure`.
+        """
+        self.generate_figure(max_points, webgl).show()
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import contextlib
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+from liquidity.compute.alignment import Calendar
+from liquidity.compute.frames import select_dates
+from liquidity.compute.graph import Graph, Node, default_graph, ticker_node
+from liquidity.compute.shared import SharedFrame, detach
+from liquidity.compute.utils.yields import compute_dividend_yield
+from liquidity.data.metadata.fields import OHLCV
+from liquidity.models.price_ratio import PriceRatio, compute_price_ratio
+from liquidity.models.yield_spread import YieldSpread, compute_yield_spread
+
+PairModel = Union[PriceRatio, YieldSpread]
+
+# Leg of a pair: either the frame the model aligns (prices or treasury yields),
+# or the close prices and TTM dividends the dividend yields are computed from.
+Leg = Tuple[SharedFrame, ...]
+
+# Number of chunks per worker, smaller chunks balance the load between workers
+# at the cost of more round trips.
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass(frozen=True)
+class ModelSpec:
+    """Picklable description of a pair model evaluated in a worker process.
+
+    Holds the symbols, the parameters of the model and the shared memory
+    handles of its inputs, so no frames, tickers or provider clients are
+    pickled when it is sent to the workers.
+    """
+
+    fn: Callable[..., pd.DataFrame]
+    ticker: str
+    benchmark: str
+    calendar: Calendar
+    max_staleness: Optional[pd.Timedelta]
+    start: Optional[datetime]
+    legs: Tuple[Leg, Leg]
+
+
+class ProcessPoolEvaluator:
+    """Evaluates many `PriceRatio` and `YieldSpread` models in a process pool.
+
+    The models of a large universe are CPU bound (alignment, dividend yields)
+    and evaluated one at a time when run in threads. The evaluator fetches
+    the distinct inputs of all the models once in the parent process (with
+    the graph, so the data is read through the tickers' caches), copies them
+    to shared memory blocks and partitions the models across the worker
+    processes, which attach to the blocks and compute the dividend yields,
+    spreads and ratios.
+
+    Attributes
+    ----------
+    max_workers : int, optional
+        Number of worker processes, the number of CPUs by default.
+    graph : Graph
+        Dependency graph in which the inputs are fetched.
+    mp_context : multiprocessing context, optional
+        Start method of the workers, e.g. ``multiprocessing.get_context("spawn")``.
+
+    Examples
+    --------
+    >>> models = [YieldSpread(symbol, "UST-10Y") for symbol in universe]
+    >>> spreads = ProcessPoolEvaluator().evaluate(models)  # same as [m.df for m in models]
+
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        graph: Optional[Graph] = None,
+        mp_context: Optional[multiprocessing.context.BaseContext] = None,
+    ) -> None:
+        self.max_workers = max_workers or multiprocessing.cpu_count()
+        self.graph = graph or default_graph()
+        self.mp_context = mp_context
+
+    def evaluate(self, models: Sequence[PairModel]) -> List[pd.DataFrame]:
+        """Return the data of the models, in the order of the models.
+
+        Raises:
+            ValueError: If a model is computed from a panel, panels are
+                aligned in memory and evaluated with `PairScreen` instead.
+
+        """
+        legs = [self._legs(model) for model in models]
+        nodes = list({node.key: node for leg in legs for pair in leg for node in pair}.values())
+        frames = dict(zip((node.key for node in nodes), self.graph.evaluate(*nodes)))
+
+        blocks: List[SharedMemory] = []
+        try:
+            handles: Dict[object, SharedFrame] = {}
+            for key, df in frames.items():
+                handles[key], shm = SharedFrame.create(df)
+                blocks.append(shm)
+
+            specs = [
+                self._spec(model, (_handles(first, handles), _handles(second, handles)))
+                for model, (first, second) in zip(models, legs)
+            ]
+            return self._submit(specs)
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+    def _submit(self, specs: List[ModelSpec]) -> List[pd.DataFrame]:
+        if not specs:
+            return []
+
+        workers = min(self.max_workers, len(specs))
+        size = math.ceil(len(specs) / (workers * CHUNKS_PER_WORKER))
+        chunks = [specs[i : i + size] for i in range(0, len(specs), size)]
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=self.mp_context) as pool:
+            return [df for result in pool.map(evaluate_specs, chunks) for df in result]
+
+    @staticmethod
+    def _legs(model: PairModel) -> Tuple[Tuple[Node, ...], Tuple[Node, ...]]:
+        """Return nodes of the inputs of both legs of the model."""
+        if model.panel is not None:
+            raise ValueError("Models computed from a panel cannot be evaluated in processes")
+
+        start, end = model.start_date, model.end_date
+        if isinstance(model, PriceRatio):
+            return (
+                (ticker_node(model.ticker, "prices", start, end, [OHLCV.Close]),),
+                (ticker_node(model.benchmark, "prices", start, end, [OHLCV.Close]),),
+            )
+
+        # Non-treasury yields depend on prices and dividends, which are sent
+        # to the workers instead, so the dividend yields are computed there
+        ticker, benchmark = (
+            ticker_node(t, "yields", start, end) for t in (model.ticker, model.benchmark)
+        )
+        return ticker.deps or (ticker,), benchmark.deps or (benchmark,)
+
+    @staticmethod
+    def _spec(model: PairModel, legs: Tuple[Leg, Leg]) -> ModelSpec:
+        return ModelSpec(
+            fn=compute_price_ratio if isinstance(model, PriceRatio) else compute_yield_spread,
+            ticker=model.ticker.symbol,
+            benchmark=model.benchmark.symbol,
+            calendar=model.calendar,
+            max_staleness=model.max_staleness,
+            start=model.start_date,
+            legs=legs,
+        )
+
+
+def _handles(nodes: Tuple[Node, ...], handles: Dict[object, SharedFrame]) -> Leg:
+    return tuple(handles[node.key] for node in nodes)
+
+
+def evaluate_specs(specs: List[ModelSpec]) -> List[pd.DataFrame]:
+    """Evaluate the models in a worker process, reading the inputs from shared memory.
+
+    Inputs shared by several models of the chunk (e.g. the benchmark) are
+    attached, and their dividend yields computed, only once.
+    """
+    frames: Dict[str, pd.DataFrame] = {}
+    blocks: List[SharedMemory] = []
+    yields: Dict[Tuple[Leg, Optional[datetime]], pd.DataFrame] = {}
+
+    def read(handle: SharedFrame) -> pd.DataFrame:
+        if handle.name not in frames:
+            frames[handle.name], shm = handle.attach()
+            blocks.append(shm)
+        return frames[handle.name]
+
+    def leg(spec: ModelSpec, handles: Leg) -> pd.DataFrame:
+        if len(handles) == 1:
+            return read(handles[0])
+        key = (handles, spec.start)
+        if key not in yields:
+            prices, dividends = (read(handle) for handle in handles)
+            yields[key] = select_dates(compute_dividend_yield(prices, dividends), spec.start)
+        return yields[key]
+
+    try:
+        return [
+            detach(
+                spec.fn(
+                    leg(spec, spec.legs[0]),
+                    leg(spec, spec.legs[1]),
+                    spec.ticker,
+                    spec.benchmark,
+                    calendar=spec.calendar,
+                    max_staleness=spec.max_staleness,
+                    start=spec.start,
+                )
+            )
+            for spec in specs
+        ]
+    finally:
+        frames.clear()
+        yields.clear()
+        for shm in blocks:
+            # Views of the block may outlive the frames, it is closed on exit then
+            with contextlib.suppress(BufferError):
+                shm.close()
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from functools import cached_property
+from datetime import datetime
+from typing import Iterator, Optional
 
-import numpy as np
 import pandas as pd
 
+from liquidity.compute import kernels
+from liquidity.compute.alignment import Calendar, align
+from liquidity.compute.frames import count_before, from_last_before, select_dates
+from liquidity.compute.graph import Graph, Node, default_graph, ticker_node
+from liquidity.compute.kernels import FloatArray
+from liquidity.compute.panel import Panel
+from liquidity.compute.streaming import calendar_join, stream_join, write_chunks
 from liquidity.compute.ticker import Ticker
+from liquidity.data.metadata.fields import OHLCV, Interval
 from liquidity.visuals import Chart
 
 
@@ -23,6 +31,23 @@ class PriceRatio:
         The financial instrument for which the price ratio is calculated.
     benchmark : Ticker
         The benchmark financial instrument used for comparison.
+    panel : Panel, optional
+        Pre-aligned close prices shared between models. When provided, the
+        prices are taken from the panel instead of the tickers.
+    calendar : Calendar
+        Dates on which the ratio is computed. By default, only the dates on
+        which both instruments are quoted, e.g. 5-day equity vs 7-day crypto
+        week gives the trading days only.
+    max_staleness : pd.Timedelta, optional
+        For calendars with dates missing in one of the series (e.g. trading
+        days for crypto vs equities), the latest price is carried forward for
+        at most this long.
+    graph : Graph
+        Dependency graph in which the ratio is evaluated. Models sharing a
+        graph compute their common inputs (e.g. benchmark prices) only once.
+    start_date, end_date : pd.Timestamp, optional
+        Date range of the computed series, only the prices in this range are
+        read from the cache or requested from the data provider.
 
     Methods
     -------
@@ -34,6 +59,10 @@ class PriceRatio:
         Generates and displays an interactive Plotly chart to visualize
         the price ratio over time.
 
+    stream(interval, start, end):
+        Computes the ratio from intraday bars chunk by chunk in bounded
+        memory, writing the results to disk.
+
     Examples
     --------
     Calculate and visualize the price ratio between two assets:
@@ -64,29 +93,180 @@ class PriceRatio:
 
     series_name = "Ratio"
 
-    def __init__(self, ticker: str, benchmark: str = "SPY") -> None:
+    def __init__(
+        self,
+        ticker: str,
+        benchmark: str = "SPY",
+        panel: Optional[Panel] = None,
+        calendar: Calendar = Calendar.Intersection,
+        max_staleness: Optional[pd.Timedelta] = None,
+        graph: Optional[Graph] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> None:
         self.ticker = Ticker.for_symbol(ticker)
         self.benchmark = Ticker.for_symbol(benchmark)
+        self.panel = panel
+        self.calendar = calendar
+        self.max_staleness = max_staleness
+        self.graph = graph or default_graph()
+        self.start_date = pd.Timestamp(start_date) if start_date else None
+        self.end_date = pd.Timestamp(end_date) if end_date else None
 
-    @cached_property
+    @property
     def df(self) -> pd.DataFrame:
         """Returns a pandas DataFrame containing the time series of prices
         for both instruments and their computed ratio.
         """
-        ticker = self.ticker.prices.dropna()
-        benchmark = self.benchmark.prices.dropna()
+        return self.graph.evaluate(self.node())[0]
+
+    def node(self) -> Node:
+        """Return the graph node computing the price ratio."""
+        return Node(
+            key=(
+                self.series_name,
+                self.ticker.symbol,
+                self.benchmark.symbol,
+                self.calendar.value,
+                self.max_staleness,
+                self.panel.token if self.panel is not None else None,
+                self.start_date,
+                self.end_date,
+            ),
+            fn=self._evaluate,
+            persist=self.panel is None,
+            deps=(self._prices_node(self.ticker), self._prices_node(self.benchmark)),
+        )
+
+    def _prices_node(self, ticker: Ticker) -> Node:
+        if self.panel is None:
+            # Only the close prices are joined, the other OHLCV columns are never read
+            return ticker_node(ticker, "prices", self.start_date, self.end_date, [OHLCV.Close])
+
+        panel, start, end = self.panel, self.start_date, self.end_date
+        return Node(
+            key=(ticker.symbol, "prices", panel.token, start, end),
+            fn=lambda: select_dates(
+                panel.series(OHLCV.Close, ticker.symbol).to_frame(OHLCV.Close.value), start, end
+            ),
+        )
+
+    def _evaluate(
+        self,
+        ticker_prices: pd.DataFrame,
+        benchmark_prices: pd.DataFrame,
+        start: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Align prices of both instruments and compute their ratio."""
+        return compute_price_ratio(
+            ticker_prices,
+            benchmark_prices,
+            self.ticker.symbol,
+            self.benchmark.symbol,
+            calendar=self.calendar,
+            max_staleness=self.max_staleness,
+            start=start,
+        )
+
+    def update(self) -> pd.DataFrame:
+        """Append the ratio for the prices the instruments gained since the last evaluation.
+
+        New prices are read through the tickers (e.g. after `Ticker.update`),
+        only the new dates are aligned and computed, with the prices of the
+        last earlier dates carried forward to them, so the result is the same
+        as when computed from scratch. The updated prices and ratio are
+        memoized in the graph, so they are not recomputed on the next access.
+
+        Only appended prices are picked up, call `invalidate` when the history
+        was revised.
+
+        Returns:
+            pd.DataFrame: The updated ratio, also available as `df`.
+
+        """
+        node = self.node()
+        df = self.df
+        legs = self.graph.evaluate(*node.deps)
 
-        prices = ticker.join(
-            benchmark,
-            lsuffix=self.ticker.symbol,
-            rsuffix=self.benchmark.symbol,
-        ).dropna()
+        new = [
+            self._new_prices(ticker, leg)
+            for ticker, leg in zip((self.ticker, self.benchmark), legs)
+        ]
+        if all(rows.empty for rows in new):
+            return df
 
-        def ratio_formula(row: pd.Series[np.float64]) -> np.float64:
-            return row[f"Close{self.ticker.symbol}"] / row[f"Close{self.benchmark.symbol}"]
+        start = min(rows.index[0] for rows in new if not rows.empty)
+        legs = [pd.concat([leg, rows]) for leg, rows in zip(legs, new)]
+        ticker_tail, benchmark_tail = (from_last_before(leg, start) for leg in legs)
+        tail = self._evaluate(ticker_tail, benchmark_tail, start=start)
+        df = pd.concat([df.iloc[: count_before(df.index, start)], tail])
 
-        prices[self.series_name] = prices.apply(ratio_formula, axis=1)
-        return prices
+        for dep, leg in zip(node.deps, legs):
+            self.graph.put(dep, leg)
+        self.graph.put(node, df)
+        return self.df
+
+    def _new_prices(self, ticker: Ticker, prices: pd.DataFrame) -> pd.DataFrame:
+        """Return prices of the ticker after the last of the given ones."""
+        if self.panel is not None:
+            return prices.iloc[:0]  # panels are not appended to
+
+        last = prices.index[-1] if len(prices) else self.start_date
+        new = ticker.get_prices(last, self.end_date, columns=[OHLCV.Close])
+        return new.iloc[count_before(new.index, last, inclusive=True) :] if last else new
+
+    def invalidate(self) -> None:
+        """Drop the memoized ratio and prices, they are read again on the next access.
+
+        Required after the history of the prices was revised, e.g. with
+        corrected quotes, as `update` only appends the new dates.
+        """
+        self.graph.invalidate_all(self.node())
+
+    def _compute(self, prices: pd.DataFrame) -> FloatArray:
+        """Return the ratio of the ticker and benchmark close prices."""
+        return kernels.ratio(
+            prices[f"Close{self.ticker.symbol}"], prices[f"Close{self.benchmark.symbol}"]
+        )
+
+    def _iter_closes(
+        self, ticker: Ticker, interval: Interval, start: datetime, end: Optional[datetime]
+    ) -> Iterator[pd.DataFrame]:
+        for chunk in ticker.iter_intraday_prices(interval, start, end, [OHLCV.Close]):
+            yield chunk.rename(columns={OHLCV.Close.value: f"Close{ticker.symbol}"})
+
+    def stream(self, interval: Interval, start: datetime, end: Optional[datetime] = None) -> str:
+        """Compute the price ratio from intraday bars in bounded memory.
+
+        Both legs are read from the partitioned store month by month, joined
+        on the model's calendar (with its `max_staleness`) and divided chunk by
+        chunk, and the results are written back to the store, so multi-year
+        minute-level histories never have to fit in memory.
+
+        Returns:
+            str: Name under which the result is stored, read it with
+            ``self.ticker.store.read(name, interval, start, end)``.
+
+        Raises:
+            ValueError: If the calendar cannot be streamed, see `calendar_join`.
+
+        """
+        how = calendar_join(self.calendar)
+        for ticker in (self.ticker, self.benchmark):
+            ticker.download_intraday(interval, start, end)
+
+        def compute() -> Iterator[pd.DataFrame]:
+            for chunk in stream_join(
+                self._iter_closes(self.ticker, interval, start, end),
+                self._iter_closes(self.benchmark, interval, start, end),
+                how=how,
+                tolerance=self.max_staleness,
+            ):
+                chunk[self.series_name] = self._compute(chunk)
+                yield chunk
+
+        name = f"{self.ticker.symbol}-{self.benchmark.symbol}-{self.series_name}"
+        return write_chunks(self.ticker.store, name, interval, compute())
 
     def get_chart(self) -> Chart:
         """Generate a chart visualizing the price ratio over time.
@@ -109,3 +289,33 @@ class PriceRatio:
     def show(self) -> None:
         """Generate and display a chart visualizing the price ratio over time."""
         self.get_chart().show()
+
+
+def compute_price_ratio(
+    ticker_prices: pd.DataFrame,
+    benchmark_prices: pd.DataFrame,
+    ticker: str,
+    benchmark: str,
+    calendar: Calendar = Calendar.Intersection,
+    max_staleness: Optional[pd.Timedelta] = None,
+    start: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Align prices of the instruments (from `start`) and compute their ratio.
+
+    Depends on the data and symbols only, so it can be evaluated anywhere,
+    e.g. in worker processes (see `ProcessPoolEvaluator`).
+    """
+    prices = align(
+        [
+            ticker_prices.dropna().add_suffix(ticker),
+            benchmark_prices.dropna().add_suffix(benchmark),
+        ],
+        calendar=calendar,
+        max_staleness=max_staleness,
+        start=start,
+    ).dropna()
+
+    prices[PriceRatio.series_name] = kernels.ratio(
+        prices[f"Close{ticker}"], prices[f"Close{benchmark}"]
+    )
+    return prices
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from liquidity.compute import kernels
+from liquidity.compute.kernels import FloatArray
+from liquidity.compute.panel import Panel
+from liquidity.data.metadata.fields import OHLCV, Fields
+
+
+class PairScreen:
+    """Computes price ratios and yield spreads for all pairs of a universe at once.
+
+    Instead of joining the data of every pair separately (as `PriceRatio` and
+    `YieldSpread` do), the data of all symbols is aligned once in a `Panel`
+    and the series of all pairs are computed in a single vectorized pass by
+    broadcasting the (dates x tickers) array against the (dates x benchmarks)
+    array.
+
+    Attributes
+    ----------
+    symbols : list of str
+        The instruments for which the ratios and spreads are calculated.
+    benchmarks : list of str
+        The instruments used for comparison. By default, every symbol is
+        compared with every other symbol (N x N screen).
+    panel : Panel, optional
+        Pre-aligned data of all the symbols and benchmarks. When missing, it is
+        loaded on first use with the field required by the computation.
+
+    Examples
+    --------
+    >>> screen = PairScreen(["QQQ", "SPY", "BTC", "ETH"])
+    >>> screen.ratios()  # columns indexed by (Ticker, Benchmark) pairs
+    >>> screen.latest("Ratio").head()
+                          Date     Ratio  Rank
+    Ticker Benchmark
+    BTC    SPY      2024-12-31  157.2600     1
+    ...
+
+    Screening against selected benchmarks only:
+
+    >>> screen = PairScreen(["HYG", "LQD"], benchmarks=["UST-10Y"])
+    >>> screen.spreads()
+
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        benchmarks: Optional[Sequence[str]] = None,
+        panel: Optional[Panel] = None,
+    ) -> None:
+        self.symbols = list(symbols)
+        self.benchmarks = list(benchmarks) if benchmarks is not None else list(symbols)
+        self._panels = {field: panel for field in panel.fields} if panel is not None else {}
+
+    @property
+    def universe(self) -> List[str]:
+        """Return all the distinct symbols and benchmarks."""
+        return list(dict.fromkeys(self.symbols + self.benchmarks))
+
+    def get_panel(self, field: str) -> Panel:
+        """Return panel holding the field for the whole universe."""
+        if field not in self._panels:
+            self._panels[field] = Panel.from_symbols(self.universe, fields=[field])
+        return self._panels[field]
+
+    def _columns(self) -> pd.MultiIndex:
+        return pd.MultiIndex.from_product(
+            [self.symbols, self.benchmarks], names=["Ticker", "Benchmark"]
+        )
+
+    def _to_frame(self, values: FloatArray, index: pd.DatetimeIndex) -> pd.DataFrame:
+        """Return (dates x tickers x benchmarks) array as frame with a column per pair."""
+        df = pd.DataFrame(
+            values.reshape(len(index), -1),
+            index=index,
+            columns=self._columns(),
+        )
+        # Drop meaningless pairs of a symbol with itself
+        keep = df.columns.get_level_values(0) != df.columns.get_level_values(1)
+        return df.loc[:, keep]
+
+    def _broadcast(
+        self,
+        tickers: FloatArray,
+        benchmarks: FloatArray,
+        formula: Callable[[FloatArray, FloatArray], FloatArray],
+    ) -> FloatArray:
+        """Apply formula to all pairs of (dates x tickers) and (dates x benchmarks)."""
+        return formula(tickers[:, :, np.newaxis], benchmarks[:, np.newaxis, :])
+
+    @cached_property
+    def _ratios(self) -> pd.DataFrame:
+        panel = self.get_panel(OHLCV.Close)
+        prices = panel.frame(OHLCV.Close, self.universe).to_numpy()
+        positions = {symbol: pos for pos, symbol in enumerate(self.universe)}
+
+        values = self._broadcast(
+            prices[:, [positions[s] for s in self.symbols]],
+            prices[:, [positions[s] for s in self.benchmarks]],
+            kernels.ratio,
+        )
+        return self._to_frame(values, panel.index)
+
+    @cached_property
+    def _spreads(self) -> pd.DataFrame:
+        panel = self.get_panel(Fields.Yield)
+        yields = panel.frame(Fields.Yield, self.universe).to_numpy()
+        positions = {symbol: pos for pos, symbol in enumerate(self.universe)}
+
+        # Benchmark yields are carried forward to the dates of the ticker,
+        # ticker yields are used only on the dates they were observed.
+        benchmarks = kernels.ffill(yields[:, [positions[s] for s in self.benchmarks]])
+        values = self._broadcast(
+            yields[:, [positions[s] for s in self.symbols]],
+            benchmarks,
+            kernels.spread,
+        )
+        return self._to_frame(values, panel.index)
+
+    def ratios(self) -> pd.DataFrame:
+        """Return price ratio time series of all pairs, a column per (ticker, benchmark)."""
+        return self._ratios
+
+    def spreads(self) -> pd.DataFrame:
+        """Return yield spread time series of all pairs, a column per (ticker, benchmark)."""
+        return self._spreads
+
+    def latest(self, series_name: str = "Ratio", ascending: bool = False) -> pd.DataFrame:
+        """Return the latest value of every pair, ranked.
+
+        Args:
+            series_name (str): Either "Ratio" or "Spread".
+            ascending (bool): Rank the lowest values first, by default the
+                highest values are ranked first.
+
+        Returns:
+            pd.DataFrame: The date and value of the latest observation of each
+            pair, along with its rank, indexed by (ticker, benchmark).
+
+        """
+        if series_name == Fields.Ratio:
+            df = self.ratios()
+        elif series_name == Fields.Spread:
+            df = self.spreads()
+        else:
+            raise ValueError(f"Unsupported series: {series_name}")
+
+        values = df.to_numpy()
+        valid = ~np.isnan(values)
+        last = len(values) - 1 - np.argmax(valid[::-1], axis=0)
+        has_data = valid.any(axis=0)
+
+        latest = pd.DataFrame(
+            {
+                Fields.Date.value: df.index[last[has_data]],
+                series_name: values[last[has_data], np.flatnonzero(has_data)],
+            },
+            index=df.columns[has_data],
+        )
+        latest = latest.sort_values(series_name, ascending=ascending)
+        latest["Rank"] = np.arange(1, len(latest) + 1)
+        return latest
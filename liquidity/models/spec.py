@@ -0,0 +1,217 @@
+import json
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import tomllib
+
+from liquidity.compute.alignment import Calendar, align
+from liquidity.compute.fx import FxService
+from liquidity.compute.graph import Graph, Node, default_graph, fred_node
+from liquidity.compute.kernels import FloatArray
+from liquidity.data.providers.fred import FredEconomicDataProvider
+from liquidity.models.liquidity import GlobalLiquidity
+
+LIQUIDITY_INDEX = "Liquidity Index"
+
+
+@dataclass(frozen=True)
+class Component:
+    """A single component of a liquidity model, e.g. a central bank balance sheet.
+
+    Attributes:
+        name (str): Name of the component, used as the column name.
+        ticker (str): FRED series of the component.
+        sign (int): Impact on liquidity, 1 for positive and -1 for negative.
+        unit (str, optional): Unit of the series, by default the one from the
+            series metadata, e.g. "Millions".
+        currency (str, optional): Currency of the series, by default the one
+            from the series metadata.
+
+    """
+
+    name: str
+    ticker: str
+    sign: int = 1
+    unit: Optional[str] = None
+    currency: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.sign not in (1, -1):
+            raise ValueError(f"Sign of {self.name} has to be 1 or -1, got {self.sign}")
+
+
+@dataclass(frozen=True)
+class LiquiditySpec:
+    """Declarative specification of a liquidity model.
+
+    Specs can be defined in code or loaded from TOML or JSON files, e.g.:
+
+    .. code-block:: toml
+
+        name = "Fed and BoJ"
+        frequency = "W-FRI"
+        max_staleness = "14D"
+
+        [[components]]
+        name = "Fed Balance Sheet"
+        ticker = "WALCL"
+
+        [[components]]
+        name = "Treasury General Account"
+        ticker = "WTREGEN"
+        sign = -1
+
+        [[components]]
+        name = "BoJ Balance Sheet"
+        ticker = "JPNASSETS"
+
+    Attributes:
+        name (str): Name of the model.
+        components (tuple): Components summed up into the liquidity index.
+        frequency (Calendar): Target calendar on which the components are
+            aligned, by default the union of their dates.
+        max_staleness (pd.Timedelta, optional): Maximum age of the component
+            values carried forward to the target dates.
+
+    """
+
+    name: str
+    components: Tuple[Component, ...]
+    frequency: Calendar = Calendar.Union
+    max_staleness: Optional[pd.Timedelta] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "LiquiditySpec":
+        """Build spec from a dictionary, in the format of the spec files."""
+        staleness = data.get("max_staleness")
+        return cls(
+            name=data["name"],
+            components=tuple(Component(**component) for component in data["components"]),
+            frequency=Calendar(data.get("frequency", Calendar.Union.value)),
+            max_staleness=pd.Timedelta(staleness) if staleness is not None else None,
+        )
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "LiquiditySpec":
+        """Load spec from a TOML or JSON file."""
+        path = Path(path)
+        if path.suffix == ".toml":
+            data = tomllib.loads(path.read_text())
+        elif path.suffix == ".json":
+            data = json.loads(path.read_text())
+        else:
+            raise ValueError(f"Unsupported spec file format: {path.suffix}")
+        return cls.from_dict(data)
+
+    @classmethod
+    def from_mapping(cls, name: str, mapping: Mapping[str, Tuple[str, int]]) -> "LiquiditySpec":
+        """Build spec from ``{component name: (ticker, sign)}`` mapping."""
+        components = tuple(
+            Component(name=component, ticker=ticker, sign=sign)
+            for component, (ticker, sign) in mapping.items()
+        )
+        return cls(name=name, components=components)
+
+
+GLOBAL = LiquiditySpec.from_mapping("Global", GlobalLiquidity.SERIES_MAPPING)
+
+FED = LiquiditySpec(
+    name="Fed",
+    components=tuple(c for c in GLOBAL.components if c.ticker != "ECBASSETSW"),
+)
+
+G3 = LiquiditySpec(
+    name="G3",
+    components=GLOBAL.components + (Component(name="BoJ Balance Sheet", ticker="JPNASSETS"),),
+)
+
+BUILTIN_SPECS: Dict[str, LiquiditySpec] = {spec.name: spec for spec in (FED, GLOBAL, G3)}
+
+
+class LiquidityEngine:
+    """Evaluates many liquidity model specs side by side.
+
+    All the FRED series required by the specs (FX rates included) are fetched
+    once, concurrently, as nodes of a shared dependency graph. Each spec is
+    then computed by aligning its components on the target calendar in a
+    single pass, and converting all of them to Billions of USD with a single
+    array operation, using the latest FX rates known on each date.
+
+    Examples
+    --------
+    >>> engine = LiquidityEngine()
+    >>> engine.compare(BUILTIN_SPECS.values())  # a column per spec
+    >>> engine.evaluate(LiquiditySpec.from_file("specs/g3.toml"))[0]
+
+    """
+
+    def __init__(
+        self,
+        provider: Optional[FredEconomicDataProvider] = None,
+        graph: Optional[Graph] = None,
+    ) -> None:
+        self.provider = provider or FredEconomicDataProvider()
+        self.graph = graph or default_graph()
+        self.fx = FxService(self.provider, graph=self.graph)
+
+    def evaluate(self, *specs: LiquiditySpec) -> List[pd.DataFrame]:
+        """Return the standardized components and liquidity index of each spec."""
+        return self.graph.evaluate(*[self.node(spec) for spec in specs])
+
+    def compare(self, specs: Sequence[LiquiditySpec]) -> pd.DataFrame:
+        """Return liquidity indexes of the specs side by side, a column per spec."""
+        specs = list(specs)
+        results = self.evaluate(*specs)
+        return pd.concat(
+            [df[LIQUIDITY_INDEX].rename(spec.name) for spec, df in zip(specs, results)], axis=1
+        )
+
+    def node(self, spec: LiquiditySpec) -> Node:
+        """Return the graph node computing the spec.
+
+        The FX rates are dependencies so that they are fetched along with the
+        components, the conversion reads them from the graph through `fx`.
+        """
+        tickers = [c.ticker for c in spec.components] + self.fx.tickers(self._currencies(spec))
+        return Node(
+            key=("LiquiditySpec", spec),
+            fn=partial(self._compute, spec),
+            persist=True,
+            deps=tuple(fred_node(self.provider, ticker) for ticker in dict.fromkeys(tickers)),
+        )
+
+    def _currencies(self, spec: LiquiditySpec) -> List[str]:
+        """Return currency of each component."""
+        return [
+            c.currency or self.provider.get_metadata(c.ticker).currency for c in spec.components
+        ]
+
+    def _unit_factors(self, spec: LiquiditySpec) -> FloatArray:
+        """Return factors converting the components to Billions, including their signs."""
+        factors = []
+        for component in spec.components:
+            unit = component.unit or self.provider.get_metadata(component.ticker).unit
+            if unit not in GlobalLiquidity.UNIT_CONVERSION_FACTORS:
+                raise ValueError(f"Unsupported unit of {component.name}: {unit}")
+            factors.append(component.sign * GlobalLiquidity.UNIT_CONVERSION_FACTORS[unit])
+        return np.array(factors)
+
+    def _compute(self, spec: LiquiditySpec, *series: pd.DataFrame) -> pd.DataFrame:
+        names = [c.name for c in spec.components]
+        aligned = align(
+            [df[["Close"]].dropna().set_axis([name], axis=1) for name, df in zip(names, series)],
+            calendar=spec.frequency,
+            max_staleness=spec.max_staleness,
+        )
+
+        # Value of a unit of each component's currency in USD, for every date
+        rates = self.fx.rates(pd.DatetimeIndex(aligned.index), self._currencies(spec))
+
+        values = aligned.to_numpy() * rates * self._unit_factors(spec)
+        df = pd.DataFrame(values, index=aligned.index, columns=names).dropna()
+        df[LIQUIDITY_INDEX] = df.to_numpy().sum(axis=1)
+        return df
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
-import numpy as np
+from datetime import datetime
+from typing import Iterator, Optional
+
 import pandas as pd
 
+from liquidity.compute import kernels
+from liquidity.compute.alignment import Calendar, align
+from liquidity.compute.frames import count_before, from_last_before, select_dates
+from liquidity.compute.graph import Graph, Node, default_graph, ticker_node
+from liquidity.compute.kernels import FloatArray
+from liquidity.compute.panel import Panel
+from liquidity.compute.streaming import calendar_join, stream_join, write_chunks
 from liquidity.compute.ticker import Ticker
+from liquidity.data.metadata.fields import Fields, Interval
 from liquidity.visuals import Chart
 
 
@@ -21,6 +31,21 @@ class YieldSpread:
         The financial instrument for which the yield spread is calculated.
     benchmark : Ticker
         The benchmark financial instrument used for comparison.
+    panel : Panel, optional
+        Pre-aligned yields shared between models. When provided, the yields
+        are taken from the panel instead of the tickers.
+    calendar : Calendar
+        Dates on which the spread is computed, by default the dates of the
+        ticker. The latest benchmark yield is used for each date, e.g. the
+        weekly treasury yield is carried forward to the daily ETF yields.
+    max_staleness : pd.Timedelta, optional
+        Maximum age of the yield carried forward, unlimited by default.
+    graph : Graph
+        Dependency graph in which the spread is evaluated. Models sharing a
+        graph compute their common inputs (e.g. benchmark yields) only once.
+    start_date, end_date : pd.Timestamp, optional
+        Date range of the computed series, only the yields in this range are
+        read from the cache or requested from the data provider.
 
     Methods:
     -------
@@ -32,6 +57,10 @@ class YieldSpread:
         Generates and displays an interactive Plotly chart to visualize
         the yield spread over time.
 
+    stream(interval, start, end):
+        Computes the spread from intraday bars chunk by chunk in bounded
+        memory, writing the results to disk.
+
     Example:
     -------
     Calculate and visualize the yield spread between HYG (High Yield Corporate Bond ETF)
@@ -57,33 +86,181 @@ class YieldSpread:
 
     series_name = "Spread"
 
-    def __init__(self, ticker: str, benchmark: str = "UST-10Y") -> None:
+    def __init__(
+        self,
+        ticker: str,
+        benchmark: str = "UST-10Y",
+        panel: Optional[Panel] = None,
+        calendar: Calendar = Calendar.First,
+        max_staleness: Optional[pd.Timedelta] = None,
+        graph: Optional[Graph] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> None:
         self.ticker = Ticker.for_symbol(ticker)
         self.benchmark = Ticker.for_symbol(benchmark)
+        self.panel = panel
+        self.calendar = calendar
+        self.max_staleness = max_staleness
+        self.graph = graph or default_graph()
+        self.start_date = pd.Timestamp(start_date) if start_date else None
+        self.end_date = pd.Timestamp(end_date) if end_date else None
 
     @property
     def df(self) -> pd.DataFrame:
         """Returns a pandas DataFrame containing the time series of yields
         for both instruments and their computed spread.
         """
-        ticker = self.ticker.yields.dropna()
-        benchmark = self.benchmark.yields.dropna()
-
-        yields = (
-            ticker.join(
-                benchmark,
-                lsuffix=self.ticker.symbol,
-                rsuffix=self.benchmark.symbol,
-            )
-            .ffill()
-            .dropna()
+        return self.graph.evaluate(self.node())[0]
+
+    def node(self) -> Node:
+        """Return the graph node computing the yield spread."""
+        return Node(
+            key=(
+                self.series_name,
+                self.ticker.symbol,
+                self.benchmark.symbol,
+                self.calendar.value,
+                self.max_staleness,
+                self.panel.token if self.panel is not None else None,
+                self.start_date,
+                self.end_date,
+            ),
+            fn=self._evaluate,
+            persist=self.panel is None,
+            deps=(self._yields_node(self.ticker), self._yields_node(self.benchmark)),
+        )
+
+    def _yields_node(self, ticker: Ticker) -> Node:
+        if self.panel is None:
+            return ticker_node(ticker, "yields", self.start_date, self.end_date)
+
+        panel, start, end = self.panel, self.start_date, self.end_date
+        return Node(
+            key=(ticker.symbol, "yields", panel.token, start, end),
+            fn=lambda: select_dates(
+                panel.series(Fields.Yield, ticker.symbol).to_frame(Fields.Yield.value), start, end
+            ),
+        )
+
+    def _evaluate(
+        self,
+        ticker_yields: pd.DataFrame,
+        benchmark_yields: pd.DataFrame,
+        start: Optional[datetime] = None,
+    ) -> pd.DataFrame:
+        """Align yields of both instruments and compute their spread."""
+        return compute_yield_spread(
+            ticker_yields,
+            benchmark_yields,
+            self.ticker.symbol,
+            self.benchmark.symbol,
+            calendar=self.calendar,
+            max_staleness=self.max_staleness,
+            start=start,
+        )
+
+    def update(self) -> pd.DataFrame:
+        """Append the spread for the yields the instruments gained since the last evaluation.
+
+        New yields are read through the tickers (e.g. after `Ticker.update`),
+        only the new dates are aligned and computed, with the yields of the
+        last earlier dates carried forward to them, so the result is the same
+        as when computed from scratch. The updated yields and spread are
+        memoized in the graph, so they are not recomputed on the next access.
+
+        Only appended yields are picked up, call `invalidate` when the history
+        was revised.
+
+        Returns:
+            pd.DataFrame: The updated spread, also available as `df`.
+
+        """
+        node = self.node()
+        df = self.df
+        legs = self.graph.evaluate(*node.deps)
+
+        new = [
+            self._new_yields(ticker, leg)
+            for ticker, leg in zip((self.ticker, self.benchmark), legs)
+        ]
+        if all(rows.empty for rows in new):
+            return df
+
+        start = min(rows.index[0] for rows in new if not rows.empty)
+        legs = [pd.concat([leg, rows]) for leg, rows in zip(legs, new)]
+        ticker_tail, benchmark_tail = (from_last_before(leg, start) for leg in legs)
+        tail = self._evaluate(ticker_tail, benchmark_tail, start=start)
+        df = pd.concat([df.iloc[: count_before(df.index, start)], tail])
+
+        for dep, leg in zip(node.deps, legs):
+            self.graph.put(dep, leg)
+        self.graph.put(node, df)
+        return self.df
+
+    def _new_yields(self, ticker: Ticker, yields: pd.DataFrame) -> pd.DataFrame:
+        """Return yields of the ticker after the last of the given ones."""
+        if self.panel is not None:
+            return yields.iloc[:0]  # panels are not appended to
+
+        last = yields.index[-1] if len(yields) else self.start_date
+        new = ticker.get_yields(last, self.end_date)
+        return new.iloc[count_before(new.index, last, inclusive=True) :] if last else new
+
+    def invalidate(self) -> None:
+        """Drop the memoized spread and yields, they are read again on the next access.
+
+        Required after the history of the yields was revised, e.g. with
+        corrected quotes, as `update` only appends the new dates.
+        """
+        self.graph.invalidate_all(self.node())
+
+    def _compute(self, yields: pd.DataFrame) -> FloatArray:
+        """Return the difference between the ticker and benchmark yields."""
+        return kernels.spread(
+            yields[f"Yield{self.ticker.symbol}"], yields[f"Yield{self.benchmark.symbol}"]
         )
 
-        def spread_formula(row: pd.Series[np.float64]) -> np.float64:
-            return row[f"Yield{self.ticker.symbol}"] - row[f"Yield{self.benchmark.symbol}"]
+    def _iter_yields(
+        self, ticker: Ticker, interval: Interval, start: datetime, end: Optional[datetime]
+    ) -> Iterator[pd.DataFrame]:
+        for chunk in ticker.iter_intraday_yields(interval, start, end):
+            yield chunk.rename(columns={Fields.Yield.value: f"Yield{ticker.symbol}"})
+
+    def stream(self, interval: Interval, start: datetime, end: Optional[datetime] = None) -> str:
+        """Compute the yield spread from intraday bars in bounded memory.
+
+        Yields of both legs are computed month by month and joined on the
+        model's calendar: as-of for `Calendar.First`, i.e. the latest benchmark
+        yield (at most `max_staleness` old) is carried forward across chunk
+        boundaries, the same way the daily spread forward-fills missing values.
+        Results are written to the partitioned store chunk by chunk.
+
+        Returns:
+            str: Name under which the result is stored, read it with
+            ``self.ticker.store.read(name, interval, start, end)``.
 
-        yields[self.series_name] = yields.apply(spread_formula, axis=1)
-        return yields
+        Raises:
+            ValueError: If the calendar cannot be streamed, see `calendar_join`.
+
+        """
+        how = calendar_join(self.calendar)
+        for ticker in (self.ticker, self.benchmark):
+            if not ticker.metadata.is_treasury_yield:
+                ticker.download_intraday(interval, start, end)
+
+        def compute() -> Iterator[pd.DataFrame]:
+            for chunk in stream_join(
+                self._iter_yields(self.ticker, interval, start, end),
+                self._iter_yields(self.benchmark, interval, start, end),
+                how=how,
+                tolerance=self.max_staleness,
+            ):
+                chunk[self.series_name] = self._compute(chunk)
+                yield chunk
+
+        name = f"{self.ticker.symbol}-{self.benchmark.symbol}-{self.series_name}"
+        return write_chunks(self.ticker.store, name, interval, compute())
 
     def get_chart(self, show_all_series: bool = False) -> Chart:
         """Generate a chart visualizing the yield spread over time.
@@ -95,12 +272,13 @@ class YieldSpread:
             which displays only the yield spread).
 
         """
+        df = self.df
         secondary_series = None
         if show_all_series:
-            secondary_series = [col for col in self.df.columns if col != self.series_name]
+            secondary_series = [col for col in df.columns if col != self.series_name]
 
         return Chart(
-            data=self.df,
+            data=df,
             title=f"{self.ticker.symbol} - {self.benchmark.symbol} Yield Spread",
             main_series=self.series_name,
             secondary_series=secondary_series,
@@ -111,3 +289,33 @@ class YieldSpread:
     def show(self) -> None:
         """Generate and display a chart visualizing the yield spread over time."""
         self.get_chart().show()
+
+
+def compute_yield_spread(
+    ticker_yields: pd.DataFrame,
+    benchmark_yields: pd.DataFrame,
+    ticker: str,
+    benchmark: str,
+    calendar: Calendar = Calendar.First,
+    max_staleness: Optional[pd.Timedelta] = None,
+    start: Optional[datetime] = None,
+) -> pd.DataFrame:
+    """Align yields of the instruments (from `start`) and compute their spread.
+
+    Depends on the data and symbols only, so it can be evaluated anywhere,
+    e.g. in worker processes (see `ProcessPoolEvaluator`).
+    """
+    yields = align(
+        [
+            ticker_yields.dropna().add_suffix(ticker),
+            benchmark_yields.dropna().add_suffix(benchmark),
+        ],
+        calendar=calendar,
+        max_staleness=max_staleness,
+        start=start,
+    ).dropna()
+
+    yields[YieldSpread.series_name] = kernels.spread(
+        yields[f"Yield{ticker}"], yields[f"Yield{benchmark}"]
+    )
+    return yields
@@ -1,4 +1,5 @@
 from .chart import Chart
 from .matrix import ChartMatrix
+from .report import Report
 
-__all__ = ["Chart", "ChartMatrix"]
+__all__ = ["Chart", "ChartMatrix", "Report"]
@@ -1,9 +1,13 @@
 import random
-from typing import List, Optional, Set
+from typing import List, Optional, Set, Type
 
 import pandas as pd
 import plotly.graph_objects as go  # type: ignore
 
+from liquidity.visuals.downsample import DEFAULT_MAX_POINTS, downsample, resample_on_zoom
+from liquidity.visuals.render import scatter_type
+from liquidity.visuals.serialize import figure_json
+
 
 class Chart:
     """A class to generate and display interactive Plotly charts with a primary series
@@ -17,6 +21,10 @@ class Chart:
         yaxis_name (str): Label for the Y-axis.
         xaxis_name (str): Label for the X-axis.
         secondary_colors (List[str]): Palette of colors for secondary series.
+        max_points (Optional[int]): Number of points each series is downsampled
+            to (with LTTB) when longer, None to plot all of them.
+        webgl (Optional[bool]): Whether to render the traces with WebGL, by
+            default only charts with many points are (see `scatter_type`).
 
     """
 
@@ -29,6 +37,8 @@ class Chart:
         yaxis_name: str = "Value",
         xaxis_name: str = "Date",
         secondary_colors: Optional[List[str]] = None,
+        max_points: Optional[int] = DEFAULT_MAX_POINTS,
+        webgl: Optional[bool] = None,
     ) -> None:
         self.data = data
         self.title = title
@@ -46,18 +56,32 @@ class Chart:
             "thistle",
             "plum",
         ]
+        self.max_points = max_points
+        self.webgl = webgl
 
     def get_random_color(self, exclude: Set[str]) -> str:
         """Select a random color from the palette, excluding already used colors."""
         available_colors = [c for c in self.secondary_colors if c not in exclude]
         return random.choice(available_colors) if available_colors else "gray"
 
+    def plotted_series(self) -> List[str]:
+        """Return the main series followed by the secondary series present in the data."""
+        return [self.main_series] + [s for s in self.secondary_series if s in self.data]
+
+    def scatter_type(self) -> Type[go.Scatter]:
+        """Return trace type of the chart, WebGL for charts with many points."""
+        rows = len(self.data)
+        if self.max_points is not None:
+            rows = min(rows, self.max_points)
+        return scatter_type(rows * len(self.plotted_series()), self.webgl)
+
     def add_main_series(self, fig: go.Figure) -> None:
         """Add the main series to the figure."""
+        series = downsample(self.data[self.main_series], self.max_points)
         fig.add_trace(
-            go.Scatter(
-                x=self.data.index,
-                y=self.data[self.main_series],
+            self.scatter_type()(
+                x=series.index,
+                y=series,
                 mode="lines",
                 name=self.main_series,
                 line=dict(color="cadetblue", width=3, dash="solid"),
@@ -67,16 +91,18 @@ class Chart:
     def add_secondary_series(self, fig: go.Figure) -> None:
         """Add secondary series to the figure."""
         used_colors: set[str] = set()
+        scatter = self.scatter_type()
         for series in self.secondary_series:
             if series not in self.data.columns:
                 continue
 
             color = self.get_random_color(used_colors)
+            points = downsample(self.data[series], self.max_points)
 
             fig.add_trace(
-                go.Scatter(
-                    x=self.data.index,
-                    y=self.data[series],
+                scatter(
+                    x=points.index,
+                    y=points,
                     mode="lines",
                     name=series,
                     line=dict(color=color, width=2, dash="dot"),
@@ -115,6 +141,19 @@ class Chart:
         self.configure_layout(fig)
         return fig
 
+    def to_json(self) -> str:
+        """Return compact JSON of the figure, with binary encoded arrays (see `figure_json`)."""
+        return figure_json(self.generate_figure())
+
+    def widget(self) -> go.FigureWidget:
+        """Return the chart as a Jupyter widget showing full resolution data when zoomed in.
+
+        Requires `ipywidgets`, the downsampled traces are recomputed for the
+        visible date range on every zoom.
+        """
+        sources = [self.data[series] for series in self.plotted_series()]
+        return resample_on_zoom(self.generate_figure(), sources, self.max_points)
+
     def show(self) -> None:
         """Generate and display the chart."""
         self.generate_figure().show()
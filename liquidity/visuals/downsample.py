@@ -0,0 +1,128 @@
+from typing import Any, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import plotly.graph_objects as go  # type: ignore
+
+# Default number of points per trace, about the width of a chart in pixels,
+# so downsampled lines look the same as the full resolution ones.
+DEFAULT_MAX_POINTS = 2000
+
+IndexArray = npt.NDArray[np.int64]
+
+
+def lttb(x: npt.ArrayLike, y: npt.ArrayLike, max_points: int) -> IndexArray:
+    """Return positions of the points selected by Largest-Triangle-Three-Buckets.
+
+    The first and the last points are kept, the others are split into
+    `max_points - 2` buckets, and from each bucket the point forming the
+    largest triangle with the point selected from the previous bucket and
+    the average of the next bucket is kept. Peaks and troughs are preserved,
+    unlike with decimation.
+
+    Args:
+        x (ArrayLike): Sorted x coordinates of the points, e.g. timestamps.
+        y (ArrayLike): Y coordinates of the points, without missing values.
+        max_points (int): Number of points to select, all the points are
+            selected when there are not more of them.
+
+    """
+    xs = np.asarray(x, dtype=np.float64)
+    ys = np.asarray(y, dtype=np.float64)
+    n = len(xs)
+    if max_points >= n or max_points < 3:
+        return np.arange(n, dtype=np.int64)
+
+    # Bucket boundaries of the points between the first and the last one
+    edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for bucket in range(max_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+        avg_x, avg_y = xs[end:next_end].mean(), ys[end:next_end].mean()
+
+        areas = np.abs(
+            (xs[a] - avg_x) * (ys[start:end] - ys[a]) - (xs[a] - xs[start:end]) * (avg_y - ys[a])
+        )
+        a = start + int(np.argmax(areas))
+        selected[bucket + 1] = a
+
+    return selected
+
+
+def downsample(series: "pd.Series[Any]", max_points: Optional[int]) -> "pd.Series[Any]":
+    """Return the date indexed series reduced to at most `max_points` points with LTTB.
+
+    Series that are short enough (or when `max_points` is None) are
+    returned as is, missing values of longer ones are dropped.
+    """
+    if max_points is None or len(series) <= max_points:
+        return series
+    series = series.dropna()
+    return series.iloc[lttb(_timestamps(series.index), series.to_numpy(), max_points)]
+
+
+def downsample_frame(df: pd.DataFrame, column: str, max_points: Optional[int]) -> pd.DataFrame:
+    """Return rows of the frame selected with LTTB on the column.
+
+    All the columns keep the same dates, e.g. for stacked areas whose sum
+    is the `column`.
+    """
+    if max_points is None or len(df) <= max_points:
+        return df
+    df = df.dropna(subset=[column])
+    return df.iloc[lttb(_timestamps(df.index), df[column].to_numpy(), max_points)]
+
+
+def resample_traces(
+    fig: go.Figure,
+    sources: Sequence["pd.Series[Any]"],
+    x_range: Optional[Sequence[str]],
+    max_points: Optional[int],
+) -> None:
+    """Replace data of the traces with the sources downsampled within the visible range.
+
+    Zooming into a downsampled chart shows the full resolution data once
+    the visible range holds at most `max_points` points.
+
+    Args:
+        fig (go.Figure): Figure whose first traces plot the `sources`.
+        sources (Sequence[pd.Series]): Full resolution data of the traces.
+        x_range (Sequence, optional): Visible dates, the whole series if None.
+        max_points (int, optional): Number of points of each trace.
+
+    """
+    with fig.batch_update():
+        for trace, series in zip(fig.data, sources):
+            if x_range:
+                dates = series.index
+                series = series[(dates >= x_range[0]) & (dates <= x_range[1])]
+            visible = downsample(series, max_points)
+            trace.x, trace.y = visible.index, visible.to_numpy()
+
+
+def resample_on_zoom(
+    fig: go.Figure, sources: Sequence["pd.Series[Any]"], max_points: Optional[int]
+) -> go.FigureWidget:
+    """Return widget of the figure which resamples the traces on every zoom.
+
+    Requires a Jupyter environment with `ipywidgets`, static figures (e.g.
+    ``fig.show()`` in a browser) keep the initially downsampled data.
+    """
+    widget = go.FigureWidget(fig)
+
+    def on_zoom(layout: object, x_range: Optional[Sequence[str]]) -> None:
+        resample_traces(widget, sources, x_range, max_points)
+
+    widget.layout.on_change(on_zoom, "xaxis.range")
+    return widget
+
+
+def _timestamps(index: "pd.Index[Any]") -> npt.NDArray[np.float64]:
+    """Return dates of the index as seconds, so the areas are computed in floats."""
+    nanoseconds = pd.DatetimeIndex(index).to_numpy().astype(np.int64)
+    return nanoseconds / 1e9
@@ -1,13 +1,22 @@
+import copy
 import math
 from collections.abc import Iterable
 from datetime import datetime
-from typing import Optional, Protocol, Tuple
+from typing import List, Optional, Protocol, Sequence, Tuple, Type
 
 import pandas as pd
 import plotly.graph_objects as go  # type: ignore
 from plotly.subplots import make_subplots  # type: ignore
 
+from liquidity.compute.graph import Graph, GraphModel, default_graph
 from liquidity.visuals.chart import Chart
+from liquidity.visuals.downsample import DEFAULT_MAX_POINTS, downsample
+from liquidity.visuals.render import scatter_type
+from liquidity.visuals.serialize import figure_json
+from liquidity.visuals.sparkline import SparklineGrid
+
+# Number of charts of a page of the matrix, see `ChartMatrix.pages`
+DEFAULT_PAGE_SIZE = 16
 
 
 class ChartableModel(Protocol):
@@ -24,6 +33,9 @@ class ChartMatrix:
         models: Iterable[ChartableModel],
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        graph: Optional[Graph] = None,
+        max_points: Optional[int] = DEFAULT_MAX_POINTS,
+        webgl: Optional[bool] = None,
     ) -> None:
         """Initialize the LiquidityProxies object.
 
@@ -39,11 +51,49 @@ class ChartMatrix:
             end_date (datetime, optional): The end date of the time window for the
                                             chart. If not provided, the latest
                                             available data is used.
+            graph (Graph, optional): Dependency graph shared by the models, the
+                                     models are evaluated in it together, so
+                                     inputs common to many models are computed
+                                     only once and independent ones in parallel.
+            max_points (int, optional): Number of points each chart is downsampled
+                                        to (with LTTB) when longer, None to plot
+                                        all of them.
+            webgl (bool, optional): Whether to render the charts with WebGL, by
+                                    default only matrices with many points are.
 
         """
+        models = list(models)
+        self.graph = graph or default_graph()
+
+        # Fetch the distinct inputs of all the models concurrently up front,
+        # the charts are then built from the memoized results. Only the
+        # displayed dates are fetched, unless a model sets its own range.
+        # The models are copied, the caller's ones keep their graph and range.
+        models = [self._bind(model, start_date, end_date) for model in models]
+        self.graph.evaluate(*[model.node() for model in models if isinstance(model, GraphModel)])
+
         self.charts = [model.get_chart() for model in models]
         self.start_date = start_date
         self.end_date = end_date
+        self.max_points = max_points
+        self.webgl = webgl
+
+    def _bind(
+        self,
+        model: ChartableModel,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> ChartableModel:
+        """Return copy of the model evaluated in the matrix graph and date range."""
+        if not isinstance(model, GraphModel):
+            return model
+
+        bound = copy.copy(model)
+        bound.graph = self.graph
+        if model.start_date is None and model.end_date is None:
+            bound.start_date = pd.Timestamp(start_date) if start_date else None
+            bound.end_date = pd.Timestamp(end_date) if end_date else None
+        return bound
 
     def filter_data(self, data: pd.DataFrame) -> pd.DataFrame:
         """Filter the DataFrame to include only the desired time period.
@@ -62,9 +112,9 @@ class ChartMatrix:
 
         return data.loc[start_date:end_date]
 
-    def get_chart_dimensions(self) -> Tuple[int, int]:
-        """Return the size (rows, cols) of the matrix."""
-        charts_num = len(self.charts)
+    def get_chart_dimensions(self, charts_num: Optional[int] = None) -> Tuple[int, int]:
+        """Return the size (rows, cols) of the matrix (of the number of charts, all by default)."""
+        charts_num = len(self.charts) if charts_num is None else charts_num
         cols = math.isqrt(charts_num)
 
         if cols**2 == charts_num:
@@ -78,7 +128,22 @@ class ChartMatrix:
 
         return rows, cols
 
-    def add_chart_to_subplot(self, fig: go.Figure, chart: Chart, row: int, col: int) -> None:
+    def scatter_type(self, charts: Optional[Sequence[Chart]] = None) -> Type[go.Scatter]:
+        """Return trace type of the matrix, WebGL for matrices with many points in total."""
+        points = 0
+        for chart in self.charts if charts is None else charts:
+            rows = len(self.filter_data(chart.data))
+            points += rows if self.max_points is None else min(rows, self.max_points)
+        return scatter_type(points, self.webgl)
+
+    def add_chart_to_subplot(
+        self,
+        fig: go.Figure,
+        chart: Chart,
+        row: int,
+        col: int,
+        scatter: Type[go.Scatter] = go.Scatter,
+    ) -> None:
         """Add a chart's main series to a subplot.
 
         Args:
@@ -86,13 +151,15 @@ class ChartMatrix:
             chart (Chart): Chart object containing data and configuration.
             row (int): Row number of the subplot.
             col (int): Column number of the subplot.
+            scatter (Type[go.Scatter]): Trace type, `go.Scatter` or `go.Scattergl`.
 
         """
         filtered_data = self.filter_data(chart.data)
+        series = downsample(filtered_data[chart.main_series], self.max_points)
         fig.add_trace(
-            go.Scatter(
-                x=filtered_data.index,
-                y=filtered_data[chart.main_series],
+            scatter(
+                x=series.index,
+                y=series,
                 mode="lines",
                 name=chart.main_series,
                 line=dict(color="cadetblue", width=3, dash="solid"),
@@ -101,22 +168,18 @@ class ChartMatrix:
             col=col,
         )
 
-    def show(self) -> None:
-        """Display four charts in a grid using Plotly.
-
-        Args:
-            charts (List[Chart]): List of Chart objects to display.
-            yaxis_names (List[str]): Y-axis labels for each subplot.
-            xaxis_name (str): X-axis label for all subplots (default: "Date").
-
-        """
-        rows, cols = self.get_chart_dimensions()
+    def generate_figure(
+        self, charts: Optional[Sequence[Chart]] = None, title: str = "Liquidity Proxies"
+    ) -> go.Figure:
+        """Generate a Plotly figure with the charts (all by default) in a grid of subplots."""
+        charts = self.charts if charts is None else charts
+        rows, cols = self.get_chart_dimensions(len(charts))
 
         # Create a matrix subplot layout
         fig = make_subplots(
             rows=rows,
             cols=cols,
-            subplot_titles=[chart.title for chart in self.charts],
+            subplot_titles=[chart.title for chart in charts],
             shared_xaxes=False,
             shared_yaxes=False,
             horizontal_spacing=0.1,
@@ -124,16 +187,17 @@ class ChartMatrix:
         )
 
         # Add each chart to the appropriate subplot
-        for idx, chart in enumerate(self.charts):
+        scatter = self.scatter_type(charts)
+        for idx, chart in enumerate(charts):
             row, col = divmod(idx, cols)
-            self.add_chart_to_subplot(fig, chart, row + 1, col + 1)
+            self.add_chart_to_subplot(fig, chart, row + 1, col + 1, scatter)
             fig.update_yaxes(title_text=chart.yaxis_name, row=row + 1, col=col + 1)
             fig.update_xaxes(title_text=chart.xaxis_name, row=row + 1, col=col + 1)
 
-        # Update layout and show the figure
+        # Update layout of the figure
         fig.update_layout(
             title=dict(
-                text="Liquidity Proxies",
+                text=title,
                 font=dict(size=24, family="Helvetica, sans-serif", color="black"),
                 x=0.5,  # Center-align the title
                 xanchor="center",
@@ -150,4 +214,56 @@ class ChartMatrix:
             paper_bgcolor="ghostwhite",
             showlegend=False,
         )
+        return fig
+
+    def to_json(self) -> str:
+        """Return compact JSON of the figure, with binary encoded arrays (see `figure_json`)."""
+        return figure_json(self.generate_figure())
+
+    def page_count(self, page_size: int = DEFAULT_PAGE_SIZE) -> int:
+        """Return number of pages of `page_size` charts."""
+        return math.ceil(len(self.charts) / page_size)
+
+    def page_figure(self, page: int, page_size: int = DEFAULT_PAGE_SIZE) -> go.Figure:
+        """Return figure of the page (numbered from 1) of `page_size` charts."""
+        if not 1 <= page <= self.page_count(page_size):
+            raise ValueError(f"Page {page} out of range 1-{self.page_count(page_size)}")
+
+        start = (page - 1) * page_size
+        return self.generate_figure(
+            self.charts[start : start + page_size],
+            title=f"Liquidity Proxies ({page}/{self.page_count(page_size)})",
+        )
+
+    def pages(self, page_size: int = DEFAULT_PAGE_SIZE) -> List[go.Figure]:
+        """Return figures of all the pages of `page_size` charts.
+
+        Figures with hundreds of subplots are slow to build and to render,
+        pages keep every figure small, e.g. to be added to a lazily rendered
+        `Report` or shown one at a time.
+        """
+        return [
+            self.page_figure(page, page_size) for page in range(1, self.page_count(page_size) + 1)
+        ]
+
+    def sparklines(self, columns: int = 8) -> SparklineGrid:
+        """Return overview of the main series of all the charts as a grid of sparklines."""
+        return SparklineGrid(
+            [
+                (chart.title, self.filter_data(chart.data)[chart.main_series])
+                for chart in self.charts
+            ],
+            columns=columns,
+        )
+
+    def show(self, page: Optional[int] = None, page_size: int = DEFAULT_PAGE_SIZE) -> None:
+        """Display the charts in a grid using Plotly.
+
+        Args:
+            page (int, optional): Display only the page (numbered from 1) of
+                                  `page_size` charts, all the charts by default.
+            page_size (int): Number of charts of a page.
+
+        """
+        fig = self.generate_figure() if page is None else self.page_figure(page, page_size)
         fig.show()
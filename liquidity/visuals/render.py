@@ -0,0 +1,23 @@
+from typing import Optional, Type
+
+import plotly.graph_objects as go  # type: ignore
+
+# Number of points of a figure above which its traces are rendered with WebGL,
+# SVG figures with more points become sluggish to pan, zoom and hover.
+WEBGL_THRESHOLD = 10_000
+
+
+def scatter_type(points: int, webgl: Optional[bool] = None) -> Type[go.Scatter]:
+    """Return trace type for a figure plotting the number of points.
+
+    Args:
+        points (int): Number of points of all the traces of the figure.
+        webgl (bool, optional): Whether to render with WebGL (`go.Scattergl`)
+            or SVG (`go.Scatter`), by default WebGL is used above the
+            `WEBGL_THRESHOLD` number of points.
+
+    """
+    if webgl is None:
+        webgl = points > WEBGL_THRESHOLD
+    scatter: Type[go.Scatter] = go.Scattergl if webgl else go.Scatter
+    return scatter
@@ -0,0 +1,173 @@
+import html
+from pathlib import Path
+from typing import List, Optional, Protocol, Tuple, Union
+
+import plotly.graph_objects as go  # type: ignore
+import plotly.offline  # type: ignore
+
+from liquidity.visuals.serialize import figure_json
+
+# File name of the plotly.js library shared by the pages of a report
+PLOTLY_JS = "plotly.min.js"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotly_js}"></script>
+<style>
+body {{ font-family: Arial, sans-serif; background: ghostwhite; margin: 2em; }}
+section {{ margin-bottom: 3em; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+{body}
+</body>
+</html>
+"""
+
+# Lazy figures are plotted once their section scrolls into (or near) the view
+FIGURE_TEMPLATE = """<section>
+<h2>{title}</h2>
+<div id="{div_id}" style="min-height: {height}px;"></div>
+<script>
+(function () {{
+  var figure = {figure};
+  var div = document.getElementById("{div_id}");
+  var plot = function () {{
+    Plotly.newPlot(div, figure.data, figure.layout, {{responsive: true}});
+  }};
+  if (!{lazy} || !("IntersectionObserver" in window)) {{
+    plot();
+    return;
+  }}
+  new IntersectionObserver(function (entries, observer) {{
+    if (entries[0].isIntersecting) {{
+      observer.disconnect();
+      plot();
+    }}
+  }}, {{rootMargin: "500px"}}).observe(div);
+}})();
+</script>
+</section>"""
+
+# Height of the figures without a height set in their layout, Plotly's default
+DEFAULT_HEIGHT = 450
+
+
+class FigureSource(Protocol):
+    def generate_figure(self) -> go.Figure:
+        """Return the Plotly figure, e.g. of a `Chart`, `ChartMatrix` or `GlobalLiquidity`."""
+        ...
+
+
+class Report:
+    """Renders many figures into HTML pages sharing a single plotly.js file.
+
+    Unlike ``fig.write_html()``, which embeds plotly.js (several MB) into
+    every file, the pages reference a single copy of the library written next
+    to them, and the figure data is embedded with the numeric arrays binary
+    encoded (see `figure_json`).
+
+    Examples
+    --------
+    >>> report = Report("Nightly Liquidity Report")
+    >>> report.add(PriceRatio("QQQ", "SPY").get_chart())
+    >>> report.add(ChartMatrix(models), title="Proxies")
+    >>> report.add(GlobalLiquidity())
+    >>> report.write_html("reports/nightly.html")  # all the figures on one page
+    >>> report.write_pages("reports/nightly")  # a page per figure and an index
+
+    Pages with many figures (e.g. the pages of a large `ChartMatrix`) are
+    rendered lazily, each figure is plotted when scrolled into view:
+
+    >>> report = Report("Universe", lazy=True)
+    >>> for page in ChartMatrix(models).pages():
+    ...     report.add(page)
+
+    """
+
+    def __init__(self, title: str = "Liquidity Report", lazy: bool = False) -> None:
+        self.title = title
+        self.lazy = lazy
+        self.figures: List[Tuple[str, go.Figure]] = []
+
+    def add(self, item: Union[go.Figure, FigureSource], title: Optional[str] = None) -> "Report":
+        """Add the figure (or the figure generated by the chart or model) to the report.
+
+        Args:
+            item (go.Figure | FigureSource): Figure, or an object generating it.
+            title (str, optional): Section title, the figure title by default.
+
+        """
+        fig = item if isinstance(item, go.Figure) else item.generate_figure()
+        self.figures.append(
+            (title or fig.layout.title.text or f"Figure {len(self.figures) + 1}", fig)
+        )
+        return self
+
+    def write_html(self, path: Union[str, Path]) -> Path:
+        """Write all the figures into a single page, with plotly.js next to it."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_plotly_js(path.parent)
+
+        body = "\n".join(
+            _render_figure(title, fig, f"figure-{n}", self.lazy)
+            for n, (title, fig) in enumerate(self.figures, start=1)
+        )
+        path.write_text(_render_page(self.title, body), encoding="utf-8")
+        return path
+
+    def write_pages(self, directory: Union[str, Path]) -> List[Path]:
+        """Write a page per figure and an index page linking them, sharing plotly.js.
+
+        Returns:
+            List[Path]: Index page followed by the figure pages.
+
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        write_plotly_js(directory)
+
+        pages: List[Path] = []
+        links: List[str] = []
+        for n, (title, fig) in enumerate(self.figures, start=1):
+            page = directory / f"figure-{n}.html"
+            page.write_text(
+                _render_page(title, _render_figure(title, fig, "figure", self.lazy)),
+                encoding="utf-8",
+            )
+            pages.append(page)
+            links.append(f'<li><a href="{page.name}">{html.escape(title)}</a></li>')
+
+        index = directory / "index.html"
+        body = "<ul>\n" + "\n".join(links) + "\n</ul>"
+        index.write_text(_render_page(self.title, body), encoding="utf-8")
+        return [index, *pages]
+
+
+def write_plotly_js(directory: Path) -> Path:
+    """Write the plotly.js library bundled with Plotly into the directory, once."""
+    path = directory / PLOTLY_JS
+    source: str = plotly.offline.get_plotlyjs()
+    if not path.exists() or path.stat().st_size != len(source.encode("utf-8")):
+        path.write_text(source, encoding="utf-8")
+    return path
+
+
+def _render_page(title: str, body: str) -> str:
+    return PAGE_TEMPLATE.format(title=html.escape(title), plotly_js=PLOTLY_JS, body=body)
+
+
+def _render_figure(title: str, fig: go.Figure, div_id: str, lazy: bool) -> str:
+    # Plotly's JSON encoder escapes "<" and "/", so strings cannot end the script element
+    return FIGURE_TEMPLATE.format(
+        title=html.escape(title),
+        div_id=div_id,
+        figure=figure_json(fig),
+        height=fig.layout.height or DEFAULT_HEIGHT,
+        lazy="true" if lazy else "false",
+    )
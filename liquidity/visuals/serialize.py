@@ -0,0 +1,112 @@
+import base64
+import importlib.util
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import plotly.graph_objects as go  # type: ignore
+import plotly.io.json as pio_json  # type: ignore
+
+# Types of the typed arrays decoded by plotly.js (>= 2.28) from base64 encoded
+# ``{"dtype": ..., "bdata": ...}`` specs, all little-endian. There are no
+# 64-bit integer typed arrays, such arrays are encoded as int32 or float64.
+TYPED_ARRAY_DTYPES = {
+    np.dtype(np.float64): "f8",
+    np.dtype(np.float32): "f4",
+    np.dtype(np.int32): "i4",
+    np.dtype(np.uint32): "u4",
+    np.dtype(np.int16): "i2",
+    np.dtype(np.uint16): "u2",
+    np.dtype(np.int8): "i1",
+    np.dtype(np.uint8): "u1",
+}
+
+# Engine of Plotly's JSON encoder, orjson is several times faster than json
+JSON_ENGINE = "orjson" if importlib.util.find_spec("orjson") else "json"
+
+
+def encode_array(values: npt.NDArray[Any]) -> object:
+    """Return numeric array as a plotly.js typed array spec, other arrays as is."""
+    if values.dtype.kind in "iu" and values.dtype.itemsize == 8:
+        fits = values.size == 0 or (values.min() >= -(2**31) and values.max() < 2**31)
+        values = values.astype(np.int32 if fits else np.float64)
+    if values.dtype not in TYPED_ARRAY_DTYPES or values.ndim != 1:
+        return values
+
+    data = values.astype(values.dtype.newbyteorder("<"), copy=False).tobytes()
+    return {
+        "dtype": TYPED_ARRAY_DTYPES[values.dtype],
+        "bdata": base64.b64encode(data).decode("ascii"),
+    }
+
+
+def encode_dates(values: npt.NDArray[Any]) -> Optional[npt.NDArray[np.float64]]:
+    """Return dates of the array as milliseconds since epoch, None if it does not hold dates.
+
+    Plotly renders numbers on date axes as milliseconds since epoch (UTC), the
+    same as timezone naive dates. Timezone aware dates are not converted.
+    """
+    if values.dtype.kind == "M":
+        dates = pd.DatetimeIndex(values)
+    elif values.dtype == object and values.size and isinstance(values[0], datetime):
+        try:
+            dates = pd.DatetimeIndex(values)
+        except (TypeError, ValueError):
+            return None
+        if dates.tz is not None:
+            return None
+    else:
+        return None
+
+    milliseconds = dates.as_unit("ms").to_numpy().astype(np.int64).astype(np.float64)
+    milliseconds[np.isnat(dates.to_numpy())] = np.nan
+    return milliseconds
+
+
+def encode_figure(fig: go.Figure) -> Dict[str, object]:
+    """Return the figure as a dict with the arrays encoded as typed arrays.
+
+    Values are encoded in 8 (or fewer) bytes each instead of their decimal
+    representation in JSON text, which is both smaller and faster to encode
+    and parse. Dates of the trace coordinates are encoded as milliseconds
+    since epoch, and their axes are declared as date axes.
+    """
+    figure: Dict[str, Any] = fig.to_plotly_json()
+    layout: Dict[str, Any] = figure.setdefault("layout", {})
+
+    traces: List[Dict[str, object]] = []
+    for trace in figure.get("data", []):
+        trace = dict(trace)
+        for coordinate in ("x", "y"):
+            values = trace.get(coordinate)
+            dates = encode_dates(values) if isinstance(values, np.ndarray) else None
+            if dates is None:
+                continue
+            trace[coordinate] = dates
+            axis = str(trace.get(f"{coordinate}axis", coordinate))
+            layout.setdefault(f"{coordinate}axis{axis[1:]}", {}).setdefault("type", "date")
+        traces.append(trace)
+
+    figure["data"] = traces
+    return {key: _encode(value) for key, value in figure.items()}
+
+
+def figure_json(fig: go.Figure) -> str:
+    """Return compact JSON of the figure, with the arrays binary encoded (see `encode_figure`).
+
+    Encoded with orjson, when installed.
+    """
+    json: str = pio_json.to_json_plotly(encode_figure(fig), engine=JSON_ENGINE)
+    return json
+
+
+def _encode(value: object) -> object:
+    if isinstance(value, np.ndarray):
+        return encode_array(value)
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    return value
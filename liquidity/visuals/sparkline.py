@@ -0,0 +1,132 @@
+import html
+from pathlib import Path
+from typing import Any, Iterable, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from liquidity.compute.kernels import FloatArray
+from liquidity.visuals.downsample import downsample
+
+GRID_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+</head>
+<body style="font-family: Arial, sans-serif; background: ghostwhite; margin: 2em;">
+<h1>{title}</h1>
+{grid}
+</body>
+</html>
+"""
+
+CELL_TEMPLATE = """<div style="background: white; padding: 6px; border: 1px solid whitesmoke;">
+<div style="font-size: 12px; color: dimgray; white-space: nowrap; overflow: hidden;" \
+title="{title}">{title}</div>
+<div style="font-size: 14px;">{last} <span style="color: {change_color};">{change}</span></div>
+{svg}
+</div>"""
+
+
+def sparkline_svg(
+    series: "pd.Series[Any]", width: int = 160, height: int = 40, color: str = "cadetblue"
+) -> str:
+    """Return inline SVG drawing the date indexed series as a line, without axes.
+
+    The series is downsampled (with LTTB) to a point per pixel, so a
+    sparkline is a few KB regardless of the length of the history.
+    """
+    series = downsample(series.dropna(), width)
+    svg = f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+    if series.empty:
+        return svg + "</svg>"
+
+    dates = pd.DatetimeIndex(series.index).to_numpy().astype(np.int64).astype(np.float64)
+    values = series.to_numpy(dtype=np.float64)
+
+    x = _scale(dates, 0, width - 1)
+    # SVG y axis points down, the largest value is drawn at the top
+    y = height - 1 - _scale(values, 1, height - 2)
+    points = " ".join(f"{a:.1f},{b:.1f}" for a, b in zip(x, y))
+    return (
+        svg + f'<polyline fill="none" stroke="{color}" stroke-width="1.5" points="{points}"/>'
+        "</svg>"
+    )
+
+
+class SparklineGrid:
+    """Lightweight overview of many series as a grid of sparklines.
+
+    Each cell shows the title, the last value, its change over the period
+    and a sparkline rendered as inline SVG, without Plotly. Hundreds of cells
+    render instantly, unlike a grid of interactive subplots, and the details
+    of a series can then be plotted with its `Chart`.
+
+    Examples
+    --------
+    >>> grid = ChartMatrix(models).sparklines()  # or SparklineGrid([(title, series)])
+    >>> grid  # displayed in Jupyter
+    >>> grid.write_html("overview.html")
+
+    """
+
+    def __init__(
+        self,
+        series: Iterable[Tuple[str, "pd.Series[Any]"]],
+        title: str = "Liquidity Proxies",
+        columns: int = 8,
+        width: int = 160,
+        height: int = 40,
+    ) -> None:
+        self.series = list(series)
+        self.title = title
+        self.columns = columns
+        self.width = width
+        self.height = height
+
+    def cells(self) -> List[str]:
+        """Return HTML of the grid cells, one for each series."""
+        cells = []
+        for title, series in self.series:
+            values = series.dropna()
+            last = values.iloc[-1] if len(values) else np.nan
+            change = last - values.iloc[0] if len(values) else np.nan
+            cells.append(
+                CELL_TEMPLATE.format(
+                    title=html.escape(title),
+                    last=f"{last:.2f}",
+                    change=f"{change:+.2f}",
+                    change_color="seagreen" if change >= 0 else "firebrick",
+                    svg=sparkline_svg(series, self.width, self.height),
+                )
+            )
+        return cells
+
+    def to_html(self) -> str:
+        """Return HTML of the grid, to be embedded in a page."""
+        style = (
+            f"display: grid; grid-template-columns: repeat({self.columns}, {self.width + 14}px);"
+            " gap: 8px;"
+        )
+        return f'<div style="{style}">\n' + "\n".join(self.cells()) + "\n</div>"
+
+    def _repr_html_(self) -> str:
+        return self.to_html()
+
+    def write_html(self, path: Union[str, Path]) -> Path:
+        """Write the grid as a standalone page."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        page = GRID_TEMPLATE.format(title=html.escape(self.title), grid=self.to_html())
+        path.write_text(page, encoding="utf-8")
+        return path
+
+
+def _scale(values: FloatArray, low: float, high: float) -> FloatArray:
+    """Return values scaled linearly into [low, high], constant values to the middle."""
+    lowest, highest = values.min(), values.max()
+    if highest == lowest:
+        return np.full(len(values), (low + high) / 2)
+    scaled: FloatArray = low + (values - lowest) / (highest - lowest) * (high - low)
+    return scaled
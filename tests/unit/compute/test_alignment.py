@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute.alignment import Calendar, align, asof_positions, target_index
+
+
+@pytest.fixture
+def daily():
+    # Five trading days, Monday to Friday
+    index = pd.date_range("2024-01-01", "2024-01-05", freq="B", name="Date")
+    return pd.DataFrame({"Daily": [1.0, 2.0, 3.0, 4.0, 5.0]}, index=index)
+
+
+@pytest.fixture
+def weekly():
+    # Observed on Sundays, never on a trading day
+    index = pd.to_datetime(["2023-12-31", "2024-01-07"]).rename("Date")
+    return pd.DataFrame({"Weekly": [10.0, 20.0]}, index=index)
+
+
+@pytest.fixture
+def crypto():
+    index = pd.date_range("2024-01-01", "2024-01-07", freq="D", name="Date")
+    return pd.DataFrame({"Crypto": np.arange(7, dtype=float)}, index=index)
+
+
+@pytest.mark.parametrize(
+    "calendar, expected",
+    [
+        (Calendar.Union, pd.date_range("2023-12-31", "2024-01-07")),
+        (Calendar.Intersection, pd.date_range("2024-01-01", "2024-01-05")),
+        (Calendar.First, pd.date_range("2024-01-01", "2024-01-05")),
+        (Calendar.TradingDays, pd.date_range("2024-01-01", "2024-01-05")),
+        (Calendar.CalendarDays, pd.date_range("2024-01-01", "2024-01-07")),
+        (Calendar.Weekly, pd.to_datetime(["2024-01-05"])),
+    ],
+)
+def test_target_index(daily, crypto, weekly, calendar, expected):
+    indexes = [daily.index, crypto.index]
+    if calendar == Calendar.Union:
+        indexes.append(weekly.index)
+
+    actual = target_index(indexes, calendar)
+    assert list(actual) == list(expected)
+
+
+def test_target_index_range(crypto):
+    actual = target_index([crypto.index], Calendar.First, start="2024-01-03", end="2024-01-04")
+    assert list(actual) == list(pd.date_range("2024-01-03", "2024-01-04"))
+
+
+def test_asof_positions_with_staleness(daily, weekly):
+    positions = asof_positions(weekly.index, daily.index, max_staleness=pd.Timedelta(days=3))
+    np.testing.assert_array_equal(positions, [0, 0, 0, -1, -1])
+
+
+def test_align_carries_latest_observation(daily, weekly):
+    actual = align([daily, weekly], calendar=Calendar.First)
+
+    expected = daily.assign(Weekly=10.0)
+    pd.testing.assert_frame_equal(actual, expected, check_freq=False)
+
+
+def test_align_matches_merge_asof(daily, crypto):
+    actual = align([crypto, daily], calendar=Calendar.First)
+    expected = pd.merge_asof(crypto, daily, left_index=True, right_index=True)
+    pd.testing.assert_frame_equal(actual, expected, check_freq=False)
+
+
+def test_align_unsorted_input(daily, weekly):
+    actual = align([daily, weekly[::-1]], calendar=Calendar.First)
+    assert (actual["Weekly"] == 10.0).all()
+
+
+def test_align_empty_frame(daily):
+    empty = pd.DataFrame({"Empty": []}, index=pd.DatetimeIndex([]))
+    actual = align([daily, empty], calendar=Calendar.First)
+    assert actual["Empty"].isna().all()
@@ -55,3 +55,30 @@ class TestInMemoryCache:
         loaded_df = new_cache[cache_key]  # on cache-miss should load from disk
 
         pd.testing.assert_frame_equal(div_data, loaded_df)
+
+    def test_read_date_range(self, cache, cache_dir, div_data):
+        cache_key = generate_cache_key()
+        cache[cache_key] = div_data.sort_index()
+        expected = div_data.loc[["2025-02-01", "2025-03-01"]]
+
+        pd.testing.assert_frame_equal(cache.read(cache_key, start="2025-01-15"), expected)
+
+        # Partial read from disk, without loading the whole frame into memory
+        new_cache = InMemoryCacheWithPersistence(cache_dir)
+        pd.testing.assert_frame_equal(new_cache.read(cache_key, start="2025-01-15"), expected)
+        assert cache_key not in new_cache
+
+    def test_read_missing_key(self, cache):
+        with pytest.raises(KeyError):
+            cache.read(generate_cache_key())
+
+    def test_read_columns(self, cache, cache_dir):
+        cache_key = generate_cache_key()
+        cache[cache_key] = pd.DataFrame(
+            {"Open": [1.0, 2.0], "Close": [1.5, 2.5]}, index=pd.date_range("2025-01-01", periods=2)
+        )
+
+        for reader in (cache, InMemoryCacheWithPersistence(cache_dir)):
+            df = reader.read(cache_key, columns=["Close"])
+            assert list(df.columns) == ["Close"]
+            assert df["Close"].tolist() == [1.5, 2.5]
@@ -0,0 +1,85 @@
+from collections import Counter
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute.fx import FxService
+
+DATES = pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"])
+
+RATES = {
+    "DEXUSEU": [1.10, 1.20, np.nan],  # USD per EUR, missing on a holiday
+    "DEXJPUS": [150.0, 120.0, 100.0],  # JPY per USD
+    "DEXUSUK": [1.25, 1.25, 1.25],  # USD per GBP
+    "DEXCHUS": [7.0, 7.0, 7.0],  # CNY per USD
+}
+
+
+@pytest.fixture
+def fetches():
+    return Counter()
+
+
+@pytest.fixture
+def fx(fetches):
+    provider = mock.Mock()
+    provider.max_concurrency = 4
+
+    def get_data(ticker):
+        fetches[ticker] += 1
+        return pd.DataFrame({"Close": RATES[ticker]}, index=DATES)
+
+    provider.get_data.side_effect = get_data
+    return FxService(provider, max_staleness=pd.Timedelta(days=3))
+
+
+class TestFxService:
+    def test_convert_to_usd(self, fx, fetches):
+        df = pd.DataFrame({"ECB": [10.0, 20.0, 30.0], "BoJ": [1500.0, 1200.0, 1000.0]}, index=DATES)
+
+        actual = fx.convert(df, currencies=["EUR", "JPY"], to="USD")
+
+        expected = pd.DataFrame(
+            # The EUR rate of the holiday is carried forward from the day before
+            {"ECB": [11.0, 24.0, 36.0], "BoJ": [10.0, 10.0, 10.0]},
+            index=DATES,
+        )
+        pd.testing.assert_frame_equal(actual, expected)
+        assert set(fetches) == {"DEXUSEU", "DEXJPUS"}
+
+    def test_triangulation(self, fx):
+        df = pd.DataFrame({"ECB": [1.0, 1.0, 1.0]}, index=DATES)
+
+        actual = fx.convert(df, "EUR", to="JPY")
+
+        np.testing.assert_allclose(actual["ECB"], [1.10 * 150.0, 1.20 * 120.0, 1.20 * 100.0])
+
+    def test_staleness_limit(self, fx):
+        dates = pd.to_datetime(["2023-12-31", "2024-01-05", "2024-01-10"])
+        df = pd.DataFrame({"ECB": [1.0, 1.0, 1.0]}, index=dates)
+
+        actual = fx.convert(df, "EUR")
+
+        np.testing.assert_array_equal(actual["ECB"], [np.nan, 1.20, np.nan])
+
+    def test_series_loaded_once(self, fx, fetches):
+        df = pd.DataFrame({"ECB": [1.0, 1.0, 1.0]}, index=DATES)
+
+        fx.convert(df, "EUR")
+        fx.convert(df, "EUR", to="GBP")
+
+        assert fetches == Counter({"DEXUSEU": 1, "DEXUSUK": 1})
+
+    def test_cross_rates(self, fx):
+        matrix = fx.cross_rates("2024-01-02", currencies=["USD", "EUR", "JPY"])
+
+        assert matrix.loc["EUR", "USD"] == pytest.approx(1.2)
+        assert matrix.loc["USD", "JPY"] == pytest.approx(120.0)
+        assert matrix.loc["EUR", "JPY"] == pytest.approx(144.0)
+        np.testing.assert_allclose(np.diag(matrix), 1.0)
+
+    def test_unsupported_currency(self, fx):
+        with pytest.raises(ValueError):
+            fx.convert(pd.DataFrame({"A": [1.0]}, index=DATES[:1]), "CHF")
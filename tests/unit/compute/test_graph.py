@@ -0,0 +1,312 @@
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from liquidity.compute.cache import ResultCache
+from liquidity.compute.fingerprint import fingerprint
+from liquidity.compute.graph import Graph, Node, Resource, resource_limiter
+
+
+def frame(*values):
+    return pd.DataFrame(
+        {"Close": list(values)}, index=pd.date_range("2024-01-01", periods=len(values))
+    )
+
+
+@pytest.fixture
+def calls():
+    return Counter()
+
+
+@pytest.fixture
+def sources(calls):
+    data = {"HYG": frame(5.5, 5.6), "LQD": frame(4.1, 4.2), "UST": frame(3.9, 4.0)}
+
+    def source(symbol):
+        def fetch():
+            calls[symbol] += 1
+            return data[symbol]
+
+        return Node(key=(symbol, "yields"), fn=fetch)
+
+    return data, source
+
+
+def spread_node(calls, ticker, benchmark):
+    def compute(left, right):
+        calls[(ticker.key[0], benchmark.key[0])] += 1
+        return left - right
+
+    return Node(
+        key=("Spread", ticker.key[0], benchmark.key[0]), fn=compute, deps=(ticker, benchmark)
+    )
+
+
+class TestGraph:
+    def test_shared_nodes_are_computed_once(self, calls, sources):
+        _, source = sources
+        graph = Graph()
+
+        hyg_lqd = spread_node(calls, source("HYG"), source("LQD"))
+        lqd_ust = spread_node(calls, source("LQD"), source("UST"))
+        result = graph.evaluate(hyg_lqd, lqd_ust)
+
+        assert calls["LQD"] == 1
+        pd.testing.assert_frame_equal(result[0], frame(5.5 - 4.1, 5.6 - 4.2))
+        pd.testing.assert_frame_equal(result[1], frame(4.1 - 3.9, 4.2 - 4.0))
+
+    def test_results_are_memoized(self, calls, sources):
+        _, source = sources
+        graph = Graph()
+        node = spread_node(calls, source("HYG"), source("LQD"))
+
+        first = graph.evaluate(node)[0]
+        second = graph.evaluate(node)[0]
+
+        assert first is second
+        assert calls == Counter({"HYG": 1, "LQD": 1, ("HYG", "LQD"): 1})
+
+    def test_memoized_results_are_returned_without_pool(self, calls, sources):
+        _, source = sources
+        graph = Graph()
+        node = spread_node(calls, source("HYG"), source("LQD"))
+        graph.evaluate(node)
+
+        with patch("liquidity.compute.graph.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as pool:
+            graph.evaluate(node)
+            assert pool.call_count == 0
+
+            graph.invalidate(("LQD", "yields"))
+            graph.evaluate(node)
+            assert pool.call_count == 1
+
+    def test_invalidate_recomputes_dependents_when_input_changed(self, calls, sources):
+        data, source = sources
+        graph = Graph()
+        node = spread_node(calls, source("HYG"), source("LQD"))
+        graph.evaluate(node)
+
+        # Refreshed with identical data, the spread is reused
+        graph.invalidate(("LQD", "yields"))
+        graph.evaluate(node)
+        assert calls["LQD"] == 2
+        assert calls[("HYG", "LQD")] == 1
+
+        data["LQD"] = frame(4.0, 4.0)
+        graph.invalidate(("LQD", "yields"))
+        result = graph.evaluate(node)[0]
+        assert calls[("HYG", "LQD")] == 2
+        pd.testing.assert_frame_equal(result, frame(5.5 - 4.0, 5.6 - 4.0))
+
+    def test_put_result_is_not_recomputed(self, calls, sources):
+        _, source = sources
+        graph = Graph()
+        node = spread_node(calls, source("HYG"), source("LQD"))
+        graph.evaluate(node)
+
+        graph.put(node, frame(0.0))
+
+        pd.testing.assert_frame_equal(graph.evaluate(node)[0], frame(0.0))
+        assert calls[("HYG", "LQD")] == 1
+
+    def test_invalidate_all(self, calls, sources):
+        _, source = sources
+        graph = Graph()
+        node = spread_node(calls, source("HYG"), source("LQD"))
+        graph.evaluate(node)
+
+        graph.invalidate_all(node)
+        graph.evaluate(node)
+
+        assert calls == Counter({"HYG": 2, "LQD": 2, ("HYG", "LQD"): 2})
+
+    def test_independent_nodes_run_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch():
+            barrier.wait()  # fails unless both sources run at the same time
+            return frame(1.0)
+
+        left = Node(key=("left",), fn=fetch)
+        right = Node(key=("right",), fn=fetch)
+        graph = Graph(max_workers=2)
+
+        graph.evaluate(Node(key=("sum",), fn=lambda a, b: a + b, deps=(left, right)))
+
+    def test_concurrent_evaluations_compute_once(self, calls, sources):
+        _, source = sources
+        graph = Graph()
+        node = spread_node(calls, source("HYG"), source("LQD"))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: graph.evaluate(node)[0], range(32)))
+
+        assert calls == Counter({"HYG": 1, "LQD": 1, ("HYG", "LQD"): 1})
+        assert all(result is results[0] for result in results)
+
+    def test_resource_concurrency_is_limited(self):
+        lock = threading.Lock()
+        active, peak = [0], [0]
+
+        def fetch():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return frame(1.0)
+
+        api = Resource("api", max_concurrency=2)
+        nodes = [Node(key=(i,), fn=fetch, resource=api) for i in range(6)]
+        Graph(max_workers=6).evaluate(*nodes)
+
+        assert peak[0] == 2
+
+        # The limit is shared by concurrent evaluations in separate graphs
+        peak[0] = 0
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            for graph in [Graph(max_workers=6) for _ in range(3)]:
+                pool.submit(graph.evaluate, *nodes)
+        assert peak[0] == 2
+
+    def test_resource_rate_is_limited(self):
+        started = []
+        api = Resource("rate-limited-api", max_concurrency=4, max_calls_per_minute=2)
+        resource_limiter(api).period = 0.2
+
+        def fetch():
+            started.append(time.monotonic())
+            return frame(1.0)
+
+        Graph().evaluate(*[Node(key=(i,), fn=fetch, resource=api) for i in range(3)])
+
+        assert sorted(started)[2] - sorted(started)[0] >= 0.2
+
+    def test_resource_is_released_on_errors(self):
+        def fail():
+            raise RuntimeError("fetch failed")
+
+        api = Resource("failing-api", max_concurrency=1)
+        with pytest.raises(RuntimeError):
+            Graph().evaluate(Node(key=("failing",), fn=fail, resource=api))
+
+        assert resource_limiter(api).acquire(blocking=False)
+        resource_limiter(api).release()
+
+    def test_errors_are_propagated(self):
+        def fail():
+            raise RuntimeError("fetch failed")
+
+        with pytest.raises(RuntimeError, match="fetch failed"):
+            Graph().evaluate(Node(key=("failing",), fn=fail))
+
+
+def test_fingerprint():
+    assert fingerprint(frame(1.0, 2.0)) == fingerprint(frame(1.0, 2.0))
+    assert fingerprint(frame(1.0, 2.0)) != fingerprint(frame(1.0, 2.5))
+    assert fingerprint(frame(1.0)) != fingerprint(frame(1.0).rename(columns={"Close": "Yield"}))
+
+
+class TestPersistentResults:
+    @pytest.fixture
+    def results(self, tmp_path):
+        return ResultCache(tmp_path)
+
+    def test_results_loaded_by_new_graph(self, calls, sources, results):
+        _, source = sources
+        node = spread_node(calls, source("HYG"), source("LQD"))
+        node = Node(key=node.key, fn=node.fn, deps=node.deps, persist=True)
+
+        first = Graph(results=results).evaluate(node)[0]
+        second = Graph(results=results).evaluate(node)[0]
+
+        assert calls[("HYG", "LQD")] == 1
+        assert calls["HYG"] == 2  # sources are read again, only the result is reused
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+    def test_changed_inputs_are_recomputed(self, calls, sources, results):
+        data, source = sources
+        node = spread_node(calls, source("HYG"), source("LQD"))
+        node = Node(key=node.key, fn=node.fn, deps=node.deps, persist=True)
+        Graph(results=results).evaluate(node)
+
+        data["LQD"] = frame(4.0, 4.0)
+        result = Graph(results=results).evaluate(node)[0]
+
+        assert calls[("HYG", "LQD")] == 2
+        pd.testing.assert_frame_equal(result, frame(5.5 - 4.0, 5.6 - 4.0))
+
+    def test_put_persisted_only_with_updated_inputs(self, calls, sources, results):
+        data, source = sources
+        hyg, lqd = source("HYG"), source("LQD")
+        node = spread_node(calls, hyg, lqd)
+        node = Node(key=node.key, fn=node.fn, deps=node.deps, persist=True)
+        graph = Graph(results=results)
+        graph.evaluate(node)
+
+        # Inputs are unchanged, the stored result would not be computed from them
+        graph.put(node, frame(0.0))
+        assert calls[("HYG", "LQD")] == 1
+        result = Graph(results=results).evaluate(node)[0]
+        pd.testing.assert_frame_equal(result, frame(5.5 - 4.1, 5.6 - 4.2), check_freq=False)
+
+        # Appended inputs, the next process reading them loads the stored result
+        data["HYG"], data["LQD"] = frame(5.5, 5.6, 5.7), frame(4.1, 4.2, 4.3)
+        graph.put(hyg, data["HYG"])
+        graph.put(lqd, data["LQD"])
+        graph.put(node, frame(1.4, 1.4, 1.4))
+        result = Graph(results=results).evaluate(node)[0]
+        assert calls[("HYG", "LQD")] == 1
+        pd.testing.assert_frame_equal(result, frame(1.4, 1.4, 1.4), check_freq=False)
+
+    def test_only_latest_result_is_kept(self, calls, sources, results, tmp_path):
+        data, source = sources
+        node = spread_node(calls, source("HYG"), source("LQD"))
+        node = Node(key=node.key, fn=node.fn, deps=node.deps, persist=True)
+        for close in (4.0, 4.5, 5.0):
+            data["LQD"] = frame(close, close)
+            Graph(results=results).evaluate(node)
+
+        stored = [meta.parent for meta in tmp_path.glob("*/*/_meta.json")]
+        assert len(stored) == 1
+        assert calls[("HYG", "LQD")] == 3
+        pd.testing.assert_frame_equal(
+            Graph(results=results).evaluate(node)[0], frame(0.5, 0.6), check_freq=False
+        )
+        assert calls[("HYG", "LQD")] == 3
+
+    def test_unused_results_are_pruned(self, calls, sources, tmp_path):
+        _, source = sources
+        hyg, lqd = source("HYG"), source("LQD")
+        spread = spread_node(calls, hyg, lqd)
+        spread = Node(key=spread.key, fn=spread.fn, deps=spread.deps, persist=True)
+        Graph(results=ResultCache(tmp_path)).evaluate(spread)
+        for meta in tmp_path.glob("*/*/_meta.json"):
+            os.utime(meta, (0, 0))
+
+        reversed_spread = spread_node(calls, lqd, hyg)
+        reversed_spread = Node(
+            key=reversed_spread.key, fn=reversed_spread.fn, deps=reversed_spread.deps, persist=True
+        )
+        Graph(results=ResultCache(tmp_path)).evaluate(reversed_spread)
+
+        assert len(list(tmp_path.iterdir())) == 1
+        Graph(results=ResultCache(tmp_path)).evaluate(spread)
+        assert calls[("HYG", "LQD")] == 2
+
+    def test_version_change_invalidates_results(self, calls, sources, tmp_path):
+        _, source = sources
+        node = spread_node(calls, source("HYG"), source("LQD"))
+        node = Node(key=node.key, fn=node.fn, deps=node.deps, persist=True)
+
+        Graph(results=ResultCache(tmp_path, version="1")).evaluate(node)
+        Graph(results=ResultCache(tmp_path, version="2")).evaluate(node)
+
+        assert calls[("HYG", "LQD")] == 2
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute import kernels
+
+
+def test_ratio():
+    np.testing.assert_allclose(kernels.ratio([10.0, 20.0], [4.0, 5.0]), [2.5, 4.0])
+
+
+def test_spread():
+    actual = kernels.spread(pd.Series([5.5, 5.48]), pd.Series([3.2, 3.25]))
+    np.testing.assert_allclose(actual, [2.3, 2.23])
+
+
+@pytest.mark.parametrize(
+    "dividends, expected",
+    [
+        ([2.0, 3.0], [2.0, 3.0]),
+        ([None, 3.0], [0.0, 3.0]),  # missing dividend counts as zero
+        ([np.nan, 3.0], [np.nan, 3.0]),  # not yet known TTM dividend stays missing
+    ],
+)
+def test_ttm_yield(dividends, expected):
+    actual = kernels.ttm_yield(np.array(dividends, dtype=object), [100.0, 100.0])
+    np.testing.assert_allclose(actual, expected)
+
+
+def test_missing_close_raises():
+    with pytest.raises(TypeError):
+        kernels.ttm_yield([1.0], np.array([None], dtype=object))
+
+
+def test_ffill():
+    actual = kernels.ffill([np.nan, 1.0, np.nan, 3.0, np.nan])
+    np.testing.assert_array_equal(actual, [np.nan, 1.0, 1.0, 3.0, 3.0])
+
+
+def test_ffill_columns_independently():
+    actual = kernels.ffill(np.array([[np.nan, 1.0], [2.0, np.nan], [np.nan, np.nan]]))
+    np.testing.assert_array_equal(actual, [[np.nan, 1.0], [2.0, 1.0], [2.0, 1.0]])
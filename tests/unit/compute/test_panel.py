@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute.panel import Panel
+
+
+@pytest.fixture
+def closes():
+    return {
+        "ETH": pd.Series([10.0, 11.0, 12.0], index=pd.date_range("2024-01-01", periods=3)),
+        "SPY": pd.Series([400.0, 401.0], index=pd.to_datetime(["2024-01-02", "2024-01-04"])),
+    }
+
+
+@pytest.fixture
+def panel(closes):
+    return Panel.from_series({"Close": closes})
+
+
+def test_shared_sorted_index(panel):
+    assert list(panel.index) == list(pd.date_range("2024-01-01", periods=4))
+    assert panel.symbols == ["ETH", "SPY"]
+
+
+def test_missing_observations_are_nan(panel):
+    np.testing.assert_array_equal(panel.values("Close", "SPY"), [np.nan, 400.0, np.nan, 401.0])
+
+
+def test_values_are_views(panel):
+    values = panel.values("Close", "ETH")
+    assert np.shares_memory(values, panel.data["Close"])
+    assert values.flags["C_CONTIGUOUS"]
+
+
+def test_series(panel, closes):
+    series = panel.series("Close", "ETH").dropna()
+    pd.testing.assert_series_equal(series, closes["ETH"], check_names=False, check_freq=False)
+
+
+def test_frame(panel):
+    df = panel.frame("Close", ["SPY"])
+    assert list(df.columns) == ["SPY"]
+    assert df["SPY"].count() == 2
+
+
+def test_invalid_shape():
+    with pytest.raises(ValueError, match="Invalid shape"):
+        Panel(pd.date_range("2024-01-01", periods=2), ["A"], {"Close": np.zeros((3, 1))})
@@ -0,0 +1,160 @@
+import multiprocessing
+import time
+import uuid
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute.panel import Panel
+from liquidity.compute import shared as shared_module
+from liquidity.compute.shared import SharedFrame, SharedPanel
+
+
+@pytest.fixture
+def shared():
+    df = pd.DataFrame(
+        {"Close": [1.5, 2.5, np.nan], "Volume": [10, 20, 30]},
+        index=pd.date_range("2024-01-01", periods=3, name="Date"),
+    )
+    handle, shm = SharedFrame.create(df)
+    yield df, handle
+    shm.close()
+    shm.unlink()
+
+
+def test_roundtrip(shared):
+    df, handle = shared
+    attached, block = handle.attach()
+
+    pd.testing.assert_frame_equal(attached, df.astype(float), check_freq=False)
+    del attached
+    block.close()
+
+
+def test_attached_frame_is_read_only(shared):
+    _, handle = shared
+    attached, block = handle.attach()
+
+    with pytest.raises(ValueError):
+        attached.iloc[0, 0] = 0.0
+    del attached
+    block.close()
+
+
+def test_empty_frame():
+    handle, shm = SharedFrame.create(pd.DataFrame({"Close": []}, index=pd.DatetimeIndex([])))
+    attached, block = handle.attach()
+
+    assert attached.empty
+    assert list(attached.columns) == ["Close"]
+    del attached
+    block.close()
+    shm.close()
+    shm.unlink()
+
+
+def make_panel(offset=0.0):
+    index = pd.date_range("2024-01-01", periods=4)
+    return Panel.from_series(
+        {
+            "Close": {
+                "HYG": pd.Series([70.0, 71.0, 72.0, 73.0], index=index) + offset,
+                "LQD": pd.Series([100.0, 101.0], index=index[1:3]) + offset,
+            },
+            "Yield": {"HYG": pd.Series([5.5, 5.6], index=index[:2])},
+        }
+    )
+
+
+@pytest.fixture
+def published():
+    shared = SharedPanel.publish(f"liq-test-{uuid.uuid4().hex[:8]}", make_panel())
+    yield shared
+    shared.close()
+    shared.unlink()
+
+
+def _sum_close(name, queue):
+    shared = SharedPanel.attach(name)
+    queue.put((shared.version, float(np.nansum(shared.panel.data["Close"]))))
+    shared.close()
+
+
+class TestSharedPanel:
+    def test_attach(self, published):
+        expected = make_panel()
+        attached = SharedPanel.attach(published.name)
+
+        assert attached.version == 1
+        assert attached.panel.symbols == expected.symbols
+        pd.testing.assert_index_equal(attached.panel.index, expected.index)
+        for field in expected.fields:
+            np.testing.assert_array_equal(attached.panel.data[field], expected.data[field])
+        pd.testing.assert_series_equal(
+            attached.panel.series("Close", "LQD"), expected.series("Close", "LQD")
+        )
+        attached.close()
+
+    def test_attached_arrays_are_read_only(self, published):
+        attached = SharedPanel.attach(published.name)
+
+        with pytest.raises(ValueError):
+            attached.panel.data["Close"][0, 0] = 0.0
+        attached.close()
+
+    def test_consumers_notice_updates(self, published):
+        attached = SharedPanel.attach(published.name)
+        assert not attached.is_stale
+
+        published.publish_update(make_panel(offset=1.0))
+
+        # The attached version remains readable until refreshed
+        assert attached.is_stale
+        assert attached.panel.values("Close", "HYG")[0] == 70.0
+
+        attached = attached.refresh()
+        assert attached.version == 2
+        assert not attached.is_stale
+        assert attached.panel.values("Close", "HYG")[0] == 71.0
+        attached.close()
+
+    def test_attach_from_other_process(self, published):
+        queue = multiprocessing.get_context("spawn").Queue()
+        for _ in range(2):
+            process = multiprocessing.get_context("spawn").Process(
+                target=_sum_close, args=(published.name, queue)
+            )
+            process.start()
+            process.join()
+            # Exit of a consumer does not remove the published blocks
+            assert queue.get(timeout=10) == (1, 70 + 71 + 72 + 73 + 100 + 101)
+
+    def test_interrupted_publish_keeps_previous_version(self, published):
+        # Publisher died after writing the layout of version 2, before bumping the version
+        offset = shared_module._slot_offset(2)
+        shared_module._SLOT.pack_into(published._header.buf, offset, 2, 10, 0)
+
+        start = time.monotonic()
+        attached = SharedPanel.attach(published.name)
+
+        assert attached.version == 1
+        assert attached.panel.values("Close", "HYG")[0] == 70.0
+        assert time.monotonic() - start < 1.0
+        attached.close()
+
+    def test_corrupted_layout_times_out(self, published, monkeypatch):
+        monkeypatch.setattr(shared_module, "ATTACH_TIMEOUT", 0.05)
+        offset = shared_module._slot_offset(1) + shared_module._SLOT.size
+        published._header.buf[offset] ^= 0xFF
+
+        with pytest.raises(TimeoutError, match="corrupted"):
+            SharedPanel.attach(published.name)
+
+    def test_attach_missing(self):
+        with pytest.raises(FileNotFoundError):
+            SharedPanel.attach(f"liq-test-{uuid.uuid4().hex[:8]}")
+
+    def test_publish_existing_name(self, published):
+        with pytest.raises(FileExistsError):
+            SharedPanel.publish(published.name, make_panel())
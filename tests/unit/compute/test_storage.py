@@ -0,0 +1,147 @@
+import json
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute import frames
+from liquidity.compute.frames import append_frame
+from liquidity.compute.storage import PartitionedStore, read_frame, write_frame
+from liquidity.data.metadata.fields import OHLCV
+
+
+@pytest.fixture
+def data_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir)
+
+
+@pytest.fixture
+def bars():
+    index = pd.date_range("2024-01-30", "2024-02-02", freq="6h", name="Date")
+    values = np.arange(len(index), dtype=np.float64)
+    return pd.DataFrame({OHLCV.Close: values, OHLCV.Volume: values * 10}, index=index)
+
+
+class TestFrameStorage:
+    def test_roundtrip(self, data_dir, bars):
+        write_frame(data_dir / "frame", bars)
+        pd.testing.assert_frame_equal(read_frame(data_dir / "frame"), bars, check_freq=False)
+
+    def test_overwrite_replaces_data_directory(self, data_dir, bars):
+        write_frame(data_dir / "frame", bars)
+        mapped = read_frame(data_dir / "frame")
+
+        write_frame(data_dir / "frame", bars.iloc[:3] * 2)
+
+        pd.testing.assert_frame_equal(
+            read_frame(data_dir / "frame"), bars.iloc[:3] * 2, check_freq=False
+        )
+        pd.testing.assert_frame_equal(mapped, bars, check_freq=False)
+        assert len(list((data_dir / "frame").glob("data-*"))) == 1
+
+    def test_append_writes_only_new_rows(self, data_dir, bars):
+        write_frame(data_dir / "frame", bars.iloc[:8])
+        (first,) = (data_dir / "frame").glob("data-*")
+
+        append_frame(data_dir / "frame", bars.iloc[8:10])
+        append_frame(data_dir / "frame", bars.iloc[10:])
+
+        pd.testing.assert_frame_equal(read_frame(data_dir / "frame"), bars, check_freq=False)
+        pd.testing.assert_frame_equal(
+            read_frame(data_dir / "frame", [OHLCV.Volume], "2024-01-31 12:00", "2024-02-01 18:00"),
+            bars.loc["2024-01-31 12:00":"2024-02-01 18:00", [OHLCV.Volume]],
+            check_freq=False,
+        )
+        appended = [np.load(d / frames.INDEX_FILE) for d in (data_dir / "frame").glob("data-*")]
+        assert first.exists()
+        assert sorted(len(index) for index in appended) == [2, 3, 8]
+
+    def test_appends_are_rewritten_as_one(self, data_dir, bars, monkeypatch):
+        monkeypatch.setattr(frames, "MAX_APPENDED", 2)
+        write_frame(data_dir / "frame", bars.iloc[:4])
+        for start in range(4, len(bars), 3):
+            append_frame(data_dir / "frame", bars.iloc[start : start + 3])
+
+        pd.testing.assert_frame_equal(read_frame(data_dir / "frame"), bars, check_freq=False)
+        assert len(list((data_dir / "frame").glob("data-*"))) <= 3
+
+    def test_read_retries_frame_replaced_while_reading(self, data_dir, bars, monkeypatch):
+        write_frame(data_dir / "frame", bars)
+        read = frames._read_frame
+        calls = []
+
+        def replaced_once(*args):
+            calls.append(args)
+            if len(calls) == 1:
+                raise FileNotFoundError("c0.npy")
+            return read(*args)
+
+        monkeypatch.setattr(frames, "_read_frame", replaced_once)
+
+        pd.testing.assert_frame_equal(read_frame(data_dir / "frame"), bars, check_freq=False)
+        assert len(calls) == 2
+
+    def test_overwrite_of_frame_written_in_place(self, data_dir, bars):
+        # Layout of the earlier versions, the arrays next to the metadata
+        path = data_dir / "frame"
+        path.mkdir()
+        np.save(path / frames.INDEX_FILE, bars.index.to_numpy())
+        np.save(path / "c0.npy", bars[OHLCV.Close].to_numpy())
+        meta = {"index": "Date", "columns": {"Close": "c0.npy"}, "sorted": True}
+        (path / frames.META_FILE).write_text(json.dumps(meta))
+        pd.testing.assert_frame_equal(read_frame(path), bars[["Close"]], check_freq=False)
+
+        write_frame(path, bars * 2)
+
+        pd.testing.assert_frame_equal(read_frame(path), bars * 2, check_freq=False)
+        assert not list(path.glob("*.npy"))
+
+    def test_read_selected_columns(self, data_dir, bars):
+        write_frame(data_dir / "frame", bars)
+        df = read_frame(data_dir / "frame", columns=["Close"])
+        assert list(df.columns) == ["Close"]
+
+    def test_read_date_range(self, data_dir, bars):
+        write_frame(data_dir / "frame", bars)
+        df = read_frame(data_dir / "frame", start="2024-01-31", end="2024-01-31 12:00")
+        pd.testing.assert_frame_equal(
+            df, bars.loc["2024-01-31":"2024-01-31 12:00"], check_freq=False
+        )
+
+
+class TestPartitionedStore:
+    def test_partitions_by_month(self, data_dir, bars):
+        store = PartitionedStore(data_dir)
+        store.write("BTC", "1min", bars)
+
+        assert store.partitions("BTC", "1min") == [pd.Period("2024-01"), pd.Period("2024-02")]
+        assert (data_dir / "BTC" / "1min" / "year=2024" / "month=02").is_dir()
+
+    def test_read_range_across_partitions(self, data_dir, bars):
+        store = PartitionedStore(data_dir)
+        store.write("BTC", "1min", bars)
+
+        df = store.read("BTC", "1min", start="2024-01-31", end="2024-02-01")
+        pd.testing.assert_frame_equal(
+            df, bars.loc["2024-01-31":"2024-02-01 00:00"], check_freq=False
+        )
+
+    def test_write_merges_with_stored_rows(self, data_dir, bars):
+        store = PartitionedStore(data_dir)
+        store.write("BTC", "1min", bars.iloc[:6])
+
+        update = bars.iloc[4:].copy()
+        update[OHLCV.Close] = -1.0
+        store.write("BTC", "1min", update)
+
+        df = store.read("BTC", "1min")
+        assert len(df) == len(bars)
+        assert df.index.is_monotonic_increasing
+        assert (df[OHLCV.Close].iloc[4:] == -1.0).all()
+
+    def test_read_missing_symbol(self, data_dir):
+        with pytest.raises(KeyError):
+            PartitionedStore(data_dir).read("BTC", "1min")
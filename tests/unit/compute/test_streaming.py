@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute.alignment import Calendar, align
+from liquidity.compute.storage import PartitionedStore
+from liquidity.compute.streaming import calendar_join, stream_join, write_chunks
+
+
+def monthly_chunks(df):
+    return [chunk for _, chunk in df.groupby(df.index.to_period("M"))]
+
+
+@pytest.fixture
+def left():
+    index = pd.date_range("2024-01-01", "2024-04-30", freq="D", name="Date")
+    return pd.DataFrame({"Left": np.arange(len(index), dtype=float)}, index=index)
+
+
+@pytest.fixture
+def right():
+    # Weekly observations, the first one before the left series starts
+    index = pd.date_range("2023-12-25", "2024-04-30", freq="W-MON", name="Date")
+    return pd.DataFrame({"Right": np.arange(len(index), dtype=float) * 10}, index=index)
+
+
+def test_inner_join_matches_in_memory_join(left, right):
+    chunks = list(stream_join(monthly_chunks(left), monthly_chunks(right), how="inner"))
+
+    expected = left.join(right, how="inner")
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected, check_freq=False)
+
+
+def test_asof_join_carries_values_across_chunks(left, right):
+    chunks = list(stream_join(monthly_chunks(left), monthly_chunks(right), how="asof"))
+
+    expected = pd.merge_asof(left, right, left_index=True, right_index=True)
+    pd.testing.assert_frame_equal(pd.concat(chunks), expected, check_freq=False)
+
+    # First days of February use the last January observation
+    assert pd.concat(chunks).loc["2024-02-01", "Right"] == right.loc["2024-01-29", "Right"]
+
+
+@pytest.mark.parametrize("calendar", [Calendar.First, Calendar.Intersection])
+def test_join_matches_alignment_with_staleness(left, right, calendar):
+    staleness = pd.Timedelta(days=3)
+
+    chunks = stream_join(
+        monthly_chunks(left),
+        monthly_chunks(right),
+        how=calendar_join(calendar),
+        tolerance=staleness,
+    )
+
+    expected = align([left, right], calendar=calendar, max_staleness=staleness).dropna()
+    pd.testing.assert_frame_equal(pd.concat(list(chunks)), expected, check_freq=False)
+
+
+def test_unsupported_calendar():
+    with pytest.raises(ValueError, match="Union cannot be streamed"):
+        calendar_join(Calendar.Union)
+
+
+def test_empty_right_side(left):
+    assert list(stream_join(monthly_chunks(left), [], how="asof")) == []
+
+
+def test_write_chunks(tmp_path, left):
+    store = PartitionedStore(tmp_path)
+    name = write_chunks(store, "LEFT", "1min", monthly_chunks(left))
+
+    assert store.partitions(name, "1min") == list(pd.period_range("2024-01", "2024-04", freq="M"))
+    pd.testing.assert_frame_equal(store.read(name, "1min"), left, check_freq=False)
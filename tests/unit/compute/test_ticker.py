@@ -1,9 +1,22 @@
+import os
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from liquidity.compute.ticker import Ticker
+from liquidity.compute.cache import InMemoryCacheWithPersistence
+from liquidity.compute.frames import META_FILE, compact
+from liquidity.compute.graph import Graph, ticker_node
+from liquidity.compute.locks import provider_limiter
+from liquidity.compute.storage import PartitionedStore
+from liquidity.compute.ticker import Ticker, memory_report
+from liquidity.data.metadata.fields import Interval
 
 
 @pytest.fixture
@@ -128,7 +141,11 @@ class TestTicker:
 
         df = ticker.yields
 
-        compute_yield_mock.assert_called_once_with(price_data, dividend_data)
+        # Cached inputs are frozen copies of the fetched frames
+        compute_yield_mock.assert_called_once()
+        prices, dividends = compute_yield_mock.call_args.args
+        pd.testing.assert_frame_equal(prices, price_data)
+        pd.testing.assert_frame_equal(dividends, dividend_data)
         pd.testing.assert_frame_equal(df, yield_data)
 
     def test_get_key_method(self, ticker):
@@ -145,3 +162,312 @@ class TestTicker:
         )
         _ = ticker.prices
         mock_provider.get_prices.assert_not_called()
+
+    def test_get_prices_range_from_full_history(self, ticker, mock_provider, price_data):
+        _ = ticker.prices
+
+        df = ticker.get_prices(datetime(2025, 1, 2), datetime(2025, 1, 2))
+
+        mock_provider.get_prices.assert_called_once_with(ticker.symbol)
+        pd.testing.assert_frame_equal(df, price_data.iloc[1:2])
+
+    def test_get_prices_fetches_since_start(self, ticker, mock_provider, price_data):
+        df = ticker.get_prices(datetime(2025, 1, 2))
+        ticker.get_prices(datetime(2025, 1, 2))
+
+        mock_provider.get_prices.assert_called_once_with(ticker.symbol, start=datetime(2025, 1, 2))
+        assert "HYG-prices-since-20250102" in ticker.cache
+        pd.testing.assert_frame_equal(df, price_data.iloc[1:])
+
+    def test_later_starts_served_from_since_key(self, ticker, mock_provider, price_data):
+        ticker.get_prices(datetime(2025, 1, 2))
+
+        df = ticker.get_prices(datetime(2025, 1, 3))
+
+        mock_provider.get_prices.assert_called_once()
+        pd.testing.assert_frame_equal(df, price_data.iloc[2:])
+
+    def test_earlier_start_replaces_since_key(self, ticker, mock_provider, price_data):
+        ticker.get_prices(datetime(2025, 1, 3))
+        ticker.get_prices(datetime(2025, 1, 2))
+
+        assert mock_provider.get_prices.call_count == 2
+        assert [k for k in ticker.cache if "since" in k] == ["HYG-prices-since-20250102"]
+
+    def test_since_key_on_disk(self, ticker, mock_provider, tmp_path, price_data):
+        ticker.cache = InMemoryCacheWithPersistence(tmp_path)
+        ticker.get_prices(datetime(2025, 1, 2))
+        ticker.cache = InMemoryCacheWithPersistence(tmp_path)
+
+        df = ticker.get_prices(datetime(2025, 1, 3))
+
+        mock_provider.get_prices.assert_called_once()
+        pd.testing.assert_frame_equal(df, price_data.iloc[2:], check_freq=False)
+
+    def test_update_appends_to_since_key(self, ticker, mock_provider, price_data):
+        ticker.get_prices(datetime(2025, 1, 2))
+        new = pd.DataFrame({"Price": [103]}, index=pd.DatetimeIndex(["2025-01-04"]))
+
+        ticker.update(prices=pd.concat([price_data, new]))
+
+        assert list(ticker.get_prices(datetime(2025, 1, 3))["Price"]) == [102, 103]
+
+    def test_treasury_yields_cached_in_full(self, ticker, mock_provider, mock_metadata):
+        mock_metadata.is_treasury_yield = True
+
+        ticker.get_yields(datetime(2025, 1, 2))
+        ticker.get_yields(datetime(2025, 1, 3))
+
+        mock_provider.get_treasury_yield.assert_called_once()
+        assert list(ticker.cache) == ["HYG-yields"]
+
+    def test_get_prices_columns(self, ticker, mock_provider):
+        mock_provider.get_prices.return_value = pd.DataFrame(
+            {"Open": [1.0, 2.0], "Close": [1.5, 2.5]}, index=pd.date_range("2025-01-01", periods=2)
+        )
+
+        df = ticker.get_prices(datetime(2025, 1, 1), columns=["Close"])
+
+        assert list(df.columns) == ["Close"]
+
+
+class TestTickerIntraday:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return PartitionedStore(tmp_path)
+
+    @pytest.fixture
+    def intraday_ticker(self, ticker_symbol, mock_metadata, mock_provider, store):
+        def get_intraday_prices(symbol, interval, month):
+            index = pd.date_range(month.start_time, periods=48, freq="h", name="Date")
+            return pd.DataFrame({"Close": range(48), "Volume": [1.0] * 48}, index=index)
+
+        mock_provider.get_intraday_prices.side_effect = get_intraday_prices
+        mock_provider.intraday_timezone = "US/Eastern"
+        return Ticker(ticker_symbol, mock_metadata, mock_provider, cache={}, store=store)
+
+    def test_downloads_each_month(self, intraday_ticker, mock_provider):
+        df = intraday_ticker.intraday_prices(
+            Interval.Hour, start=datetime(2024, 1, 1), end=datetime(2024, 3, 31)
+        )
+
+        assert mock_provider.get_intraday_prices.call_count == 3
+        assert len(df) == 3 * 48
+
+    def test_skips_completed_months(self, intraday_ticker, mock_provider):
+        intraday_ticker.download_intraday(Interval.Hour, datetime(2024, 1, 1), datetime(2024, 2, 1))
+        mock_provider.get_intraday_prices.reset_mock()
+
+        intraday_ticker.download_intraday(Interval.Hour, datetime(2024, 1, 1), datetime(2024, 3, 1))
+
+        requested = [c.args[2] for c in mock_provider.get_intraday_prices.call_args_list]
+        assert requested == [pd.Period("2024-03")]
+
+    @pytest.mark.parametrize(
+        "written_at, complete",
+        [
+            # 00:30 CET on the 1st is still January 31st in New York
+            ("2024-02-01 00:30+01:00", False),
+            ("2024-02-01 06:00-05:00", False),
+            ("2024-02-02 00:30-05:00", True),
+        ],
+    )
+    def test_month_completed_in_exchange_time(self, intraday_ticker, store, written_at, complete):
+        intraday_ticker.download_intraday(Interval.Hour, datetime(2024, 1, 1), datetime(2024, 1, 2))
+        meta = store._path(intraday_ticker.symbol, Interval.Hour, pd.Period("2024-01")) / META_FILE
+        mtime = pd.Timestamp(written_at).timestamp()
+        os.utime(meta, (mtime, mtime))
+
+        assert intraday_ticker._is_complete(Interval.Hour, pd.Period("2024-01")) is complete
+
+    def test_daily_prices_resampled(self, intraday_ticker):
+        df = intraday_ticker.daily_prices(
+            Interval.Hour, start=datetime(2024, 1, 1), end=datetime(2024, 1, 31)
+        )
+
+        assert list(df.index) == [pd.Timestamp("2024-01-01"), pd.Timestamp("2024-01-02")]
+        assert list(df["Close"]) == [23, 47]
+        assert list(df["Volume"]) == [24.0, 24.0]
+
+
+class TestTickerUpdate:
+    @pytest.fixture
+    def history(self):
+        dates = pd.bdate_range("2022-01-03", "2024-12-31")
+        prices = pd.DataFrame({"Close": [100.0 + i % 50 for i in range(len(dates))]}, index=dates)
+        payouts = pd.bdate_range("2022-01-03", "2024-12-31", freq="BQS")
+        dividends = pd.DataFrame(
+            {"Dividends": [0.5 + 0.01 * i for i in range(len(payouts))]}, index=payouts
+        )
+        return prices, dividends
+
+    def test_update_matches_full_computation(self, ticker, mock_provider, mock_metadata, history):
+        prices, dividends = history
+        mock_metadata.distribution_frequency = 4
+        split, dividends_split = "2024-06-30", "2024-06-01"
+
+        mock_provider.get_prices.return_value = prices.loc[:split]
+        mock_provider.get_dividends.return_value = dividends.loc[:dividends_split].copy()
+        _ = ticker.yields
+
+        ticker.update(prices=prices.loc[split:], dividends=dividends.loc[dividends_split:])
+
+        full = Ticker(ticker.symbol, mock_metadata, mock_provider, cache={})
+        mock_provider.get_prices.return_value = prices
+        mock_provider.get_dividends.return_value = dividends.copy()
+        pd.testing.assert_frame_equal(ticker.prices, full.prices, check_freq=False)
+        pd.testing.assert_frame_equal(ticker.dividends, full.dividends, check_freq=False)
+        pd.testing.assert_frame_equal(ticker.yields, full.yields, check_freq=False)
+
+    def test_update_persists_only_new_rows(self, mock_metadata, mock_provider, history, tmp_path):
+        prices, _ = history
+        mock_provider.get_prices.return_value = prices.loc[:"2024-06-30"]
+        cache = InMemoryCacheWithPersistence(tmp_path)
+        ticker = Ticker("HYG", mock_metadata, mock_provider, cache)
+        _ = ticker.prices
+        (history_dir,) = (cache._path("HYG-prices")).glob("data-*")
+
+        ticker.update(prices=prices.loc["2024-07-01":])
+
+        assert history_dir.exists()
+        assert len(list(cache._path("HYG-prices").glob("data-*"))) == 2
+        reloaded = InMemoryCacheWithPersistence(tmp_path)["HYG-prices"]
+        pd.testing.assert_frame_equal(reloaded, prices, check_freq=False)
+        with pytest.raises(ValueError, match="read-only"):
+            ticker.prices.iloc[-1, 0] = 0.0
+
+
+class TestTickerConcurrency:
+    @pytest.fixture
+    def slow_provider(self):
+        dates = pd.bdate_range("2023-01-02", "2024-12-31")
+        payouts = pd.bdate_range("2023-01-02", "2024-12-31", freq="BQS")
+        calls = Counter()
+        lock = threading.Lock()
+
+        def slow(name, df):
+            def fetch(*args, **kwargs):
+                with lock:
+                    calls[name] += 1
+                time.sleep(0.01)
+                return df.copy()
+
+            return fetch
+
+        provider = Mock()
+        provider.get_prices.side_effect = slow(
+            "prices", pd.DataFrame({"Close": [100.0 + i % 7 for i in range(len(dates))]}, dates)
+        )
+        provider.get_dividends.side_effect = slow(
+            "dividends", pd.DataFrame({"Dividends": [0.5] * len(payouts)}, index=payouts)
+        )
+        return provider, calls
+
+    def test_shared_symbols_fetched_once(self, slow_provider, tmp_path, monkeypatch):
+        provider, calls = slow_provider
+        monkeypatch.setenv("CACHE_ENABLED", "true")
+        monkeypatch.setenv("CACHE_DATA_DIR", str(tmp_path))
+        monkeypatch.setattr("liquidity.compute.ticker.get_data_provider", lambda _: provider)
+
+        def request(i):
+            ticker = Ticker.for_symbol("HYG")
+            return ticker.yields, ticker.prices
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(request, range(200)))
+
+        assert calls == Counter({"prices": 1, "dividends": 1})
+        for yields, prices in results:
+            pd.testing.assert_frame_equal(yields, results[0][0], check_freq=False)
+            pd.testing.assert_frame_equal(prices, results[0][1], check_freq=False)
+
+    def test_cached_data_is_not_throttled(self, mock_metadata, price_data):
+        class RateLimitedProvider(Mock):
+            max_concurrency = 1
+            max_calls_per_minute = 1
+
+        provider = RateLimitedProvider()
+        provider.get_prices.return_value = price_data
+        ticker = Ticker("HYG", mock_metadata, provider, {})
+        ticker.prices  # the only request allowed within the minute
+
+        started = time.monotonic()
+        nodes = [ticker_node(ticker, "prices", start=datetime(2024, 1, day)) for day in range(1, 8)]
+        Graph().evaluate(*nodes)
+
+        assert time.monotonic() - started < 5.0
+        assert provider.get_prices.call_count == 1
+        assert not provider_limiter(provider).acquire(blocking=False)
+
+    def test_cached_frames_are_read_only(self, ticker):
+        prices = ticker.prices
+
+        with pytest.raises(ValueError, match="read-only"):
+            prices.iloc[0, 0] = 0.0
+        with pytest.raises(ValueError, match="read-only"):
+            prices["Price"] *= 2
+
+
+class TestLeanMode:
+    @pytest.fixture
+    def ohlcv(self):
+        index = pd.date_range("2024-01-01", periods=250)
+        return pd.DataFrame(
+            {
+                "Close": np.round(np.linspace(100, 200, 250), 2),
+                "Volume": np.arange(250, dtype=float) * 1000,
+            },
+            index=index,
+        )
+
+    def test_compact_dtypes(self, ohlcv):
+        lean = compact(ohlcv.assign(Precise=np.linspace(0, 1, 250) / 3))
+
+        assert lean["Close"].dtype == np.float32
+        assert lean["Volume"].dtype == np.int32
+        # Values with more significant digits than float32 preserves are kept
+        assert lean["Precise"].dtype == np.float64
+        np.testing.assert_array_equal(lean["Close"].astype(float).round(4), ohlcv["Close"])
+        np.testing.assert_array_equal(lean["Volume"], ohlcv["Volume"])
+
+    def test_compact_high_priced_symbols(self):
+        prices = pd.DataFrame(
+            {"Close": [12345.67, 67890.12, 1234.56], "Precise": [123456.78, 1.0, 2.0]},
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+
+        lean = compact(prices)
+
+        assert lean["Close"].dtype == np.float32
+        assert lean["Precise"].dtype == np.float64
+        np.testing.assert_allclose(lean["Close"], prices["Close"], rtol=1e-7)
+
+    def test_compact_keeps_missing_volume(self, ohlcv):
+        ohlcv.iloc[0, 1] = np.nan
+        assert compact(ohlcv)["Volume"].dtype == np.float32
+
+    def test_lean_ticker_stores_compact_frames(self, mock_metadata, mock_provider, ohlcv):
+        mock_provider.get_prices.return_value = ohlcv
+        ticker = Ticker("HYG", mock_metadata, mock_provider, cache={}, lean=True)
+
+        prices = ticker.prices
+
+        assert prices["Close"].dtype == np.float32
+        assert prices["Volume"].dtype == np.int32
+        with pytest.raises(ValueError, match="read-only"):
+            prices.iloc[0, 0] = 0.0
+
+    def test_memory_report(self, mock_metadata, mock_provider, ohlcv):
+        mock_provider.get_prices.return_value = ohlcv
+        loaded = Ticker("HYG", mock_metadata, mock_provider, cache={})
+        _ = loaded.prices
+        empty = Ticker("LQD", mock_metadata, mock_provider, cache={})
+
+        report = memory_report([loaded, empty])
+
+        assert list(report.index) == ["HYG", "LQD"]
+        assert report.loc["HYG", "Rows"] == 250
+        assert report.loc["HYG", "Bytes"] == ohlcv.memory_usage().sum()
+        assert report.loc["HYG", "Lean Bytes"] == 250 * (8 + 4 + 4)
+        assert report.loc["HYG", "Saving"] == pytest.approx(1 - 16 / 24)
+        assert report.loc["LQD"].tolist() == [0, 0, 0, 0.0]
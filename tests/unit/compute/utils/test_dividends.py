@@ -1,7 +1,7 @@
 import pandas as pd
 import pytest
 
-from liquidity.compute.utils.dividends import compute_ttm_dividend
+from liquidity.compute.utils.dividends import compute_ttm_dividend, update_ttm_dividend
 from liquidity.data.metadata.fields import Fields
 
 TTM_DIVIDEND_EXPECTED = f"{Fields.TTM_Dividend}_expected"
@@ -75,3 +75,39 @@ def test_error_for_invalid_dates_order(request, data):
 
     with pytest.raises(ValueError, match="Dates should be sorted in ascending order"):
         compute_ttm_dividend(df)
+
+
+@pytest.mark.parametrize(
+    "split, partial_window", [(3, True), (6, True), (10, True), (10, False), (12, False)]
+)
+def test_update_matches_full_computation(div_data, split, partial_window):
+    dividends = div_data[[Fields.Dividends]]
+    expected = compute_ttm_dividend(dividends.copy(), 4, partial_window)
+
+    previous = compute_ttm_dividend(dividends.iloc[:split].copy(), 4, partial_window)
+    actual = update_ttm_dividend(previous, dividends.iloc[split:], 4, partial_window)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_update_requires_full_window(div_data):
+    dividends = div_data[[Fields.Dividends]]
+    previous = compute_ttm_dividend(dividends.iloc[:6].copy(), 4)
+
+    with pytest.raises(ValueError, match="A year of previous dividends is required"):
+        update_ttm_dividend(previous, dividends.iloc[6:], 4)
+
+
+def test_update_requires_new_dates(div_data):
+    previous = compute_ttm_dividend(div_data[[Fields.Dividends]].copy(), 4, partial_window=True)
+
+    with pytest.raises(ValueError, match="paid after the previous ones"):
+        update_ttm_dividend(previous, div_data[[Fields.Dividends]].iloc[-2:], 4)
+
+
+def test_input_is_not_modified(div_data):
+    dividends = div_data[[Fields.Dividends]].copy()
+
+    compute_ttm_dividend(dividends, dividend_frequency=4)
+
+    assert list(dividends.columns) == [Fields.Dividends]
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from liquidity.compute.utils.resample import resample_ohlcv
+from liquidity.data.metadata.fields import OHLCV
+
+
+def test_resample_ohlcv_to_daily():
+    index = pd.to_datetime(
+        ["2025-01-02 09:30", "2025-01-02 12:00", "2025-01-02 15:59", "2025-01-06 10:00"]
+    )
+    bars = pd.DataFrame(
+        {
+            OHLCV.Open: [10.0, 11.0, 12.0, 20.0],
+            OHLCV.High: [11.0, 14.0, 13.0, 21.0],
+            OHLCV.Low: [9.0, 10.5, 11.0, 19.0],
+            OHLCV.Close: [11.0, 12.0, 12.5, 20.5],
+            OHLCV.Volume: [100.0, 200.0, 300.0, 50.0],
+        },
+        index=index,
+    )
+
+    expected = pd.DataFrame(
+        {
+            OHLCV.Open: [10.0, 20.0],
+            OHLCV.High: [14.0, 21.0],
+            OHLCV.Low: [9.0, 19.0],
+            OHLCV.Close: [12.5, 20.5],
+            OHLCV.Volume: [600.0, 50.0],
+        },
+        index=pd.DatetimeIndex(["2025-01-02", "2025-01-06"], name="Date"),
+    )
+
+    # Weekend without bars should not produce empty daily rows
+    pd.testing.assert_frame_equal(resample_ohlcv(bars), expected, check_freq=False)
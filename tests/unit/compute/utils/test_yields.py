@@ -1,7 +1,7 @@
 import pandas as pd
 import pytest
 
-from liquidity.compute.utils.yields import compute_dividend_yield
+from liquidity.compute.utils.yields import compute_dividend_yield, update_dividend_yield
 from liquidity.data.metadata.fields import OHLCV, Fields
 
 
@@ -54,3 +54,28 @@ def test_no_dividends(sample_prices):
     # There are no dividends so expected yield is 0
     expected = pd.DataFrame({Fields.Yield: [0.0, 0.0, 0.0, 0.0]}, index=sample_prices.index)
     pd.testing.assert_frame_equal(result, expected)
+
+
+def test_other_columns_are_ignored(sample_prices, sample_dividends):
+    prices = sample_prices.assign(**{OHLCV.Open: 1.0, OHLCV.Volume: 1000})
+    dividends = sample_dividends.assign(**{Fields.Dividends: 0.5})
+
+    result = compute_dividend_yield(prices, dividends)
+
+    pd.testing.assert_frame_equal(result, compute_dividend_yield(sample_prices, sample_dividends))
+
+
+def test_update_matches_full_computation():
+    index = pd.bdate_range("2025-01-01", periods=10)
+    prices = pd.DataFrame({OHLCV.Close: [100.0 + i for i in range(10)]}, index=index)
+    # Dividends paid on 2025-01-04 (weekend) are ignored, as in the full computation
+    dividends = pd.DataFrame(
+        {Fields.TTM_Dividend: [2.0, 2.5, 3.0]},
+        index=pd.to_datetime(["2025-01-02", "2025-01-04", "2025-01-10"]),
+    )
+    expected = compute_dividend_yield(prices, dividends)
+
+    for split in (1, 3, 7, 9):
+        previous = compute_dividend_yield(prices.iloc[:split], dividends)
+        actual = update_dividend_yield(previous, prices, dividends)
+        pd.testing.assert_frame_equal(actual, expected)
@@ -16,3 +16,9 @@ def pytest_addoption(parser):
 @pytest.fixture
 def unittest_fixtures_dir():
     return os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+@pytest.fixture(autouse=True)
+def disable_cache(monkeypatch):
+    """Do not persist data or derived results in the user's cache directory."""
+    monkeypatch.setenv("CACHE_ENABLED", "false")
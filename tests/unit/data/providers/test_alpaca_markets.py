@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 import pandas as pd
 import pytest
 
+from liquidity.data.metadata.fields import Interval
 from liquidity.data.providers.alpaca_markets import AlpacaCryptoDataProvider
 
 
@@ -74,3 +75,19 @@ def test_get_treasury_yield_raises():
     provider = AlpacaCryptoDataProvider()
     with pytest.raises(RuntimeError, match="Not available for Crypto"):
         provider.get_treasury_yield("10Y")
+
+
+def test_get_intraday_prices(mock_alpaca_client):
+    provider = AlpacaCryptoDataProvider()
+    df = provider.get_intraday_prices("BTC", Interval.Hour, pd.Period("2023-01"))
+
+    request_params = mock_alpaca_client.get_crypto_bars.call_args[0][0]
+
+    # validate call parameters
+    assert request_params.symbol_or_symbols == "BTC/USD"
+    assert str(request_params.timeframe) == "1Hour"
+    assert request_params.start == datetime(2023, 1, 1)
+
+    # intraday timestamps are not truncated to dates
+    assert list(df.index) == [pd.Timestamp("2023-01-01 06:00"), pd.Timestamp("2023-01-02 06:00")]
+    assert df.index.name == "Date"
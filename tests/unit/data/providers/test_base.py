@@ -0,0 +1,23 @@
+import pandas as pd
+import pytest
+
+from liquidity.data.metadata.fields import Interval
+from liquidity.data.providers.base import DataProviderBase
+
+
+class DailyProvider(DataProviderBase):
+    def get_prices(self, ticker, start=None):
+        return pd.DataFrame()
+
+    def get_dividends(self, ticker):
+        return pd.DataFrame()
+
+    def get_treasury_yield(self, maturity):
+        return pd.DataFrame()
+
+
+def test_intraday_prices_are_optional():
+    provider = DailyProvider()
+
+    with pytest.raises(NotImplementedError, match="DailyProvider does not provide intraday"):
+        provider.get_intraday_prices("SPY", Interval.Hour, pd.Period("2024-01"))
@@ -15,6 +15,7 @@ def mock_provider():
     whose get_data() and get_metadata() return dummy data.
     """
     provider = mock.Mock()
+    provider.max_concurrency = 4
 
     def get_metadata(ticker):
         return FredEconomicData(
@@ -125,7 +126,7 @@ def test_liquidity_index_calculation(
         "WTREGEN": liquidity_series_factory(case.wtregen),
     }
 
-    def get_data(ticker):
+    def get_data(ticker, start=None):
         return series_mapping[ticker]
 
     mock_provider.get_data.side_effect = get_data
@@ -324,3 +325,46 @@ def test_currency_conversion_with_misaligned_dates(mock_provider, fx_series_fact
     # Evaluate the result
     expected = pd.Series([11.0, 24.0], index=[dates[0], dates[1]])
     pd.testing.assert_series_equal(actual["Close"], expected, check_names=False)
+
+
+def test_update_matches_full_recompute(mock_provider):
+    """Incremental update gives the same result as rebuilding the whole history."""
+    dates = pd.date_range(start="2020-01-01", periods=10, freq="W")
+    rng = np.random.default_rng(42)
+    full = {
+        ticker: pd.DataFrame({"Close": rng.uniform(100, 200, len(dates))}, index=dates)
+        for ticker in ("ECBASSETSW", "WALCL", "WRESBAL", "RRPONTSYD", "WTREGEN")
+    }
+    # WALCL is published a day later than the other series
+    full["WALCL"].index = dates + pd.Timedelta(days=1)
+
+    # Initially the last two observations are missing, the 7th one is revised later
+    initial = {ticker: df.iloc[:-2].copy() for ticker, df in full.items()}
+    initial["WALCL"].iloc[6, 0] = 1.0
+
+    mock_provider.get_data.side_effect = lambda ticker: initial[ticker]
+    model = GlobalLiquidity(provider=mock_provider)
+    model.df
+
+    updated = model.update(
+        {
+            "WALCL": full["WALCL"].iloc[6:],
+            "WRESBAL": full["WRESBAL"].iloc[-2:],
+        }
+    )
+    model.update({ticker: full[ticker].iloc[-2:] for ticker in ("ECBASSETSW", "RRPONTSYD")})
+    updated = model.update({"WTREGEN": full["WTREGEN"].iloc[-2:]})
+
+    mock_provider.get_data.side_effect = lambda ticker: full[ticker]
+    expected = GlobalLiquidity(provider=mock_provider).df
+
+    pd.testing.assert_frame_equal(updated, expected)
+    pd.testing.assert_frame_equal(model.raw_data, expected.drop(columns="Liquidity Index"))
+
+
+def test_update_unknown_component(mock_provider, liquidity_series_factory):
+    mock_provider.get_data.return_value = liquidity_series_factory(1.0)
+    model = GlobalLiquidity(provider=mock_provider)
+
+    with pytest.raises(KeyError):
+        model.update({"JPNASSETS": liquidity_series_factory(2.0)})
@@ -0,0 +1,80 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from liquidity.compute.graph import Graph
+from liquidity.compute.panel import Panel
+from liquidity.models.parallel import ProcessPoolEvaluator
+from liquidity.models.price_ratio import PriceRatio
+from liquidity.models.yield_spread import YieldSpread
+
+DATES = pd.date_range("2024-01-01", periods=6, freq="B")
+
+
+class MockTicker:
+    def __init__(self, symbol, prices, dividends=None, yields=None):
+        self.symbol = symbol
+        self.prices = prices
+        self.dividends = dividends
+        self.yields = yields
+        self.metadata = SimpleNamespace(is_treasury_yield=yields is not None)
+        self.provider = None
+
+    def get_prices(self, start=None, end=None, columns=None):
+        return self.prices.loc[start:end, columns or slice(None)]
+
+    def get_dividends(self, start=None, end=None, columns=None):
+        return self.dividends.loc[start:end, columns or slice(None)]
+
+    def get_yields(self, start=None, end=None):
+        return self.yields.loc[start:end]
+
+    @staticmethod
+    def for_symbol(symbol: str):
+        if symbol == "UST-10Y":
+            yields = pd.DataFrame({"Yield": [4.0, 4.1, 4.2]}, index=DATES[::2])
+            return MockTicker(symbol, None, yields=yields)
+
+        offset = {"HYG": 0.0, "LQD": 20.0, "SPY": 400.0}[symbol]
+        prices = pd.DataFrame({"Close": [offset + 70 + i for i in range(6)]}, index=DATES)
+        dividends = pd.DataFrame(
+            {"Dividends": [0.3, 0.35], "TTM_Dividend": [3.6, 3.65]}, index=DATES[[1, 4]]
+        )
+        return MockTicker(symbol, prices, dividends)
+
+
+@pytest.fixture
+def mock_tickers(monkeypatch):
+    monkeypatch.setattr("liquidity.models.price_ratio.Ticker", MockTicker)
+    monkeypatch.setattr("liquidity.models.yield_spread.Ticker", MockTicker)
+
+
+def test_results_match_models(mock_tickers):
+    graph = Graph()
+    models = [
+        YieldSpread("HYG", "UST-10Y", graph=graph),
+        YieldSpread("LQD", "UST-10Y", graph=graph),
+        YieldSpread("HYG", "LQD", graph=graph, start_date=DATES[2]),
+        PriceRatio("HYG", "SPY", graph=graph),
+        PriceRatio("LQD", "SPY", graph=graph, end_date=DATES[3]),
+    ]
+
+    results = ProcessPoolEvaluator(max_workers=2, graph=graph).evaluate(models)
+
+    assert len(results) == len(models)
+    for model, result in zip(models, results):
+        pd.testing.assert_frame_equal(result, model.df, check_freq=False)
+
+
+def test_no_models():
+    assert ProcessPoolEvaluator(max_workers=2, graph=Graph()).evaluate([]) == []
+
+
+def test_panel_models_are_rejected(mock_tickers):
+    close = pd.Series([1.0], index=DATES[:1])
+    panel = Panel.from_series({"Close": {"HYG": close, "SPY": close * 2}})
+    model = PriceRatio("HYG", "SPY", panel=panel, graph=Graph())
+
+    with pytest.raises(ValueError):
+        ProcessPoolEvaluator(graph=Graph()).evaluate([model])
@@ -1,6 +1,15 @@
+from datetime import datetime
+from unittest.mock import Mock
+
 import pandas as pd
 import pytest
 
+from liquidity.compute.alignment import Calendar
+from liquidity.compute.graph import Graph
+from liquidity.compute.panel import Panel
+from liquidity.compute.storage import PartitionedStore
+from liquidity.compute.ticker import Ticker
+from liquidity.data.metadata.fields import Interval
 from liquidity.models.price_ratio import PriceRatio
 
 
@@ -8,6 +17,10 @@ class MockTicker:
     def __init__(self, symbol, prices):
         self.symbol = symbol
         self.prices = prices
+        self.provider = None
+
+    def get_prices(self, start=None, end=None, columns=None):
+        return self.prices.loc[start:end, columns or slice(None)]
 
     @staticmethod
     def for_symbol(symbol: str):
@@ -64,3 +77,85 @@ class TestPriceRatio:
         )
 
         pd.testing.assert_frame_equal(ratio.df, expected)
+
+    def test_update_appends_new_dates(self, mock_tickers):
+        ratio = PriceRatio("ETH", "BTC", calendar=Calendar.Union)
+        initial = ratio.df
+        dates = pd.date_range("2023-01-04", periods=2)
+        ratio.ticker.prices = pd.concat(
+            [ratio.ticker.prices, pd.DataFrame({"Close": [1500.0, 1550.0]}, index=dates)]
+        )
+        ratio.benchmark.prices = pd.concat(
+            [ratio.benchmark.prices, pd.DataFrame({"Close": [19000.0]}, index=dates[:1])]
+        )
+
+        updated = ratio.update()
+
+        expected = PriceRatio("ETH", "BTC", calendar=Calendar.Union)
+        expected.ticker, expected.benchmark = ratio.ticker, ratio.benchmark
+        pd.testing.assert_frame_equal(updated, expected.df)
+        pd.testing.assert_frame_equal(updated.iloc[:3], initial)
+        assert ratio.df is updated
+
+    def test_invalidate_after_revision(self, mock_tickers):
+        ratio = PriceRatio("ETH", "BTC")
+        _ = ratio.df
+        ratio.ticker.prices = ratio.ticker.prices * 2
+
+        assert ratio.update()["CloseETH"].iloc[0] == 1400.5
+        ratio.invalidate()
+        assert ratio.df["CloseETH"].iloc[0] == 2801.0
+
+    def test_price_ratio_from_panel(self, mock_tickers):
+        tickers = [MockTicker.for_symbol(symbol) for symbol in ("ETH", "BTC")]
+        panel = Panel.from_series({"Close": {t.symbol: t.prices["Close"] for t in tickers}})
+
+        ratio = PriceRatio("ETH", "BTC", panel=panel)
+        expected = PriceRatio("ETH", "BTC").df
+
+        pd.testing.assert_frame_equal(ratio.df, expected, check_freq=False, check_names=False)
+
+    def test_new_panels_are_not_served_from_shared_graph(self, mock_tickers):
+        graph = Graph()
+        for scale in range(1, 20):
+            # Freed panels may be replaced at the same address
+            panel = Panel.from_series(
+                {
+                    "Close": {
+                        "ETH": pd.Series([scale * 1.0], index=pd.DatetimeIndex(["2024-01-01"])),
+                        "BTC": pd.Series([1.0], index=pd.DatetimeIndex(["2024-01-01"])),
+                    }
+                }
+            )
+            ratio = PriceRatio("ETH", "BTC", panel=panel, graph=graph).df
+            assert list(ratio["Ratio"]) == [scale]
+
+
+class TestPriceRatioStream:
+    @pytest.fixture
+    def store(self, tmp_path):
+        return PartitionedStore(tmp_path)
+
+    @pytest.fixture
+    def stream_tickers(self, monkeypatch, store):
+        closes = {"ETH": 2000.0, "BTC": 40000.0}
+
+        def for_symbol(symbol):
+            def get_intraday_prices(ticker, interval, month):
+                index = pd.date_range(month.start_time, periods=24, freq="h", name="Date")
+                return pd.DataFrame({"Close": [closes[ticker]] * 24}, index=index)
+
+            provider = Mock(intraday_timezone="UTC")
+            provider.get_intraday_prices.side_effect = get_intraday_prices
+            return Ticker(symbol, Mock(), provider, cache={}, store=store)
+
+        monkeypatch.setattr("liquidity.models.price_ratio.Ticker.for_symbol", for_symbol)
+
+    def test_stream_writes_ratio_to_store(self, stream_tickers, store):
+        ratio = PriceRatio("ETH", "BTC")
+        name = ratio.stream(Interval.Hour, start=datetime(2024, 1, 1), end=datetime(2024, 3, 31))
+
+        df = store.read(name, Interval.Hour)
+        assert list(df.columns) == ["CloseETH", "CloseBTC", "Ratio"]
+        assert len(df) == 3 * 24
+        assert (df["Ratio"] == 0.05).all()
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute.panel import Panel
+from liquidity.models.screen import PairScreen
+
+
+@pytest.fixture
+def dates():
+    return pd.date_range("2024-01-01", periods=4)
+
+
+@pytest.fixture
+def panel(dates):
+    closes = {
+        "A": pd.Series([10.0, 20.0, 30.0, 40.0], index=dates),
+        "B": pd.Series([5.0, 5.0, 10.0, 10.0], index=dates),
+        "C": pd.Series([1.0, 2.0, np.nan, 8.0], index=dates),
+    }
+    yields = {
+        "A": pd.Series([5.0, 5.5, 6.0, 6.5], index=dates),
+        "B": pd.Series([3.0, np.nan, 4.0, np.nan], index=dates),  # weekly-like series
+    }
+    return Panel.from_series({"Close": closes, "Yield": yields})
+
+
+def test_ratios_of_all_pairs(panel):
+    ratios = PairScreen(["A", "B", "C"], panel=panel).ratios()
+
+    assert len(ratios.columns) == 6  # 3 x 3 pairs without the diagonal
+    assert ("A", "A") not in ratios.columns
+    np.testing.assert_allclose(ratios[("A", "B")], [2.0, 4.0, 3.0, 4.0])
+    np.testing.assert_allclose(ratios[("C", "A")], [0.1, 0.1, np.nan, 0.2])
+
+
+def test_ratios_against_benchmarks(panel):
+    ratios = PairScreen(["A", "C"], benchmarks=["B"], panel=panel).ratios()
+    assert list(ratios.columns) == [("A", "B"), ("C", "B")]
+
+
+def test_spreads_forward_fill_benchmark(panel):
+    spreads = PairScreen(["A"], benchmarks=["B"], panel=panel).spreads()
+    np.testing.assert_allclose(spreads[("A", "B")], [2.0, 2.5, 2.0, 2.5])
+
+
+def test_latest_ranked(panel, dates):
+    latest = PairScreen(["A", "B", "C"], panel=panel).latest("Ratio")
+
+    assert latest.index[0] == ("A", "C")
+    assert list(latest["Rank"]) == list(range(1, 7))
+    assert latest["Ratio"].is_monotonic_decreasing
+    assert latest.loc[("A", "B"), "Date"] == dates[-1]
+    assert latest.loc[("A", "B"), "Ratio"] == 4.0
+
+
+def test_latest_invalid_series(panel):
+    with pytest.raises(ValueError, match="Unsupported series"):
+        PairScreen(["A", "B"], panel=panel).latest("Volume")
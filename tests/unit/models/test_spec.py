@@ -0,0 +1,128 @@
+from collections import Counter
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute.alignment import Calendar
+from liquidity.data.metadata.entities import FredEconomicData
+from liquidity.models.liquidity import GlobalLiquidity
+from liquidity.models.spec import (
+    BUILTIN_SPECS,
+    Component,
+    LiquidityEngine,
+    LiquiditySpec,
+)
+
+DATES = pd.date_range(start="2020-01-01", periods=4, freq="W")
+
+METADATA = {
+    "ECBASSETSW": ("Billions", "USD"),
+    "WALCL": ("Millions", "USD"),
+    "WRESBAL": ("Billions", "USD"),
+    "RRPONTSYD": ("Billions", "USD"),
+    "WTREGEN": ("Billions", "USD"),
+    "JPNASSETS": ("100 Million", "JPY"),
+}
+
+DATA = {
+    "ECBASSETSW": [10.0, 20.0, 30.0, 40.0],
+    "WALCL": [8000.0, 8100.0, 8200.0, 8300.0],
+    "WRESBAL": [3.0, 3.0, 3.0, 3.0],
+    "RRPONTSYD": [1.0, 2.0, 1.0, 2.0],
+    "WTREGEN": [0.5, 0.5, 0.5, 0.5],
+    "JPNASSETS": [7500.0, 7500.0, 7500.0, 7500.0],
+    "DEXJPUS": [150.0, 150.0, 125.0, 125.0],
+}
+
+SPEC_TOML = """
+name = "Fed and BoJ"
+frequency = "W-FRI"
+max_staleness = "14D"
+
+[[components]]
+name = "Fed Balance Sheet"
+ticker = "WALCL"
+
+[[components]]
+name = "BoJ Balance Sheet"
+ticker = "JPNASSETS"
+"""
+
+
+@pytest.fixture
+def fetches():
+    return Counter()
+
+
+@pytest.fixture
+def provider(fetches):
+    provider = mock.Mock()
+    provider.max_concurrency = 4
+
+    def get_data(ticker):
+        fetches[ticker] += 1
+        return pd.DataFrame({"Close": DATA[ticker]}, index=DATES)
+
+    def get_metadata(ticker):
+        unit, currency = METADATA[ticker]
+        return FredEconomicData(ticker=ticker, name=ticker, unit=unit, currency=currency)
+
+    provider.get_data.side_effect = get_data
+    provider.get_metadata.side_effect = get_metadata
+    return provider
+
+
+class TestLiquiditySpec:
+    def test_from_file(self, tmp_path):
+        path = tmp_path / "spec.toml"
+        path.write_text(SPEC_TOML)
+
+        spec = LiquiditySpec.from_file(path)
+
+        assert spec == LiquiditySpec(
+            name="Fed and BoJ",
+            components=(
+                Component(name="Fed Balance Sheet", ticker="WALCL"),
+                Component(name="BoJ Balance Sheet", ticker="JPNASSETS"),
+            ),
+            frequency=Calendar.Weekly,
+            max_staleness=pd.Timedelta(days=14),
+        )
+
+    def test_unsupported_file(self, tmp_path):
+        with pytest.raises(ValueError):
+            LiquiditySpec.from_file(tmp_path / "spec.yaml")
+
+    def test_invalid_sign(self):
+        with pytest.raises(ValueError):
+            Component(name="Reverse Repo", ticker="RRPONTSYD", sign=0)
+
+
+class TestLiquidityEngine:
+    def test_global_spec_matches_model(self, provider):
+        engine = LiquidityEngine(provider=provider)
+
+        result = engine.evaluate(BUILTIN_SPECS["Global"])[0]
+
+        expected = GlobalLiquidity(provider=provider).df
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_currency_and_unit_conversion(self, provider):
+        spec = LiquiditySpec(name="BoJ", components=(Component(name="BoJ", ticker="JPNASSETS"),))
+
+        result = LiquidityEngine(provider=provider).evaluate(spec)[0]
+
+        # 7500 x 100 Million JPY = 750 Billion JPY
+        expected = 750.0 / np.array(DATA["DEXJPUS"])
+        np.testing.assert_allclose(result["Liquidity Index"], expected)
+
+    def test_series_fetched_once(self, provider, fetches):
+        engine = LiquidityEngine(provider=provider)
+
+        indexes = engine.compare(BUILTIN_SPECS.values())
+
+        assert list(indexes.columns) == ["Fed", "Global", "G3"]
+        assert set(fetches.values()) == {1}
+        assert set(fetches) == set(DATA)
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from liquidity.models.yield_spread import YieldSpread
+
+
+class MockTicker:
+    def __init__(self, symbol, yields):
+        self.symbol = symbol
+        self.yields = yields
+        # Yields are provided directly, the same way as for treasuries
+        self.metadata = SimpleNamespace(is_treasury_yield=True)
+        self.provider = None
+
+    def get_yields(self, start=None, end=None):
+        return self.yields.loc[start:end]
+
+    @staticmethod
+    def for_symbol(symbol: str):
+        data = {
+            "HYG": pd.DataFrame(
+                {"Yield": [5.5, 5.48, 5.51, 5.6]},
+                index=pd.date_range("2023-01-02", periods=4, freq="B"),
+            ),
+            # Weekly series observed on Sundays, never on the ETF dates
+            "UST-10Y": pd.DataFrame(
+                {"Yield": [3.8, 3.9]},
+                index=pd.to_datetime(["2023-01-01", "2023-01-08"]),
+            ),
+        }
+        return MockTicker(symbol, data[symbol])
+
+
+@pytest.fixture
+def mock_tickers(monkeypatch):
+    monkeypatch.setattr("liquidity.models.yield_spread.Ticker", MockTicker)
+
+
+class TestYieldSpread:
+    def test_benchmark_carried_forward(self, mock_tickers):
+        spread = YieldSpread("HYG", "UST-10Y")
+
+        expected = pd.DataFrame(
+            {
+                "YieldHYG": [5.5, 5.48, 5.51, 5.6],
+                "YieldUST-10Y": [3.8, 3.8, 3.8, 3.8],
+                "Spread": [5.5 - 3.8, 5.48 - 3.8, 5.51 - 3.8, 5.6 - 3.8],
+            },
+            index=pd.date_range("2023-01-02", periods=4, freq="B"),
+        )
+        pd.testing.assert_frame_equal(spread.df, expected, check_freq=False)
+
+    def test_max_staleness(self, mock_tickers):
+        spread = YieldSpread("HYG", "UST-10Y", max_staleness=pd.Timedelta(days=2))
+        assert list(spread.df.index) == list(pd.date_range("2023-01-02", periods=2))
+
+    def test_update_carries_benchmark_forward(self, mock_tickers):
+        spread = YieldSpread("HYG", "UST-10Y")
+        _ = spread.df
+        spread.ticker.yields = pd.concat(
+            [
+                spread.ticker.yields,
+                pd.DataFrame({"Yield": [5.7, 5.65]}, index=pd.to_datetime(["2023-01-06", "2023-01-09"])),
+            ]
+        )
+
+        updated = spread.update()
+
+        assert list(updated["YieldUST-10Y"].iloc[-2:]) == [3.8, 3.9]
+        assert list(updated["Spread"].iloc[-2:]) == [5.7 - 3.8, 5.65 - 3.9]
+        assert len(updated) == 6
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from liquidity.visuals import Chart
+from liquidity.visuals.downsample import downsample, downsample_frame, lttb, resample_traces
+
+
+@pytest.fixture
+def long_series():
+    index = pd.date_range("2000-01-01", periods=10_000)
+    values = np.sin(np.linspace(0, 20, 10_000))
+    values[4321] = 5.0  # single-day spike
+    return pd.Series(values, index=index, name="Ratio")
+
+
+def test_lttb_selects_endpoints_and_count():
+    x = np.arange(1000)
+    selected = lttb(x, np.cos(x / 50), 100)
+
+    assert len(selected) == 100
+    assert selected[0] == 0
+    assert selected[-1] == 999
+    assert np.all(np.diff(selected) > 0)
+
+
+def test_lttb_short_input_unchanged():
+    np.testing.assert_array_equal(lttb(np.arange(5), np.arange(5), 10), np.arange(5))
+
+
+def test_downsample_keeps_spikes(long_series):
+    result = downsample(long_series, 500)
+
+    assert len(result) == 500
+    assert result.max() == 5.0
+    assert result.min() == pytest.approx(long_series.min(), abs=1e-3)
+
+
+def test_downsample_short_series_unchanged(long_series):
+    assert downsample(long_series, None) is long_series
+    pd.testing.assert_series_equal(downsample(long_series.iloc[:100], 500), long_series.iloc[:100])
+
+
+def test_downsample_frame_shares_dates(long_series):
+    df = pd.DataFrame({"A": long_series, "B": long_series * 2})
+    df["Total"] = df["A"] + df["B"]
+
+    result = downsample_frame(df, "Total", 300)
+
+    assert len(result) == 300
+    pd.testing.assert_frame_equal(result, df.loc[result.index])
+
+
+def test_resample_traces_restores_full_resolution(long_series):
+    fig = go.Figure(go.Scatter(x=[], y=[]))
+
+    resample_traces(fig, [long_series], None, 1000)
+    assert len(fig.data[0].y) == 1000
+
+    resample_traces(fig, [long_series], ["2001-01-01", "2001-03-31"], 1000)
+    np.testing.assert_array_equal(fig.data[0].y, long_series.loc["2001-01-01":"2001-03-31"])
+
+
+def test_chart_traces_downsampled(long_series):
+    data = long_series.to_frame().assign(Other=long_series * 2)
+    chart = Chart(data, "Title", main_series="Ratio", secondary_series=["Other"], max_points=800)
+
+    fig = chart.generate_figure()
+
+    assert [len(trace.y) for trace in fig.data] == [800, 800]
+    assert len(Chart(data, "Title", "Ratio", max_points=None).generate_figure().data[0].y) == 10_000
@@ -0,0 +1,115 @@
+from collections import Counter
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.compute.graph import Graph
+from liquidity.models.price_ratio import PriceRatio
+from liquidity.visuals import Chart, ChartMatrix
+
+fetches = Counter()
+ranges = []
+
+
+class MockTicker:
+    provider = SimpleNamespace(max_concurrency=2)
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    @property
+    def prices(self):
+        fetches[self.symbol] += 1
+        return pd.DataFrame(
+            {"Close": [10.0, 11.0, 12.0]},
+            index=pd.date_range("2024-01-01", periods=3),
+        )
+
+    def get_prices(self, start, end, columns=None):
+        ranges.append((self.symbol, start, end))
+        return self.prices.loc[start:end, columns]
+
+    @staticmethod
+    def for_symbol(symbol: str):
+        return MockTicker(symbol)
+
+
+@pytest.fixture
+def mock_tickers(monkeypatch):
+    fetches.clear()
+    ranges.clear()
+    monkeypatch.setattr("liquidity.models.price_ratio.Ticker", MockTicker)
+
+
+def test_shared_inputs_are_fetched_once(mock_tickers):
+    models = [PriceRatio(symbol, "SPY") for symbol in ("QQQ", "IWM", "DIA")]
+    graphs = [model.graph for model in models]
+
+    matrix = ChartMatrix(models)
+
+    assert fetches == Counter({"SPY": 1, "QQQ": 1, "IWM": 1, "DIA": 1})
+    assert [chart.title for chart in matrix.charts] == [
+        "QQQ/SPY Price Ratio",
+        "IWM/SPY Price Ratio",
+        "DIA/SPY Price Ratio",
+    ]
+    # The caller's models are not modified
+    assert [model.graph for model in models] == graphs
+
+
+def test_date_range_is_pushed_down(mock_tickers):
+    start = pd.Timestamp("2024-01-02")
+    models = [PriceRatio("QQQ", "SPY"), PriceRatio("IWM", "SPY", start_date="2024-01-03")]
+
+    matrix = ChartMatrix(models, start_date=start)
+
+    assert models[0].start_date is None
+    assert models[1].start_date == pd.Timestamp("2024-01-03")
+    assert sorted(ranges) == [
+        ("IWM", pd.Timestamp("2024-01-03"), None),
+        ("QQQ", start, None),
+        ("SPY", start, None),
+        ("SPY", pd.Timestamp("2024-01-03"), None),
+    ]
+    assert matrix.charts[0].data.index[0] == start
+    assert models[0].df.index[0] == pd.Timestamp("2024-01-01")
+
+
+class StubModel:
+    def __init__(self, n):
+        self.n = n
+
+    def get_chart(self):
+        data = pd.DataFrame(
+            {"Ratio": np.arange(10.0) * self.n}, index=pd.date_range("2024-01-01", periods=10)
+        )
+        return Chart(data, f"Chart {self.n}", "Ratio")
+
+
+@pytest.fixture
+def large_matrix():
+    return ChartMatrix([StubModel(n) for n in range(1, 21)], graph=Graph(), max_points=None)
+
+
+def test_pages(large_matrix):
+    assert large_matrix.page_count(8) == 3
+
+    pages = large_matrix.pages(8)
+
+    assert [len(fig.data) for fig in pages] == [8, 8, 4]
+    assert pages[2].layout.title.text == "Liquidity Proxies (3/3)"
+    assert [a.text for a in pages[2].layout.annotations] == [
+        f"Chart {n}" for n in range(17, 21)
+    ]
+    with pytest.raises(ValueError):
+        large_matrix.page_figure(4, 8)
+
+
+def test_sparklines(large_matrix):
+    grid = large_matrix.sparklines(columns=5)
+
+    assert len(grid.series) == 20
+    assert grid.series[1][0] == "Chart 2"
+    assert grid.series[1][1].iloc[-1] == 18.0
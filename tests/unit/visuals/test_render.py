@@ -0,0 +1,75 @@
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from liquidity.compute.graph import Graph
+from liquidity.models.liquidity import GlobalLiquidity
+from liquidity.visuals import Chart, ChartMatrix
+from liquidity.visuals.render import WEBGL_THRESHOLD, scatter_type
+
+
+@pytest.mark.parametrize(
+    "points, webgl, expected",
+    [
+        (100, None, go.Scatter),
+        (WEBGL_THRESHOLD + 1, None, go.Scattergl),
+        (WEBGL_THRESHOLD + 1, False, go.Scatter),
+        (100, True, go.Scattergl),
+    ],
+)
+def test_scatter_type(points, webgl, expected):
+    assert scatter_type(points, webgl) is expected
+
+
+def make_chart(periods, **kwargs):
+    data = pd.DataFrame(
+        {"Ratio": np.arange(periods, dtype=float), "Other": np.ones(periods)},
+        index=pd.date_range("2000-01-01", periods=periods),
+    )
+    return Chart(data, "Title", "Ratio", secondary_series=["Other"], **kwargs)
+
+
+def test_small_chart_uses_svg():
+    fig = make_chart(100).generate_figure()
+    assert {trace.type for trace in fig.data} == {"scatter"}
+
+
+def test_large_chart_uses_webgl():
+    fig = make_chart(WEBGL_THRESHOLD, max_points=None).generate_figure()
+    assert {trace.type for trace in fig.data} == {"scattergl"}
+
+
+def test_webgl_on_request():
+    fig = make_chart(100, webgl=True).generate_figure()
+    assert {trace.type for trace in fig.data} == {"scattergl"}
+
+
+def test_liquidity_stacked_areas_with_webgl():
+    components = list(GlobalLiquidity.SERIES_MAPPING)
+    df = pd.DataFrame(
+        {column: [1.0, 2.0] for column in components},
+        index=pd.date_range("2024-01-01", periods=2),
+    ).assign(**{"Liquidity Index": [5.0, 10.0]})
+    model = mock.Mock(df=df, SERIES_MAPPING=GlobalLiquidity.SERIES_MAPPING)
+
+    traces = GlobalLiquidity.generate_figure(model, webgl=True).data
+    assert {trace.type for trace in traces} == {"scattergl"}
+    # Components are stacked into cumulative sums, hover shows their own values
+    assert list(traces[-2].y) == [len(components), 2.0 * len(components)]
+    assert list(traces[-2].customdata) == [1.0, 2.0]
+    assert traces[0].fill == "tozeroy"
+    assert all(trace.fill == "tonexty" for trace in traces[1:-1])
+
+
+def test_matrix_total_points_select_webgl():
+    chart = make_chart(WEBGL_THRESHOLD // 4)
+    models = [mock.Mock(spec=["get_chart"], get_chart=lambda: chart) for _ in range(6)]
+
+    matrix = ChartMatrix(models, graph=Graph(), max_points=None)
+    assert matrix.scatter_type() is go.Scattergl
+
+    matrix = ChartMatrix(models[:2], graph=Graph(), max_points=None)
+    assert matrix.scatter_type() is go.Scatter
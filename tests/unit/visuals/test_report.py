@@ -0,0 +1,94 @@
+import base64
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+
+from liquidity.visuals import Chart
+from liquidity.visuals.report import PLOTLY_JS, Report
+from liquidity.visuals.serialize import encode_array, figure_json
+
+
+def decode(spec):
+    return np.frombuffer(base64.b64decode(spec["bdata"]), dtype="<" + spec["dtype"])
+
+
+@pytest.fixture
+def chart():
+    data = pd.DataFrame(
+        {"Ratio": np.linspace(0, 1, 500), "Other": np.linspace(1, 2, 500)},
+        index=pd.date_range("2020-01-01", periods=500),
+    )
+    return Chart(data, "Ratio </script> Chart", "Ratio", secondary_series=["Other"])
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        (np.array([1.5, np.nan, -2.25]), "f8"),
+        (np.array([1.5, 2.5], dtype=np.float32), "f4"),
+        (np.array([1, 2, 3], dtype=np.int64), "i4"),
+        (np.array([1, 2**40], dtype=np.int64), "f8"),
+    ],
+)
+def test_encode_array(values, dtype):
+    spec = encode_array(values)
+
+    assert spec["dtype"] == dtype
+    np.testing.assert_array_equal(decode(spec), values)
+
+
+def test_non_numeric_arrays_are_kept():
+    values = np.array(["a", "b"], dtype=object)
+    assert encode_array(values) is values
+
+
+def test_figure_json_encodes_trace_values(chart):
+    figure = json.loads(figure_json(chart.generate_figure()))
+
+    trace = figure["data"][0]
+    np.testing.assert_array_equal(decode(trace["y"]), chart.data["Ratio"])
+    assert decode(trace["x"])[0] == pd.Timestamp("2020-01-01").timestamp() * 1000
+    assert figure["layout"]["xaxis"]["type"] == "date"
+
+
+def test_single_page_shares_plotly_js(tmp_path, chart):
+    fig = go.Figure(go.Scatter(x=[1, 2], y=[3.0, 4.0]))
+    report = Report("Nightly").add(chart).add(fig, title="Other figure")
+
+    path = report.write_html(tmp_path / "report.html")
+
+    page = path.read_text()
+    assert (tmp_path / PLOTLY_JS).exists()
+    assert page.count(f'<script src="{PLOTLY_JS}"></script>') == 1
+    assert page.count("Plotly.newPlot") == 2
+    assert "Ratio &lt;/script&gt; Chart" in page
+    assert "Ratio </script> Chart" not in page
+    # Far smaller than a standalone export embedding plotly.js
+    assert len(page) * 10 < len(chart.generate_figure().to_html(include_plotlyjs=True))
+
+
+def test_pages_with_index(tmp_path, chart):
+    report = Report().add(chart).add(chart, title="Again")
+
+    index, *pages = report.write_pages(tmp_path / "pages")
+
+    assert [page.name for page in pages] == ["figure-1.html", "figure-2.html"]
+    assert 'href="figure-2.html">Again</a>' in index.read_text()
+    assert sorted(p.name for p in (tmp_path / "pages").iterdir()) == [
+        "figure-1.html",
+        "figure-2.html",
+        "index.html",
+        PLOTLY_JS,
+    ]
+
+
+def test_lazy_rendering(tmp_path, chart):
+    eager = Report().add(chart).write_html(tmp_path / "eager.html").read_text()
+    lazy = Report(lazy=True).add(chart).write_html(tmp_path / "lazy.html").read_text()
+
+    assert "if (!false ||" in eager
+    assert "if (!true ||" in lazy
+    assert 'style="min-height: 450px;"' in lazy
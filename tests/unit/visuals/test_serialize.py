@@ -0,0 +1,70 @@
+import base64
+import json
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pytest
+from plotly.subplots import make_subplots
+
+from liquidity.visuals import Chart
+from liquidity.visuals.serialize import encode_dates, figure_json
+
+
+def decode(spec):
+    return np.frombuffer(base64.b64decode(spec["bdata"]), dtype="<" + spec["dtype"])
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.date_range("2024-01-01", periods=3, freq="h").to_numpy(),
+        np.array(list(pd.date_range("2024-01-01", periods=3, freq="h")), dtype=object),
+    ],
+)
+def test_encode_dates(values):
+    expected = [pd.Timestamp("2024-01-01 00:00").timestamp() * 1000 + h * 3_600_000 for h in range(3)]
+    np.testing.assert_array_equal(encode_dates(values), expected)
+
+
+def test_encode_dates_missing():
+    encoded = encode_dates(np.array([pd.Timestamp("2024-01-01"), pd.NaT], dtype=object))
+    assert np.isnan(encoded[1])
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([1.0, 2.0]),
+        np.array(["a", "b"], dtype=object),
+        np.array(list(pd.date_range("2024-01-01", periods=2, tz="US/Eastern")), dtype=object),
+    ],
+)
+def test_other_values_are_not_dates(values):
+    assert encode_dates(values) is None
+
+
+def test_subplot_axes_declared_as_dates():
+    fig = make_subplots(rows=1, cols=2)
+    dates = pd.date_range("2024-01-01", periods=3)
+    fig.add_trace(go.Scatter(x=dates, y=[1.0, 2.0, 3.0]), row=1, col=1)
+    fig.add_trace(go.Scatter(x=dates, y=[3.0, 2.0, 1.0]), row=1, col=2)
+
+    layout = json.loads(figure_json(fig))["layout"]
+
+    assert layout["xaxis"]["type"] == "date"
+    assert layout["xaxis2"]["type"] == "date"
+    assert "type" not in layout["yaxis"]
+
+
+def test_chart_to_json_is_smaller_than_default():
+    data = pd.DataFrame(
+        {"Ratio": np.random.default_rng(1).random(2000)},
+        index=pd.date_range("2000-01-01", periods=2000),
+    )
+    chart = Chart(data, "Title", "Ratio")
+
+    compact = json.loads(chart.to_json())
+
+    np.testing.assert_array_equal(decode(compact["data"][0]["y"]), data["Ratio"])
+    assert len(chart.to_json()) < 0.7 * len(chart.generate_figure().to_json())
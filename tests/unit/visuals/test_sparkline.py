@@ -0,0 +1,55 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from liquidity.visuals.sparkline import SparklineGrid, sparkline_svg
+
+
+def make_series(values):
+    return pd.Series(values, index=pd.date_range("2020-01-01", periods=len(values)))
+
+
+def points(svg):
+    return [tuple(map(float, p.split(","))) for p in re.search(r'points="([^"]*)"', svg)[1].split()]
+
+
+def test_sparkline_is_downsampled_to_width():
+    svg = sparkline_svg(make_series(np.sin(np.linspace(0, 20, 5000))), width=100, height=30)
+
+    xy = points(svg)
+    assert len(xy) == 100
+    assert xy[0][0] == 0 and xy[-1][0] == 99
+    assert all(1 <= y <= 28 for _, y in xy)
+
+
+def test_largest_value_is_drawn_at_the_top():
+    xy = points(sparkline_svg(make_series([1.0, 3.0, 2.0]), height=40))
+
+    assert [y for _, y in xy] == [38.0, 1.0, 19.5]
+
+
+def test_flat_and_empty_series():
+    xy = points(sparkline_svg(make_series([5.0, 5.0, np.nan, 5.0]), height=40))
+    assert {y for _, y in xy} == {19.5}
+
+    assert "polyline" not in sparkline_svg(make_series([np.nan, np.nan]))
+
+
+def test_grid(tmp_path):
+    grid = SparklineGrid(
+        [("HYG <b>", make_series([1.0, 2.0, 1.5])), ("LQD", make_series([2.0, 1.0]))],
+        title="Overview",
+        columns=4,
+    )
+
+    cells = grid.cells()
+    assert len(cells) == 2
+    assert "1.50 <span style=\"color: seagreen;\">+0.50</span>" in cells[0]
+    assert "1.00 <span style=\"color: firebrick;\">-1.00</span>" in cells[1]
+    assert "HYG &lt;b&gt;" in cells[0]
+    assert "repeat(4, " in grid._repr_html_()
+
+    page = grid.write_html(tmp_path / "overview.html").read_text()
+    assert "<title>Overview</title>" in page
+    assert page.count("<svg") == 2